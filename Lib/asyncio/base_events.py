@@ -21,6 +21,7 @@
 import heapq
 import itertools
 import math
+import operator
 import os
 import socket
 import stat
@@ -56,13 +57,8 @@
 __all__ = 'BaseEventLoop','Server',
 
 
-# Minimum number of _scheduled timer handles before cleanup of
-# cancelled handles is performed.
-_MIN_SCHEDULED_TIMER_HANDLES = 100
-
-# Minimum fraction of _scheduled timer handles that are cancelled
-# before cleanup of cancelled handles is performed.
-_MIN_CANCELLED_TIMER_HANDLES_FRACTION = 0.5
+# Key of the _scheduled heap of timer handles.
+_timer_when = operator.attrgetter('_when')
 
 
 _HAS_IPv6 = hasattr(socket, 'AF_INET6')
@@ -422,11 +418,10 @@ async def wait_closed(self):
 class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
-        self._timer_cancelled_count = 0
         self._closed = False
         self._stopping = False
         self._ready = collections.deque()
-        self._scheduled = []
+        self._scheduled = heapq.Heap(key=_timer_when)
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -748,6 +743,8 @@ def close(self):
             logger.debug("Close %r", self)
         self._closed = True
         self._ready.clear()
+        for handle in self._scheduled:
+            handle._scheduled = None
         self._scheduled.clear()
         self._executor_shutdown_called = True
         executor = self._default_executor
@@ -796,10 +793,17 @@ def call_later(self, delay, callback, *args, context=None):
         """
         if delay is None:
             raise TypeError('delay must not be None')
-        timer = self.call_at(self.time() + delay, callback, *args,
-                             context=context)
-        if timer._source_traceback:
-            del timer._source_traceback[-1]
+        if self._debug or type(self).call_at is not BaseEventLoop.call_at:
+            timer = self.call_at(self.time() + delay, callback, *args,
+                                 context=context)
+            if timer._source_traceback:
+                del timer._source_traceback[-1]
+            return timer
+        # Fast path for the common case, timeouts are scheduled very often.
+        self._check_closed()
+        timer = events.TimerHandle(self.time() + delay, callback, args, self,
+                                   context)
+        timer._scheduled = self._scheduled.push(timer)
         return timer
 
     def call_at(self, when, callback, *args, context=None):
@@ -816,8 +820,7 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
-        timer._scheduled = True
+        timer._scheduled = self._scheduled.push(timer)
         return timer
 
     def call_soon(self, callback, *args, context=None):
@@ -1305,26 +1308,54 @@ async def _sendfile_fallback(self, transp, file, offset, count):
             min(count, constants.SENDFILE_FALLBACK_READBUFFER_SIZE)
             if count else constants.SENDFILE_FALLBACK_READBUFFER_SIZE
         )
-        buf = bytearray(blocksize)
+        # Two buffers: the next block is read in the executor while the
+        # current one is written, so reading the file overlaps with the
+        # write (which encrypts the data on TLS transports) and the drain.
+        bufs = (bytearray(blocksize), bytearray(blocksize))
+        total_read = 0
         total_sent = 0
+        read_fut = None
         proto = _SendfileFallbackProtocol(transp)
         try:
+            view = memoryview(bufs[0])
+            read_fut = self.run_in_executor(None, file.readinto, view)
             while True:
-                if count:
-                    blocksize = min(count - total_sent, blocksize)
-                    if blocksize <= 0:
-                        return total_sent
-                view = memoryview(buf)[:blocksize]
-                read = await self.run_in_executor(None, file.readinto, view)
+                # Cancelling the task must not cancel the read: the executor
+                # would keep writing to the buffer while it is reused.
+                read = await tasks.shield(read_fut)
+                read_fut = None
                 if not read:
                     return total_sent  # EOF
-                transp.write(view[:read])
+                data = view[:read]
+                total_read += read
+                if count:
+                    blocksize = min(count - total_read, blocksize)
+                if blocksize > 0:
+                    view = memoryview(bufs[view.obj is bufs[0]])[:blocksize]
+                    read_fut = self.run_in_executor(None, file.readinto, view)
+                transp.write(data)
                 await proto.drain()
                 total_sent += read
+                if read_fut is None:
+                    return total_sent
         finally:
-            if total_sent > 0 and hasattr(file, 'seek'):
-                file.seek(offset + total_sent)
-            await proto.restore()
+            cancelled = False
+            try:
+                # Wait for the pending read before moving the file position,
+                # even if the task is cancelled again meanwhile.
+                while read_fut is not None and not read_fut.done():
+                    try:
+                        await tasks.shield(read_fut)
+                    except exceptions.CancelledError:
+                        cancelled = True
+                    except Exception:
+                        pass
+                if total_sent > 0 and hasattr(file, 'seek'):
+                    file.seek(offset + total_sent)
+            finally:
+                await proto.restore()
+            if cancelled:
+                raise exceptions.CancelledError
 
     async def start_tls(self, transport, protocol, sslcontext, *,
                         server_side=False,
@@ -1986,8 +2017,9 @@ def _add_callback_signalsafe(self, handle):
 
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
-        if handle._scheduled:
-            self._timer_cancelled_count += 1
+        if handle._scheduled is not None:
+            self._scheduled.remove(handle._scheduled)
+            handle._scheduled = None
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1997,35 +2029,14 @@ def _run_once(self):
         'call_later' callbacks.
         """
 
-        sched_count = len(self._scheduled)
-        if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
-            self._timer_cancelled_count / sched_count >
-                _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
-            # Remove delayed calls that were cancelled if their number
-            # is too high
-            new_scheduled = []
-            for handle in self._scheduled:
-                if handle._cancelled:
-                    handle._scheduled = False
-                else:
-                    new_scheduled.append(handle)
-
-            heapq.heapify(new_scheduled)
-            self._scheduled = new_scheduled
-            self._timer_cancelled_count = 0
-        else:
-            # Remove delayed calls that were cancelled from head of queue.
-            while self._scheduled and self._scheduled[0]._cancelled:
-                self._timer_cancelled_count -= 1
-                handle = heapq.heappop(self._scheduled)
-                handle._scheduled = False
-
+        # Cancelled timer handles are removed from self._scheduled by
+        # _timer_handle_cancelled(), so the first one is always live.
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
         elif self._scheduled:
             # Compute the desired timeout.
-            timeout = self._scheduled[0]._when - self.time()
+            timeout = self._scheduled.peek()._when - self.time()
             if timeout > MAXIMUM_SELECT_TIMEOUT:
                 timeout = MAXIMUM_SELECT_TIMEOUT
             elif timeout < 0:
@@ -2042,11 +2053,11 @@ def _run_once(self):
         # when the clock resolution is too small.
         end_time = now + max(self._clock_resolution, math.ulp(now))
         while self._scheduled:
-            handle = self._scheduled[0]
+            handle = self._scheduled.peek()
             if handle._when >= end_time:
                 break
-            handle = heapq.heappop(self._scheduled)
-            handle._scheduled = False
+            self._scheduled.pop()
+            handle._scheduled = None
             self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
@@ -10,6 +10,11 @@
 # Seconds to wait before retrying accept().
 ACCEPT_RETRY_DELAY = 1
 
+# Maximum number of reads a transport performs for a single readiness
+# event before yielding back to the event loop.  Reading again while the
+# socket still has data saves a selector round-trip per read.
+MAX_READS_PER_EVENT = 16
+
 # Number of stack entries to capture in debug mode.
 # The larger the number, the slower the operation in debug mode
 # (see extract_stack() in format_helpers.py).
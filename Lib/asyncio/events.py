@@ -145,7 +145,8 @@ def __init__(self, when, callback, args, loop, context=None):
         if self._source_traceback:
             del self._source_traceback[-1]
         self._when = when
-        self._scheduled = False
+        # Handle of the timer in the loop's heap of scheduled timers
+        self._scheduled = None
 
     def _repr_info(self):
         info = super()._repr_info()
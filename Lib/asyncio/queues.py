@@ -165,9 +165,13 @@ def put_nowait(self, item):
         if self.full():
             raise QueueFull
         self._put(item)
+        if not self._unfinished_tasks:
+            # The event is only ever set while there are no unfinished
+            # tasks, so it only needs clearing on the first one.
+            self._finished.clear()
         self._unfinished_tasks += 1
-        self._finished.clear()
-        self._wakeup_next(self._getters)
+        if self._getters:
+            self._wakeup_next(self._getters)
 
     async def get(self):
         """Remove and return an item from the queue.
@@ -214,7 +218,8 @@ def get_nowait(self):
                 raise QueueShutDown
             raise QueueEmpty
         item = self._get()
-        self._wakeup_next(self._putters)
+        if self._putters:
+            self._wakeup_next(self._putters)
         return item
 
     def task_done(self):
@@ -976,66 +976,83 @@ def _read_ready(self):
         self._read_ready_cb()
 
     def _read_ready__get_buffer(self):
-        if self._conn_lost:
-            return
+        # Keep reading while the socket fills the whole buffer: a full
+        # read means the kernel most likely has more data queued.
+        for _ in range(constants.MAX_READS_PER_EVENT):
+            if self._conn_lost:
+                return
 
-        try:
-            buf = self._protocol.get_buffer(-1)
-            if not len(buf):
-                raise RuntimeError('get_buffer() returned an empty buffer')
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as exc:
-            self._fatal_error(
-                exc, 'Fatal error: protocol.get_buffer() call failed.')
-            return
+            try:
+                buf = self._protocol.get_buffer(-1)
+                if not len(buf):
+                    raise RuntimeError('get_buffer() returned an empty buffer')
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(
+                    exc, 'Fatal error: protocol.get_buffer() call failed.')
+                return
 
-        try:
-            nbytes = self._sock.recv_into(buf)
-        except (BlockingIOError, InterruptedError):
-            return
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as exc:
-            self._fatal_error(exc, 'Fatal read error on socket transport')
-            return
+            try:
+                nbytes = self._sock.recv_into(buf)
+            except (BlockingIOError, InterruptedError):
+                return
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(exc, 'Fatal read error on socket transport')
+                return
 
-        if not nbytes:
-            self._read_ready__on_eof()
-            return
+            if not nbytes:
+                self._read_ready__on_eof()
+                return
 
-        try:
-            self._protocol.buffer_updated(nbytes)
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as exc:
-            self._fatal_error(
-                exc, 'Fatal error: protocol.buffer_updated() call failed.')
+            try:
+                self._protocol.buffer_updated(nbytes)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(
+                    exc, 'Fatal error: protocol.buffer_updated() call failed.')
+                return
+
+            if (nbytes < len(buf) or not self.is_reading() or
+                    self._read_ready_cb != self._read_ready__get_buffer):
+                # The protocol may have been replaced by one which is read
+                # with the other method.
+                return
 
     def _read_ready__data_received(self):
-        if self._conn_lost:
-            return
-        try:
-            data = self._sock.recv(self.max_size)
-        except (BlockingIOError, InterruptedError):
-            return
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as exc:
-            self._fatal_error(exc, 'Fatal read error on socket transport')
-            return
+        # See _read_ready__get_buffer() for why reads are repeated.
+        for _ in range(constants.MAX_READS_PER_EVENT):
+            if self._conn_lost:
+                return
+            try:
+                data = self._sock.recv(self.max_size)
+            except (BlockingIOError, InterruptedError):
+                return
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(exc, 'Fatal read error on socket transport')
+                return
 
-        if not data:
-            self._read_ready__on_eof()
-            return
+            if not data:
+                self._read_ready__on_eof()
+                return
 
-        try:
-            self._protocol.data_received(data)
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as exc:
-            self._fatal_error(
-                exc, 'Fatal error: protocol.data_received() call failed.')
+            try:
+                self._protocol.data_received(data)
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(
+                    exc, 'Fatal error: protocol.data_received() call failed.')
+                return
+
+            if (len(data) < self.max_size or not self.is_reading() or
+                    self._read_ready_cb != self._read_ready__data_received):
+                return
 
     def _read_ready__on_eof(self):
         if self._loop.get_debug():
@@ -1259,20 +1276,27 @@ def get_write_buffer_size(self):
         return self._buffer_size
 
     def _read_ready(self):
-        if self._conn_lost:
-            return
-        try:
-            data, addr = self._sock.recvfrom(self.max_size)
-        except (BlockingIOError, InterruptedError):
-            pass
-        except OSError as exc:
-            self._protocol.error_received(exc)
-        except (SystemExit, KeyboardInterrupt):
-            raise
-        except BaseException as exc:
-            self._fatal_error(exc, 'Fatal read error on datagram transport')
-        else:
+        # Receive queued datagrams until the socket would block, so that a
+        # burst of packets costs one selector round-trip instead of one per
+        # datagram.
+        for _ in range(constants.MAX_READS_PER_EVENT):
+            if self._conn_lost:
+                return
+            try:
+                data, addr = self._sock.recvfrom(self.max_size)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError as exc:
+                self._protocol.error_received(exc)
+                return
+            except (SystemExit, KeyboardInterrupt):
+                raise
+            except BaseException as exc:
+                self._fatal_error(exc, 'Fatal read error on datagram transport')
+                return
             self._protocol.datagram_received(data, addr)
+            if not self.is_reading():
+                return
 
     def sendto(self, data, addr=None):
         if not isinstance(data, (bytes, bytearray, memoryview)):
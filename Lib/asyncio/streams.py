@@ -5,6 +5,7 @@
 import collections
 import socket
 import sys
+import threading
 import warnings
 import weakref
 
@@ -21,6 +22,11 @@
 
 
 _DEFAULT_LIMIT = 2 ** 16  # 64 KiB
+_RECV_BUFFER_SIZE = 2 ** 16  # 64 KiB
+
+# The receive buffer of _BufferedStreamReaderProtocol, shared by all the
+# connections of the event loop running in the thread.
+_recv_buffers = threading.local()
 
 
 async def open_connection(host=None, port=None, *,
@@ -44,7 +50,7 @@ async def open_connection(host=None, port=None, *,
     """
     loop = events.get_running_loop()
     reader = StreamReader(limit=limit, loop=loop)
-    protocol = StreamReaderProtocol(reader, loop=loop)
+    protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
     transport, _ = await loop.create_connection(
         lambda: protocol, host, port, **kwds)
     writer = StreamWriter(transport, protocol, reader, loop)
@@ -77,8 +83,8 @@ async def start_server(client_connected_cb, host=None, port=None, *,
 
     def factory():
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                        loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, client_connected_cb,
+                                                 loop=loop)
         return protocol
 
     return await loop.create_server(factory, host, port, **kwds)
@@ -93,7 +99,7 @@ async def open_unix_connection(path=None, *,
         loop = events.get_running_loop()
 
         reader = StreamReader(limit=limit, loop=loop)
-        protocol = StreamReaderProtocol(reader, loop=loop)
+        protocol = _BufferedStreamReaderProtocol(reader, loop=loop)
         transport, _ = await loop.create_unix_connection(
             lambda: protocol, path, **kwds)
         writer = StreamWriter(transport, protocol, reader, loop)
@@ -106,8 +112,9 @@ async def start_unix_server(client_connected_cb, path=None, *,
 
         def factory():
             reader = StreamReader(limit=limit, loop=loop)
-            protocol = StreamReaderProtocol(reader, client_connected_cb,
-                                            loop=loop)
+            protocol = _BufferedStreamReaderProtocol(reader,
+                                                     client_connected_cb,
+                                                     loop=loop)
             return protocol
 
         return await loop.create_unix_server(factory, path, **kwds)
@@ -317,6 +324,36 @@ def __del__(self):
                 closed.exception()
 
 
+class _BufferedStreamReaderProtocol(StreamReaderProtocol,
+                                    protocols.BufferedProtocol):
+    """StreamReaderProtocol that receives into a reusable buffer.
+
+    The transport reads straight into a buffer instead of allocating a new
+    bytes object for every read; the data is then copied into the
+    StreamReader.  Only used by the stream helpers, which create the
+    StreamReader themselves, so that subclasses of StreamReaderProtocol
+    overriding data_received() keep working.
+
+    Transports call buffer_updated() right after filling the buffer
+    returned by get_buffer(), without running other callbacks in between,
+    and buffer_updated() copies the data out.  So all the connections of
+    an event loop share one buffer per thread.
+    """
+
+    def get_buffer(self, sizehint):
+        try:
+            return _recv_buffers.buffer
+        except AttributeError:
+            buffer = memoryview(bytearray(_RECV_BUFFER_SIZE))
+            _recv_buffers.buffer = buffer
+            return buffer
+
+    def buffer_updated(self, nbytes):
+        reader = self._stream_reader
+        if reader is not None:
+            reader.feed_data(_recv_buffers.buffer[:nbytes])
+
+
 class StreamWriter:
     """Wraps a Transport.
 
@@ -22,6 +22,10 @@
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# Size of the input blocks compressed concurrently when workers are used is
+# this multiplied by the compression level, like the bzip2 block size.
+_PARALLEL_BLOCK_UNIT = 100_000
+
 
 class BZ2File(_streams.BaseStream):
 
@@ -34,7 +38,7 @@ class BZ2File(_streams.BaseStream):
     returned as bytes, and data to be written should be given as bytes.
     """
 
-    def __init__(self, filename, mode="r", *, compresslevel=9):
+    def __init__(self, filename, mode="r", *, compresslevel=9, workers=1):
         """Open a bzip2-compressed file.
 
         If filename is a str, bytes, or PathLike object, it gives the
@@ -49,6 +53,11 @@ def __init__(self, filename, mode="r", *, compresslevel=9):
         and 9 specifying the level of compression: 1 produces the least
         compression, and 9 (default) produces the most compression.
 
+        If mode is 'w', 'x' or 'a', workers is the number of threads used
+        to compress the data; 0 uses one thread per CPU.  If it is greater
+        than 1, the data is compressed into a sequence of independent
+        bzip2 streams.
+
         If mode is 'r', the input file may be the concatenation of
         multiple compressed streams.
         """
@@ -58,6 +67,8 @@ def __init__(self, filename, mode="r", *, compresslevel=9):
 
         if not (1 <= compresslevel <= 9):
             raise ValueError("compresslevel must be between 1 and 9")
+        if workers < 0:
+            raise ValueError("workers must be greater or equal to 0")
 
         if mode in ("", "r", "rb"):
             mode = "rb"
@@ -65,18 +76,21 @@ def __init__(self, filename, mode="r", *, compresslevel=9):
         elif mode in ("w", "wb"):
             mode = "wb"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
         elif mode in ("x", "xb"):
             mode = "xb"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
         elif mode in ("a", "ab"):
             mode = "ab"
             mode_code = _MODE_WRITE
-            self._compressor = BZ2Compressor(compresslevel)
         else:
             raise ValueError("Invalid mode: %r" % (mode,))
 
+        if mode_code == _MODE_WRITE:
+            if workers == 1:
+                self._compressor = BZ2Compressor(compresslevel)
+            else:
+                self._compressor = _parallel_compressor(compresslevel, workers)
+
         if isinstance(filename, (str, bytes, os.PathLike)):
             self._fp = _builtin_open(filename, mode)
             self._closefp = True
@@ -277,7 +291,7 @@ def tell(self):
 
 
 def open(filename, mode="rb", compresslevel=9,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, *, workers=1):
     """Open a bzip2-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str, bytes, or
@@ -289,7 +303,8 @@ def open(filename, mode="rb", compresslevel=9,
     The default mode is "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the BZ2File
-    constructor: BZ2File(filename, mode, compresslevel). In this case,
+    constructor: BZ2File(filename, mode, compresslevel=compresslevel,
+    workers=workers). In this case,
     the encoding, errors and newline arguments must not be provided.
 
     For text mode, a BZ2File object is created, and wrapped in an
@@ -309,7 +324,8 @@ def open(filename, mode="rb", compresslevel=9,
             raise ValueError("Argument 'newline' not supported in binary mode")
 
     bz_mode = mode.replace("t", "")
-    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel)
+    binary_file = BZ2File(filename, bz_mode, compresslevel=compresslevel,
+                          workers=workers)
 
     if "t" in mode:
         encoding = io.text_encoding(encoding)
@@ -318,14 +334,32 @@ def open(filename, mode="rb", compresslevel=9,
         return binary_file
 
 
-def compress(data, compresslevel=9):
+def _parallel_compressor(compresslevel, workers):
+    # Every block is compressed into a separate stream.  decompress() and
+    # BZ2File read the concatenation of the streams back.
+    return _streams.ParallelCompressor(
+        lambda block: compress(block, compresslevel),
+        compresslevel * _PARALLEL_BLOCK_UNIT, workers)
+
+
+def compress(data, compresslevel=9, *, workers=1):
     """Compress a block of data.
 
     compresslevel, if given, must be a number between 1 and 9.
 
+    workers, if given, is the number of threads used to compress the data
+    as a sequence of independent streams; 0 uses one thread per CPU.
+
     For incremental compression, use a BZ2Compressor object instead.
     """
-    comp = BZ2Compressor(compresslevel)
+    if workers < 0:
+        raise ValueError("workers must be greater or equal to 0")
+    if workers == 1:
+        comp = BZ2Compressor(compresslevel)
+    else:
+        if not (1 <= compresslevel <= 9):
+            raise ValueError("compresslevel must be between 1 and 9")
+        comp = _parallel_compressor(compresslevel, workers)
     return comp.compress(data) + comp.flush()
 
 
@@ -8,6 +8,9 @@
 * Counter      dict subclass for counting hashable objects
 * OrderedDict  dict subclass that remembers the order entries were added
 * defaultdict  dict subclass that calls a factory function to supply missing values
+* SortedList   list-like container that keeps its values sorted
+* SortedSet    set-like container that keeps its values sorted
+* SortedDict   dict-like container that keeps its keys sorted
 * UserDict     wrapper around dictionary objects for easier dict subclassing
 * UserList     wrapper around list objects for easier list subclassing
 * UserString   wrapper around string objects for easier string subclassing
@@ -18,6 +21,9 @@
     'ChainMap',
     'Counter',
     'OrderedDict',
+    'SortedDict',
+    'SortedList',
+    'SortedSet',
     'UserDict',
     'UserList',
     'UserString',
@@ -1168,6 +1174,25 @@ def __ror__(self, other):
         return self.__class__(m)
 
 
+################################################################################
+### SortedList, SortedSet, SortedDict
+################################################################################
+
+_SORTED_CONTAINERS = frozenset({'SortedDict', 'SortedList', 'SortedSet'})
+
+def __getattr__(name):
+    # Most programs import collections without using the sorted containers:
+    # import their module on first use.
+    if name in _SORTED_CONTAINERS:
+        from collections import _sorted
+        value = globals()[name] = getattr(_sorted, name)
+        return value
+    raise AttributeError(f"module 'collections' has no attribute {name!r}")
+
+def __dir__():
+    return sorted(globals().keys() | _SORTED_CONTAINERS)
+
+
 ################################################################################
 ### UserDict
 ################################################################################
@@ -0,0 +1,647 @@
+'''Sorted containers of the collections module.
+
+SortedList, SortedSet and SortedDict are imported from here on their first
+use, so that importing collections does not pay for them.
+'''
+
+import _collections_abc
+from bisect import bisect_left as _bisect_left
+from bisect import bisect_right as _bisect_right
+from bisect import insort as _insort
+lazy from copy import copy as _copy
+from itertools import accumulate as _accumulate
+from itertools import chain as _chain
+from operator import eq as _eq
+from reprlib import recursive_repr as _recursive_repr
+from collections import (_OrderedDictItemsView, _OrderedDictKeysView,
+                         _OrderedDictValuesView)
+
+
+# The sorted containers store their values in a list of sorted sublists of
+# roughly _SORTED_LOAD items each.  A value is located by bisecting the
+# maximum keys of the sublists and then the sublist itself, and inserting or
+# deleting it only moves items inside one short sublist.  Sublists are split
+# when they grow to twice the load and merged with a neighbour when they
+# shrink to half of it.  With a key function, the keys are stored in a
+# parallel list of sublists.
+
+_SORTED_LOAD = 1000
+
+class SortedList(_collections_abc.Sequence):
+    '''List that keeps its values in ascending order, or in the order of
+    key(value) if a key function is given.
+
+    Values are added with add() and update() rather than inserted at an
+    index.  Adding, removing and locating a value take O(log n) time and
+    irange() iterates over the values between two bounds.
+
+    '''
+
+    def __init__(self, iterable=None, /, *, key=None):
+        self._key = key
+        self._len = 0
+        self._lists = []
+        self._keys = [] if key is not None else self._lists
+        self._maxes = []
+        self._offsets = None
+        if iterable is not None:
+            self.update(iterable)
+
+    @property
+    def key(self):
+        'The key function used to order the values, or None.'
+        return self._key
+
+    def __len__(self):
+        return self._len
+
+    def __iter__(self):
+        return _chain.from_iterable(self._lists)
+
+    def __reversed__(self):
+        return _chain.from_iterable(map(reversed, reversed(self._lists)))
+
+    def __contains__(self, value):
+        return self._find(value) is not None
+
+    ### Internal helpers
+
+    def _reset(self, values, keys):
+        'Rebuild the sublists from the sorted lists *values* and *keys*.'
+        load = _SORTED_LOAD
+        self._lists[:] = [values[i:i+load] for i in range(0, len(values), load)]
+        if self._key is not None:
+            self._keys[:] = [keys[i:i+load] for i in range(0, len(keys), load)]
+        self._maxes[:] = [sublist[-1] for sublist in self._keys]
+        self._len = len(values)
+        self._offsets = None
+
+    def _split(self, i):
+        'Split sublist *i* in two if it has grown too long.'
+        lists = self._lists
+        if len(lists[i]) > 2 * _SORTED_LOAD:
+            keys = self._keys
+            maxes = self._maxes
+            half = lists[i][_SORTED_LOAD:]
+            del lists[i][_SORTED_LOAD:]
+            lists.insert(i + 1, half)
+            if keys is not lists:
+                half = keys[i][_SORTED_LOAD:]
+                del keys[i][_SORTED_LOAD:]
+                keys.insert(i + 1, half)
+            maxes[i] = keys[i][-1]
+            maxes.insert(i + 1, keys[i + 1][-1])
+
+    def _loc(self, index):
+        'Return the sublist and position in it of the value at *index*.'
+        offsets = self._offsets
+        if offsets is None:
+            offsets = self._offsets = list(_accumulate(map(len, self._lists)))
+        i = _bisect_right(offsets, index)
+        return i, (index - offsets[i - 1] if i else index)
+
+    def _index(self, i, j):
+        'Return the index of the value at position *j* of sublist *i*.'
+        if not i:
+            return j
+        offsets = self._offsets
+        if offsets is None:
+            offsets = self._offsets = list(_accumulate(map(len, self._lists)))
+        return offsets[i - 1] + j
+
+    def _find(self, value):
+        'Return the location of *value* as (i, j), or None if not found.'
+        key = self._key
+        k = value if key is None else key(value)
+        maxes = self._maxes
+        i = _bisect_left(maxes, k)
+        if i == len(maxes):
+            return None
+        lists = self._lists
+        keys = self._keys
+        j = _bisect_left(keys[i], k)
+        if keys is lists:
+            return (i, j) if lists[i][j] == value else None
+        # Values with equal keys may span several sublists
+        while True:
+            sublist = keys[i]
+            for j in range(j, len(sublist)):
+                if sublist[j] != k:
+                    return None
+                if lists[i][j] == value:
+                    return i, j
+            i += 1
+            j = 0
+            if i == len(keys):
+                return None
+
+    def _delete(self, i, j):
+        'Delete the value at position *j* of sublist *i*.'
+        lists = self._lists
+        keys = self._keys
+        maxes = self._maxes
+        sublist = lists[i]
+        del sublist[j]
+        if keys is not lists:
+            del keys[i][j]
+        self._len -= 1
+        self._offsets = None
+        if len(sublist) > _SORTED_LOAD // 2:
+            maxes[i] = keys[i][-1]
+        elif len(lists) > 1:
+            # Merge the sublist into its neighbour
+            prev = i - 1 if i else 1
+            lo, hi = min(i, prev), max(i, prev)
+            lists[lo].extend(lists[hi])
+            del lists[hi]
+            if keys is not lists:
+                keys[lo].extend(keys[hi])
+                del keys[hi]
+            maxes[lo] = keys[lo][-1]
+            del maxes[hi]
+            self._split(lo)
+        elif sublist:
+            maxes[i] = keys[i][-1]
+        else:
+            del lists[i]
+            if keys is not lists:
+                del keys[i]
+            del maxes[i]
+
+    def _islice(self, start, stop, reverse=False):
+        'Return an iterator over the values from index *start* to *stop*.'
+        if start >= stop:
+            return iter(())
+        lists = self._lists
+        i, j = self._loc(start)
+        ii, jj = self._loc(stop - 1)
+        if i == ii:
+            parts = [lists[i][j:jj+1]]
+        else:
+            parts = [lists[i][j:], *lists[i+1:ii], lists[ii][:jj+1]]
+        if reverse:
+            return _chain.from_iterable(map(reversed, reversed(parts)))
+        return _chain.from_iterable(parts)
+
+    ### Public API
+
+    def add(self, value):
+        'Add *value*, keeping the list sorted.'
+        key = self._key
+        k = value if key is None else key(value)
+        lists = self._lists
+        keys = self._keys
+        maxes = self._maxes
+        if not maxes:
+            lists.append([value])
+            if keys is not lists:
+                keys.append([k])
+            maxes.append(k)
+        else:
+            i = _bisect_right(maxes, k)
+            if i == len(maxes):
+                i -= 1
+                lists[i].append(value)
+                if keys is not lists:
+                    keys[i].append(k)
+                maxes[i] = k
+            elif keys is lists:
+                _insort(lists[i], value)
+            else:
+                j = _bisect_right(keys[i], k)
+                keys[i].insert(j, k)
+                lists[i].insert(j, value)
+            self._split(i)
+        self._len += 1
+        self._offsets = None
+
+    def update(self, iterable):
+        'Add all values from *iterable*.'
+        key = self._key
+        values = sorted(iterable, key=key)
+        if len(values) * 4 >= self._len:
+            # Cheaper to sort everything again; sorted() merges the runs
+            values = sorted(_chain(self, values), key=key)
+            keys = values if key is None else list(map(key, values))
+            self._reset(values, keys)
+        else:
+            for value in values:
+                self.add(value)
+
+    def remove(self, value):
+        'Remove *value*.  Raise ValueError if it is not present.'
+        loc = self._find(value)
+        if loc is None:
+            raise ValueError(f'{value!r} not in {self.__class__.__name__}')
+        self._delete(*loc)
+
+    def discard(self, value):
+        'Remove *value* if it is present.'
+        loc = self._find(value)
+        if loc is not None:
+            self._delete(*loc)
+
+    def pop(self, index=-1):
+        'Remove and return the value at *index* (default last).'
+        if not self._len:
+            raise IndexError(f'pop from empty {self.__class__.__name__}')
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f'{self.__class__.__name__} index out of range')
+        i, j = self._loc(index)
+        value = self._lists[i][j]
+        self._delete(i, j)
+        return value
+
+    def clear(self):
+        'Remove all values.'
+        self._reset([], [])
+
+    def copy(self):
+        'Return a shallow copy.'
+        return self.__class__(self, key=self._key)
+
+    __copy__ = copy
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(self._len)
+            if step == 1:
+                return list(self._islice(start, stop))
+            return [self[i] for i in range(start, stop, step)]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f'{self.__class__.__name__} index out of range')
+        i, j = self._loc(index)
+        return self._lists[i][j]
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            indices = range(*index.indices(self._len))
+            if len(indices) == self._len:
+                self.clear()
+            else:
+                for index in sorted(indices, reverse=True):
+                    self._delete(*self._loc(index))
+            return
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError(f'{self.__class__.__name__} index out of range')
+        self._delete(*self._loc(index))
+
+    def bisect_left(self, value):
+        'Return the index where *value* would be inserted before equal values.'
+        key = self._key
+        k = value if key is None else key(value)
+        maxes = self._maxes
+        i = _bisect_left(maxes, k)
+        if i == len(maxes):
+            return self._len
+        return self._index(i, _bisect_left(self._keys[i], k))
+
+    def bisect_right(self, value):
+        'Return the index where *value* would be inserted after equal values.'
+        key = self._key
+        k = value if key is None else key(value)
+        maxes = self._maxes
+        i = _bisect_right(maxes, k)
+        if i == len(maxes):
+            return self._len
+        return self._index(i, _bisect_right(self._keys[i], k))
+
+    bisect = bisect_right
+
+    def index(self, value, start=0, stop=None):
+        '''Return the first index of *value*.
+
+        Raise ValueError if the value is not present.
+        '''
+        length = self._len
+        start, stop, _ = slice(start, stop).indices(length)
+        index = max(self.bisect_left(value), start)
+        if self._key is None:
+            if index < stop and self[index] == value:
+                return index
+        else:
+            k = self._key(value)
+            key = self._key
+            for item in self._islice(index, stop):
+                if key(item) != k:
+                    break
+                if item == value:
+                    return index
+                index += 1
+        raise ValueError(f'{value!r} is not in {self.__class__.__name__}')
+
+    def count(self, value):
+        'Return the number of occurrences of *value*.'
+        if self._key is None:
+            return self.bisect_right(value) - self.bisect_left(value)
+        return sum(1 for item in self._islice(self.bisect_left(value),
+                                              self.bisect_right(value))
+                   if item == value)
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        '''Return an iterator over the values between *minimum* and *maximum*.
+
+        A bound of None means the range is not bounded on that side.  The
+        *inclusive* pair tells whether values equal to the minimum and to
+        the maximum are included.  With a key function, the values are
+        compared to key(minimum) and key(maximum).
+        '''
+        if minimum is None:
+            start = 0
+        elif inclusive[0]:
+            start = self.bisect_left(minimum)
+        else:
+            start = self.bisect_right(minimum)
+        if maximum is None:
+            stop = self._len
+        elif inclusive[1]:
+            stop = self.bisect_right(maximum)
+        else:
+            stop = self.bisect_left(maximum)
+        return self._islice(start, stop, reverse)
+
+    def __eq__(self, other):
+        if not isinstance(other, SortedList):
+            return NotImplemented
+        return self._len == other._len and all(map(_eq, self, other))
+
+    __hash__ = None
+
+    @_recursive_repr()
+    def __repr__(self):
+        if self._key is None:
+            return f'{self.__class__.__name__}({list(self)!r})'
+        return f'{self.__class__.__name__}({list(self)!r}, key={self._key!r})'
+
+
+class SortedSet(_collections_abc.MutableSet, _collections_abc.Sequence):
+    '''Set that keeps its values in ascending order, or in the order of
+    key(value) if a key function is given.
+
+    Membership tests take O(1) time; adding and removing values take
+    O(log n) time.  Values can be accessed by index and irange() iterates
+    over the values between two bounds.
+
+    '''
+
+    def __init__(self, iterable=None, /, *, key=None):
+        self._set = set()
+        self._list = SortedList(key=key)
+        if iterable is not None:
+            self.update(iterable)
+
+    @property
+    def key(self):
+        'The key function used to order the values, or None.'
+        return self._list._key
+
+    def _from_iterable(self, iterable):
+        return self.__class__(iterable, key=self._list._key)
+
+    def __len__(self):
+        return len(self._set)
+
+    def __contains__(self, value):
+        return value in self._set
+
+    def __iter__(self):
+        return iter(self._list)
+
+    def __reversed__(self):
+        return reversed(self._list)
+
+    def __getitem__(self, index):
+        return self._list[index]
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            values = self._list[index]
+            del self._list[index]
+            self._set.difference_update(values)
+        else:
+            self._set.remove(self._list.pop(index))
+
+    def add(self, value):
+        'Add *value* if it is not already present.'
+        if value not in self._set:
+            self._set.add(value)
+            self._list.add(value)
+
+    def update(self, iterable):
+        'Add all values from *iterable*.'
+        values = set(iterable)
+        values.difference_update(self._set)
+        self._set.update(values)
+        self._list.update(values)
+
+    def discard(self, value):
+        'Remove *value* if it is present.'
+        if value in self._set:
+            self._set.remove(value)
+            self._list.remove(value)
+
+    def pop(self, index=-1):
+        'Remove and return the value at *index* (default last).'
+        value = self._list.pop(index)
+        self._set.remove(value)
+        return value
+
+    def clear(self):
+        'Remove all values.'
+        self._set.clear()
+        self._list.clear()
+
+    def copy(self):
+        'Return a shallow copy.'
+        return self._from_iterable(self)
+
+    __copy__ = copy
+
+    def index(self, value, start=0, stop=None):
+        '''Return the index of *value*.
+
+        Raise ValueError if the value is not present.
+        '''
+        if value not in self._set:
+            raise ValueError(f'{value!r} is not in {self.__class__.__name__}')
+        return self._list.index(value, start, stop)
+
+    def count(self, value):
+        'Return 1 if *value* is present, else 0.'
+        return int(value in self._set)
+
+    def bisect_left(self, value):
+        'Return the index where *value* would be inserted before equal values.'
+        return self._list.bisect_left(value)
+
+    def bisect_right(self, value):
+        'Return the index where *value* would be inserted after equal values.'
+        return self._list.bisect_right(value)
+
+    bisect = bisect_right
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        'Return an iterator over the values between *minimum* and *maximum*.'
+        return self._list.irange(minimum, maximum, inclusive, reverse)
+
+    @_recursive_repr()
+    def __repr__(self):
+        if self.key is None:
+            return f'{self.__class__.__name__}({list(self)!r})'
+        return f'{self.__class__.__name__}({list(self)!r}, key={self.key!r})'
+
+
+class SortedDict(_collections_abc.MutableMapping):
+    '''Dictionary that iterates over its keys in ascending order, or in the
+    order of key(k) if a key function is given.
+
+    Lookups take O(1) time; adding and removing keys take O(log n) time.
+    peekitem() and popitem() access items by index and irange() iterates
+    over the keys between two bounds.
+
+    '''
+
+    def __init__(self, other=(), /, *, key=None):
+        self._data = {}
+        self._keys = SortedList(key=key)
+        self.update(other)
+
+    @property
+    def key(self):
+        'The key function used to order the keys, or None.'
+        return self._keys._key
+
+    def __len__(self):
+        return len(self._data)
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        data = self._data
+        if key not in data:
+            self._keys.add(key)
+        data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+        self._keys.remove(key)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._keys)
+
+    def __reversed__(self):
+        return reversed(self._keys)
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def keys(self):
+        "D.keys() -> a set-like object providing a sorted view on D's keys"
+        return _OrderedDictKeysView(self)
+
+    def items(self):
+        "D.items() -> a set-like object providing a sorted view on D's items"
+        return _OrderedDictItemsView(self)
+
+    def values(self):
+        "D.values() -> an object providing a sorted view on D's values"
+        return _OrderedDictValuesView(self)
+
+    def update(self, other=(), /, **kwds):
+        'Update the dictionary from a mapping or iterable of pairs and *kwds*.'
+        data = self._data
+        added = {}
+        if isinstance(other, _collections_abc.Mapping):
+            other = other.items()
+        elif hasattr(other, 'keys'):
+            other = [(k, other[k]) for k in other.keys()]
+        for key, value in _chain(other, kwds.items()):
+            if key in data:
+                data[key] = value
+            else:
+                added[key] = value
+        if added:
+            # Fails before the dict is changed if a key can not be ordered
+            self._keys.update(added)
+            data.update(added)
+
+    def pop(self, key, *default):
+        '''Remove *key* and return its value, or *default* if it is missing.
+
+        Raise KeyError if the key is missing and no default is given.
+        '''
+        if key in self._data:
+            self._keys.remove(key)
+            return self._data.pop(key)
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def popitem(self, index=-1):
+        '''Remove and return the (key, value) pair at *index* (default last).
+
+        Raise KeyError if the dictionary is empty.
+        '''
+        if not self._data:
+            raise KeyError('dictionary is empty')
+        key = self._keys.pop(index)
+        return key, self._data.pop(key)
+
+    def peekitem(self, index=-1):
+        'Return the (key, value) pair at *index* (default last).'
+        key = self._keys[index]
+        return key, self._data[key]
+
+    def clear(self):
+        'Remove all items.'
+        self._data.clear()
+        self._keys.clear()
+
+    def copy(self):
+        'Return a shallow copy.'
+        return self.__class__(self._data, key=self._keys._key)
+
+    __copy__ = copy
+
+    def index(self, key, start=0, stop=None):
+        '''Return the index of *key*.
+
+        Raise ValueError if the key is not present.
+        '''
+        if key not in self._data:
+            raise ValueError(f'{key!r} is not in {self.__class__.__name__}')
+        return self._keys.index(key, start, stop)
+
+    def bisect_left(self, key):
+        'Return the index where *key* would be inserted before equal keys.'
+        return self._keys.bisect_left(key)
+
+    def bisect_right(self, key):
+        'Return the index where *key* would be inserted after equal keys.'
+        return self._keys.bisect_right(key)
+
+    bisect = bisect_right
+
+    def irange(self, minimum=None, maximum=None, inclusive=(True, True),
+               reverse=False):
+        'Return an iterator over the keys between *minimum* and *maximum*.'
+        return self._keys.irange(minimum, maximum, inclusive, reverse)
+
+    @_recursive_repr()
+    def __repr__(self):
+        items = ', '.join(f'{k!r}: {self._data[k]!r}' for k in self._keys)
+        if self.key is None:
+            return f'{self.__class__.__name__}({{{items}}})'
+        return f'{self.__class__.__name__}({{{items}}}, key={self.key!r})'
@@ -16,11 +16,13 @@
 import py_compile
 import struct
 import filecmp
+import time
 
 from functools import partial
 from pathlib import Path
 
-__all__ = ["compile_dir","compile_file","compile_path"]
+__all__ = ["compile_dir","compile_file","compile_path","write_code_pack",
+           "write_path_index"]
 
 def _walk_dir(dir, maxlevels, quiet=0):
     if quiet < 2 and isinstance(dir, os.PathLike):
@@ -320,6 +322,170 @@ def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=0,
     return success
 
 
+def write_path_index(filename, dirs, maxlevels=None):
+    """Write an index of the listings of directories for the import system.
+
+    Arguments (only filename and dirs are required):
+
+    filename:  the file to write the index to
+    dirs:      the directories to index
+    maxlevels: maximum recursion level (default `sys.getrecursionlimit()`)
+
+    The import system uses the index instead of listing a directory when
+    the PYTHONIMPORTINDEX environment variable is set to filename, unless
+    the directory has been modified since the index was written.
+    Directories modified within the last _RACY_INDEX_MARGIN seconds are
+    not indexed.
+    """
+    from importlib._bootstrap_external import _dump_path_index
+
+    if maxlevels is None:
+        maxlevels = sys.getrecursionlimit()
+    index = {}
+    for dir in dirs:
+        _index_dir(index, os.path.abspath(dir), maxlevels)
+    # A directory modified again within the granularity of its mtime, after
+    # it was listed, keeps the recorded mtime: its listing would be trusted
+    # although it is stale.  Like git with racily clean index entries, leave
+    # out the directories modified shortly before the index is written.  The
+    # margin also covers file systems with a coarse mtime resolution and
+    # small clock differences with a file server.
+    cutoff = time.time() - _RACY_INDEX_MARGIN
+    index = {dir: entry for dir, entry in index.items() if entry[0] < cutoff}
+    # Replace the index atomically: other processes may be reading it.
+    tmp = f'{os.fspath(filename)}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(_dump_path_index(index))
+        os.replace(tmp, filename)
+    except:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+# In seconds, see write_path_index().
+_RACY_INDEX_MARGIN = 2.0
+
+def _index_dir(index, dir, maxlevels):
+    try:
+        mtime = os.stat(dir).st_mtime
+        names = os.listdir(dir)
+        if os.stat(dir).st_mtime != mtime:
+            # Modified while being listed.
+            return
+    except OSError:
+        return
+    index[dir] = (mtime, tuple(names))
+    if maxlevels > 0:
+        for name in names:
+            fullname = os.path.join(dir, name)
+            # Only packages are searched for modules.
+            if (name != '__pycache__' and '.' not in name and
+                    os.path.isdir(fullname) and not os.path.islink(fullname)):
+                _index_dir(index, fullname, maxlevels - 1)
+
+
+def write_code_pack(filename, dirs, optimize=-1, quiet=0, *, modules=None):
+    """Compile the modules found in directories into a code pack.
+
+    Arguments (only filename and dirs are required):
+
+    filename: the file to write the code pack to
+    dirs:     the directories to search modules in, like sys.path entries
+    optimize: int, optimization level or -1 for level of the interpreter
+    quiet:    full output with False or 0, errors only with 1,
+              no output with 2
+    modules:  if given, only the top-level modules and packages with a
+              module in modules are packed, such as sys.modules once an
+              application has been imported; standard library modules are
+              left out and the modules are ignored by the import system
+              once their source file changes
+
+    If the same module is found in several directories, the first one is
+    used.  Return False if a module could not be compiled.
+    """
+    from importlib._bootstrap_external import _dump_code_pack
+
+    if modules is not None:
+        # Packages are packed whole: their submodules are searched in the
+        # code pack first.
+        modules = {name.partition('.')[0] for name in modules}
+        modules -= sys.stdlib_module_names
+    success = True
+    packed = {}
+    for dir in dirs:
+        for fullname, relpath, is_package, path in _find_pack_modules(dir):
+            if fullname in packed:
+                continue
+            if (modules is not None and
+                    fullname.partition('.')[0] not in modules):
+                continue
+            if not quiet:
+                print('Compiling {!r}...'.format(path))
+            try:
+                if modules is not None:
+                    # Stat before reading: a file modified while it is
+                    # read is stale.
+                    st = os.stat(path)
+                    stamp = (os.path.abspath(path), st.st_mtime_ns,
+                             st.st_size)
+                else:
+                    stamp = None
+                with open(path, 'rb') as f:
+                    source = f.read()
+                code = compile(source, path, 'exec', dont_inherit=True,
+                               optimize=optimize)
+            except (SyntaxError, UnicodeError, ValueError, OSError) as e:
+                success = False
+                if quiet >= 2:
+                    continue
+                elif quiet:
+                    print('*** Error compiling {!r}...'.format(path))
+                else:
+                    print('*** ', end='')
+                print(e.__class__.__name__ + ':', e)
+                continue
+            packed[fullname] = (fullname, relpath, is_package, code, stamp)
+    data = _dump_code_pack(packed.values())
+    # Replace the code pack atomically: other processes may be reading it.
+    tmp = f'{os.fspath(filename)}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, filename)
+    except:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return success
+
+def _find_pack_modules(dir, prefix='', relprefix=''):
+    try:
+        names = sorted(os.listdir(dir))
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(dir, name)
+        base, ext = os.path.splitext(name)
+        if ext == '.py':
+            if (base != '__init__' and base.isidentifier() and
+                    os.path.isfile(path)):
+                yield prefix + base, relprefix + name, False, path
+        elif name.isidentifier():
+            # Like the import system, prefer a package over a module of
+            # the same name ('spam' is sorted before 'spam.py').
+            init = os.path.join(path, '__init__.py')
+            if os.path.isfile(init):
+                yield (prefix + name, f'{relprefix}{name}/__init__.py', True,
+                       init)
+                yield from _find_pack_modules(path, f'{prefix}{name}.',
+                                              f'{relprefix}{name}/')
+
+
 def main():
     """Script main program."""
     import argparse
@@ -391,6 +557,14 @@ def main():
     parser.add_argument('--hardlink-dupes', action='store_true',
                         dest='hardlink_dupes',
                         help='Hardlink duplicated pyc files')
+    parser.add_argument('--path-index', metavar='FILE', dest='path_index',
+                        help=('after compiling, write an index of the '
+                              'directories to `FILE`, to be used with the '
+                              '`PYTHONIMPORTINDEX` environment variable'))
+    parser.add_argument('--code-pack', metavar='FILE', dest='code_pack',
+                        help=('also compile the modules found in the '
+                              'directories to the code pack `FILE`, with '
+                              'the first optimization level'))
 
     args = parser.parse_args()
     compile_dests = args.compile_dest
@@ -431,6 +605,9 @@ def main():
                 print("Error reading file list {}".format(args.flist))
             return False
 
+    if args.code_pack and not compile_dests:
+        parser.error("--code-pack requires directories to compile")
+
     if args.invalidation_mode:
         ivl_mode = args.invalidation_mode.replace('-', '_').upper()
         invalidation_mode = py_compile.PycInvalidationMode[ivl_mode]
@@ -462,11 +639,38 @@ def main():
                                        limit_sl_dest=args.limit_sl_dest,
                                        hardlink_dupes=args.hardlink_dupes):
                         success = False
-            return success
         else:
-            return compile_path(legacy=args.legacy, force=args.force,
-                                quiet=args.quiet,
-                                invalidation_mode=invalidation_mode)
+            success = compile_path(legacy=args.legacy, force=args.force,
+                                   quiet=args.quiet,
+                                   invalidation_mode=invalidation_mode)
+        if args.path_index:
+            if compile_dests:
+                dirs = [dest for dest in compile_dests
+                        if not os.path.isfile(dest)]
+            else:
+                dirs = [dir for dir in sys.path if dir and dir != os.curdir]
+                maxlevels = 0
+            try:
+                write_path_index(args.path_index, dirs, maxlevels)
+            except OSError as e:
+                if args.quiet < 2:
+                    print("Can't write path index {!r}: {}".format(
+                        args.path_index, e))
+                success = False
+        if args.code_pack:
+            dirs = [dest for dest in compile_dests
+                    if not os.path.isfile(dest)]
+            try:
+                if not write_code_pack(args.code_pack, dirs,
+                                       optimize=args.opt_levels[0],
+                                       quiet=args.quiet):
+                    success = False
+            except OSError as e:
+                if args.quiet < 2:
+                    print("Can't write code pack {!r}: {}".format(
+                        args.code_pack, e))
+                success = False
+        return success
     except KeyboardInterrupt:
         if args.quiet < 2:
             print("\n[interrupted]")
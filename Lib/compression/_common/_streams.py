@@ -1,7 +1,10 @@
 """Internal classes used by compression modules"""
 
+import collections
 import io
+import os
 import sys
+lazy from concurrent.futures import ThreadPoolExecutor
 
 BUFFER_SIZE = io.DEFAULT_BUFFER_SIZE  # Compressed data read chunk size
 
@@ -160,3 +163,68 @@ def seek(self, offset, whence=io.SEEK_SET):
     def tell(self):
         """Return the current file position."""
         return self._pos
+
+
+class ParallelCompressor:
+    """Compress data in independent blocks on a pool of threads.
+
+    compress_block(block, *args) is called in a worker thread for every
+    block_size bytes of input and must return the compressed block.  The
+    compressed blocks are returned in order by compress() and flush(), so
+    that an instance can replace a compressor object.
+    """
+
+    def __init__(self, compress_block, block_size, workers):
+        if workers == 0:
+            workers = os.process_cpu_count() or 1
+        self._compress_block = compress_block
+        self._block_size = block_size
+        # Bound the amount of data waiting to be compressed or written.
+        self._max_pending = 2 * workers
+        self._executor = ThreadPoolExecutor(workers)
+        self._pending = collections.deque()
+        self._buffer = bytearray()
+        self._started = False
+
+    def _submit(self, block, *args):
+        self._started = True
+        self._pending.append(
+            self._executor.submit(self._compress_block, block, *args))
+
+    def _take_buffer(self):
+        block = bytes(self._buffer)
+        self._buffer.clear()
+        return block
+
+    def _collect(self, wait=False):
+        output = []
+        pending = self._pending
+        while pending and (wait or pending[0].done()
+                           or len(pending) > self._max_pending):
+            output.append(pending.popleft().result())
+        return b"".join(output)
+
+    def compress(self, data):
+        buffer = self._buffer
+        buffer += data
+        block_size = self._block_size
+        if len(buffer) >= block_size:
+            end = len(buffer) - len(buffer) % block_size
+            for start in range(0, end, block_size):
+                self._submit(bytes(buffer[start:start + block_size]))
+            del buffer[:end]
+        return self._collect()
+
+    def flush(self):
+        """Compress the remaining data and return all the pending output.
+
+        No more data can be compressed afterwards.
+        """
+        if self._buffer or not self._started:
+            self._submit(self._take_buffer())
+        output = self._collect(wait=True)
+        self.close()
+        return output
+
+    def close(self):
+        self._executor.shutdown(cancel_futures=True)
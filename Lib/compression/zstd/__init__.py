@@ -4,8 +4,10 @@
     # compression.zstd
     'COMPRESSION_LEVEL_DEFAULT',
     'compress',
+    'compress_many',
     'CompressionParameter',
     'decompress',
+    'decompress_many',
     'DecompressionParameter',
     'finalize_dict',
     'get_frame_info',
@@ -161,6 +163,48 @@ def decompress(data, zstd_dict=None, options=None):
 
     For incremental decompression, use a ZstdDecompressor instead.
     """
+    return _decompress(data, options, zstd_dict)
+
+
+def compress_many(data_list, level=None, options=None, zstd_dict=None):
+    """Return a list with each item of *data_list* compressed as a frame.
+
+    This is equivalent to calling compress() on every item, but a single
+    compression context is created and reused for the whole sequence, which
+    matters for many small messages, particularly with a *zstd_dict*.
+    The *level*, *options* and *zstd_dict* arguments are the same as for
+    compress().
+    """
+    comp = ZstdCompressor(level=level, options=options, zstd_dict=zstd_dict)
+    flush_frame = ZstdCompressor.FLUSH_FRAME
+    return [comp.compress(data, mode=flush_frame) for data in data_list]
+
+
+def decompress_many(data_list, zstd_dict=None, options=None):
+    """Return a list with each item of *data_list* decompressed.
+
+    This is equivalent to calling decompress() on every item, but a single
+    decompressor is used for all the frames.  The *zstd_dict* and *options*
+    arguments are the same as for decompress().
+    """
+    decomp = ZstdDecompressor(options=options, zstd_dict=zstd_dict)
+    results = []
+    for data in data_list:
+        chunks = []
+        while True:
+            chunks.append(decomp.decompress(data))
+            if not decomp.eof:
+                raise ZstdError('Compressed data ended before the '
+                                'end-of-stream marker was reached')
+            data = decomp.unused_data
+            decomp._reset_session()
+            if not data:
+                break
+        results.append(b''.join(chunks))
+    return results
+
+
+def _decompress(data, options, zstd_dict):
     results = []
     while True:
         decomp = ZstdDecompressor(options=options, zstd_dict=zstd_dict)
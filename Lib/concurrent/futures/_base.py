@@ -656,10 +656,10 @@ def _map(self, fn, *iterables, timeout=None, buffersize=None):
         zipped_iterables = zip(*iterables)
         if buffersize:
             fs = collections.deque(
-                self.submit(fn, *args) for args in islice(zipped_iterables, buffersize)
+                self._submit_many(fn, islice(zipped_iterables, buffersize))
             )
         else:
-            fs = [self.submit(fn, *args) for args in zipped_iterables]
+            fs = self._submit_many(fn, zipped_iterables)
 
         # Use a weak reference to ensure that the executor can be garbage
         # collected independently of the result_iterator closure.
@@ -688,6 +688,14 @@ def result_iterator():
                     future.cancel()
         return result_iterator()
 
+    def _submit_many(self, fn, iterable):
+        """Submits fn(*args) for each args in iterable.
+
+        Returns a list of futures in the order of iterable.  Executors can
+        override this to submit all calls at once.
+        """
+        return [self.submit(fn, *args) for args in iterable]
+
     def shutdown(self, wait=True, *, cancel_futures=False):
         """Clean-up the resources associated with the Executor.
 
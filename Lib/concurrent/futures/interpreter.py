@@ -6,19 +6,32 @@
 import traceback
 
 
-def do_call(results, func, args, kwargs):
+# The queue used to send exceptions back from a worker interpreter.
+# It is only set in the worker interpreters, once, by set_results(),
+# so that it doesn't have to be shared again for every call.
+_results = None
+
+
+def set_results(results):
+    # This must not be a "stateless" function (e.g. using "global"),
+    # otherwise it would be called with fresh globals instead of
+    # this module's namespace in the worker interpreter.
+    sys.modules[__name__]._results = results
+
+
+def do_call(func, /, *args, **kwargs):
     try:
         return func(*args, **kwargs)
     except BaseException as exc:
         # Send the captured exception out on the results queue,
         # but still leave it unhandled for the interpreter to handle.
         try:
-            results.put(exc)
+            _results.put(exc)
         except interpreters.NotShareableError:
             # The exception is not shareable.
             print('exception is not shareable:', file=sys.stderr)
             traceback.print_exception(exc)
-            results.put(None)
+            _results.put(None)
         raise  # re-raise
 
 
@@ -62,6 +75,7 @@ def initialize(self):
         try:
             maxsize = 0
             self.results = interpreters.create_queue(maxsize)
+            self.interp.call(set_results, self.results)
 
             if self.initdata:
                 self.run(self.initdata)
@@ -80,8 +94,11 @@ def finalize(self):
             interp.close()
 
     def run(self, task):
+        fn, args, kwargs = task
         try:
-            return self.interp.call(do_call, self.results, *task)
+            # Pass the arguments unpacked: shareable arguments then avoid
+            # pickle and no kwargs dict is sent when there are none.
+            return self.interp.call(do_call, fn, *args, **kwargs)
         except interpreters.ExecutionFailed as wrapper:
             # Wait for the exception data to show up.
             exc = self.results.get()
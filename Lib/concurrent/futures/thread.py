@@ -196,16 +196,21 @@ def __init__(self, max_workers=None, thread_name_prefix='',
         self._thread_name_prefix = (thread_name_prefix or
                                     ("ThreadPoolExecutor-%d" % self._counter()))
 
+    def _check_can_submit(self):
+        # Must be called with self._shutdown_lock and _global_shutdown_lock
+        # held.
+        if self._broken:
+            raise self.BROKEN(self._broken)
+
+        if self._shutdown:
+            raise RuntimeError('cannot schedule new futures after shutdown')
+        if _shutdown:
+            raise RuntimeError('cannot schedule new futures after '
+                               'interpreter shutdown')
+
     def submit(self, fn, /, *args, **kwargs):
         with self._shutdown_lock, _global_shutdown_lock:
-            if self._broken:
-                raise self.BROKEN(self._broken)
-
-            if self._shutdown:
-                raise RuntimeError('cannot schedule new futures after shutdown')
-            if _shutdown:
-                raise RuntimeError('cannot schedule new futures after '
-                                   'interpreter shutdown')
+            self._check_can_submit()
 
             f = _base.Future()
             task = self._resolve_work_item_task(fn, args, kwargs)
@@ -216,6 +221,33 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
+    def _submit_many(self, fn, iterable):
+        if type(self).submit is not ThreadPoolExecutor.submit:
+            # A subclass customizes submit(), so every call must go through it.
+            return super()._submit_many(fn, iterable)
+
+        # Consume the iterable before taking the locks, since it may run
+        # arbitrary code (including calls to submit()).
+        args_list = list(iterable)
+        if not args_list:
+            return []
+
+        # Take the locks once for the whole batch instead of once per call,
+        # which matters when many threads submit to the same executor.
+        with self._shutdown_lock, _global_shutdown_lock:
+            self._check_can_submit()
+
+            work_items = [_WorkItem(_base.Future(),
+                                    self._resolve_work_item_task(fn, args, {}))
+                          for args in args_list]
+            for w in work_items:
+                self._work_queue.put(w)
+            # Each call wakes up an idle worker or starts a new one, so more
+            # than max_workers calls cannot help.
+            for _ in range(min(len(work_items), self._max_workers)):
+                self._adjust_thread_count()
+            return [w.future for w in work_items]
+
     def _adjust_thread_count(self):
         # if idle threads are available, don't spin new threads
         if self._idle_semaphore.acquire(timeout=0):
@@ -29,9 +29,15 @@
 READ_BUFFER_SIZE = 128 * 1024
 _WRITE_BUFFER_SIZE = 4 * io.DEFAULT_BUFFER_SIZE
 
+# Size of the blocks compressed concurrently when workers are used.
+_PARALLEL_BLOCK_SIZE = 128 * 1024
+# Size of the deflate window.  Each block is primed with that much of the
+# data preceding it, so that parallel compression costs little ratio.
+_DEFLATE_WINDOW_SIZE = 32 * 1024
+
 
 def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
-         encoding=None, errors=None, newline=None, *, mtime=None):
+         encoding=None, errors=None, newline=None, *, mtime=None, workers=1):
     """Open a gzip-compressed file in binary or text mode.
 
     The filename argument can be an actual filename (a str or bytes object),
@@ -42,7 +48,8 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
     mode is "rb", and the default compresslevel is 9.
 
     For binary mode, this function is equivalent to the GzipFile
-    constructor: GzipFile(filename, mode, compresslevel).  In this case,
+    constructor: GzipFile(filename, mode, compresslevel, mtime=mtime,
+    workers=workers).  In this case,
     the encoding, errors and newline arguments must not be provided.
 
     For text mode, a GzipFile object is created, and wrapped in an
@@ -63,10 +70,11 @@ def open(filename, mode="rb", compresslevel=_COMPRESS_LEVEL_TRADEOFF,
 
     gz_mode = mode.replace("t", "")
     if isinstance(filename, (str, bytes, os.PathLike)):
-        binary_file = GzipFile(filename, gz_mode, compresslevel, mtime=mtime)
+        binary_file = GzipFile(filename, gz_mode, compresslevel, mtime=mtime,
+                               workers=workers)
     elif hasattr(filename, "read") or hasattr(filename, "write"):
         binary_file = GzipFile(None, gz_mode, compresslevel, filename,
-                               mtime=mtime)
+                               mtime=mtime, workers=workers)
     else:
         raise TypeError("filename must be a str or bytes object, or a file")
 
@@ -145,6 +153,49 @@ def writable(self):
         return True
 
 
+class _ParallelCompressor(_streams.ParallelCompressor):
+    """Raw deflate compressor which compresses blocks on several threads.
+
+    Every block but the last one ends with a sync flush, so that the
+    compressed blocks concatenate into a single deflate stream, like pigz
+    does.
+    """
+
+    def __init__(self, compresslevel, workers):
+        super().__init__(self._compress_block, _PARALLEL_BLOCK_SIZE, workers)
+        self._compresslevel = compresslevel
+        self._zdict = b''
+
+    def _compress_block(self, block, zdict, mode=zlib.Z_SYNC_FLUSH):
+        args = (self._compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS,
+                zlib.DEF_MEM_LEVEL, 0)
+        if zdict:
+            compress = zlib.compressobj(*args, zdict)
+        else:
+            compress = zlib.compressobj(*args)
+        return compress.compress(block) + compress.flush(mode)
+
+    def _submit(self, block, mode=zlib.Z_SYNC_FLUSH):
+        zdict = self._zdict
+        if mode == zlib.Z_FULL_FLUSH:
+            # The following data must not refer to the preceding data.
+            self._zdict = b''
+        elif len(block) >= _DEFLATE_WINDOW_SIZE:
+            self._zdict = block[-_DEFLATE_WINDOW_SIZE:]
+        else:
+            self._zdict = (zdict + block)[-_DEFLATE_WINDOW_SIZE:]
+        super()._submit(block, zdict, mode)
+
+    def flush(self, mode=zlib.Z_FINISH):
+        if mode == zlib.Z_NO_FLUSH:
+            return b''
+        self._submit(self._take_buffer(), mode)
+        output = self._collect(wait=True)
+        if mode == zlib.Z_FINISH:
+            self.close()
+        return output
+
+
 class GzipFile(_streams.BaseStream):
     """The GzipFile class simulates most of the methods of a file object with
     the exception of the truncate() method.
@@ -159,7 +210,8 @@ class GzipFile(_streams.BaseStream):
     myfileobj = None
 
     def __init__(self, filename=None, mode=None,
-                 compresslevel=_COMPRESS_LEVEL_TRADEOFF, fileobj=None, mtime=None):
+                 compresslevel=_COMPRESS_LEVEL_TRADEOFF, fileobj=None, mtime=None,
+                 *, workers=1):
         """Constructor for the GzipFile class.
 
         At least one of fileobj and filename must be given a
@@ -195,6 +247,12 @@ def __init__(self, filename=None, mode=None,
         the current time is used.  If the resulting mtime is outside the
         range 0 to 2**32-1, then the value 0 is used instead.
 
+        The workers argument is the number of threads used to compress
+        the data when writing.  If it is greater than 1, the data is split
+        into blocks which are compressed concurrently; the output differs
+        from the output of a single thread but is a regular gzip file.
+        0 uses one thread per CPU.
+
         """
 
         # Ensure attributes exist at __del__
@@ -206,6 +264,8 @@ def __init__(self, filename=None, mode=None,
             raise ValueError("Invalid mode: {!r}".format(mode))
         if mode and 'b' not in mode:
             mode += 'b'
+        if workers < 0:
+            raise ValueError("workers must be greater or equal to 0")
 
         try:
             if fileobj is None:
@@ -237,11 +297,14 @@ def __init__(self, filename=None, mode=None,
                         FutureWarning, 2)
                 self.mode = WRITE
                 self._init_write(filename)
-                self.compress = zlib.compressobj(compresslevel,
-                                                 zlib.DEFLATED,
-                                                 -zlib.MAX_WBITS,
-                                                 zlib.DEF_MEM_LEVEL,
-                                                 0)
+                if workers == 1:
+                    self.compress = zlib.compressobj(compresslevel,
+                                                     zlib.DEFLATED,
+                                                     -zlib.MAX_WBITS,
+                                                     zlib.DEF_MEM_LEVEL,
+                                                     0)
+                else:
+                    self.compress = _ParallelCompressor(compresslevel, workers)
                 self._write_mtime = mtime
                 self._buffer_size = _WRITE_BUFFER_SIZE
                 self._buffer = io.BufferedWriter(_WriteBufferStream(self),
@@ -658,13 +721,21 @@ def _rewind(self):
         self._new_member = True
 
 
-def compress(data, compresslevel=_COMPRESS_LEVEL_TRADEOFF, *, mtime=0):
+def compress(data, compresslevel=_COMPRESS_LEVEL_TRADEOFF, *, mtime=0,
+             workers=1):
     """Compress data in one shot and return the compressed string.
 
     compresslevel sets the compression level in range of 0-9.
     mtime can be used to set the modification time.
     The modification time is set to 0 by default, for reproducibility.
+    workers is the number of threads used to compress the data.
     """
+    if workers != 1:
+        buf = io.BytesIO()
+        with GzipFile(fileobj=buf, mode='wb', compresslevel=compresslevel,
+                      mtime=mtime, workers=workers) as f:
+            f.write(data)
+        return buf.getvalue()
     # Wbits=31 automatically includes a gzip header and trailer.
     gzip_data = zlib.compress(data, level=compresslevel, wbits=31)
     if mtime is None:
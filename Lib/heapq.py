@@ -128,7 +128,7 @@
 
 __all__ = ['heappush', 'heappop', 'heapify', 'heapreplace', 'heappushpop',
            'heappush_max', 'heappop_max', 'heapify_max', 'heapreplace_max',
-           'heappushpop_max', 'nlargest', 'nsmallest', 'merge']
+           'heappushpop_max', 'nlargest', 'nsmallest', 'merge', 'Heap']
 
 def heappush(heap, item):
     """Push item onto heap, maintaining the heap invariant."""
@@ -592,6 +592,168 @@ def nlargest(n, iterable, key=None):
     result.sort(reverse=True)
     return [elem for (k, order, elem) in result]
 
+class _HeapEntry:
+    """Handle to an item of a Heap, as returned by Heap.push()."""
+
+    __slots__ = ('_item', '_key', '_index')
+
+    def __init__(self, item, key):
+        self._item = item
+        self._key = key
+        self._index = -1
+
+    @property
+    def item(self):
+        """The item referred to by the handle."""
+        return self._item
+
+class Heap:
+    """Priority queue with removal and update of arbitrary items.
+
+    Items are popped smallest first, or ordered by key(item) if a key
+    function is given.  push() returns a handle which can be passed to
+    remove() and update() to drop the item or change its priority in
+    O(log n) time.  Items with equal priorities are popped in arbitrary
+    order.
+    """
+
+    def __init__(self, iterable=(), /, *, key=None):
+        self._keyfunc = key
+        self._entries = entries = [self._new_entry(item) for item in iterable]
+        for i, entry in enumerate(entries):
+            entry._index = i
+        for i in reversed(range(len(entries)//2)):
+            self._siftup(i)
+
+    @property
+    def key(self):
+        """The key function of the heap, or None."""
+        return self._keyfunc
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter([entry._item for entry in self._entries])
+
+    def push(self, item):
+        """Push item onto the heap and return a handle to it."""
+        entry = self._new_entry(item)
+        entries = self._entries
+        entry._index = len(entries)
+        entries.append(entry)
+        self._siftdown(0, entry._index)
+        return entry
+
+    def peek(self):
+        """Return the smallest item without removing it."""
+        if not self._entries:
+            raise IndexError('peek at an empty heap')
+        return self._entries[0]._item
+
+    def pop(self):
+        """Remove and return the smallest item."""
+        entries = self._entries
+        if not entries:
+            raise IndexError('pop from an empty heap')
+        lastentry = entries.pop()
+        if entries:
+            returnentry = entries[0]
+            entries[0] = lastentry
+            lastentry._index = 0
+            self._siftup(0)
+        else:
+            returnentry = lastentry
+        returnentry._index = -1
+        return returnentry._item
+
+    def remove(self, handle):
+        """Remove the item referred to by handle and return it."""
+        pos = self._find(handle)
+        entries = self._entries
+        lastentry = entries.pop()
+        if lastentry is not handle:
+            entries[pos] = lastentry
+            lastentry._index = pos
+            self._repair(pos)
+        handle._index = -1
+        return handle._item
+
+    def update(self, handle, item):
+        """Replace the item referred to by handle, moving it as needed."""
+        key = item if self._keyfunc is None else self._keyfunc(item)
+        pos = self._find(handle)
+        handle._item = item
+        handle._key = key
+        self._repair(pos)
+
+    def clear(self):
+        """Remove all items from the heap."""
+        for entry in self._entries:
+            entry._index = -1
+        self._entries.clear()
+
+    def _new_entry(self, item):
+        key = item if self._keyfunc is None else self._keyfunc(item)
+        return _HeapEntry(item, key)
+
+    def _find(self, handle):
+        if not isinstance(handle, _HeapEntry):
+            raise TypeError(f'expected a heap handle, not '
+                            f'{type(handle).__name__}')
+        pos = handle._index
+        entries = self._entries
+        if not 0 <= pos < len(entries) or entries[pos] is not handle:
+            raise ValueError('handle is not in the heap')
+        return pos
+
+    def _repair(self, pos):
+        # Restore the invariant after the key at pos has changed.
+        entries = self._entries
+        if pos and entries[pos]._key < entries[(pos - 1) >> 1]._key:
+            self._siftdown(0, pos)
+        else:
+            self._siftup(pos)
+
+    # Same algorithms as _siftdown() and _siftup() above, but entries are
+    # swapped rather than moved through a hole, so that every entry stays
+    # in the heap and knows its position if a comparison raises.
+
+    def _siftdown(self, startpos, pos):
+        entries = self._entries
+        newentry = entries[pos]
+        newkey = newentry._key
+        while pos > startpos:
+            parentpos = (pos - 1) >> 1
+            parent = entries[parentpos]
+            if not newkey < parent._key:
+                break
+            entries[pos] = parent
+            parent._index = pos
+            entries[parentpos] = newentry
+            newentry._index = parentpos
+            pos = parentpos
+
+    def _siftup(self, pos):
+        entries = self._entries
+        endpos = len(entries)
+        startpos = pos
+        newentry = entries[pos]
+        childpos = 2*pos + 1
+        while childpos < endpos:
+            rightpos = childpos + 1
+            if (rightpos < endpos and
+                not entries[childpos]._key < entries[rightpos]._key):
+                childpos = rightpos
+            child = entries[childpos]
+            entries[pos] = child
+            child._index = pos
+            entries[childpos] = newentry
+            newentry._index = childpos
+            pos = childpos
+            childpos = 2*pos + 1
+        self._siftdown(startpos, pos)
+
 # If available, use C implementation
 try:
     from _heapq import *
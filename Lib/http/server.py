@@ -62,8 +62,8 @@
 # at the time the request was made!)
 
 __all__ = [
-    "HTTPServer", "ThreadingHTTPServer",
-    "HTTPSServer", "ThreadingHTTPSServer",
+    "HTTPServer", "ThreadingHTTPServer", "ThreadPoolHTTPServer",
+    "HTTPSServer", "ThreadingHTTPSServer", "ThreadPoolHTTPSServer",
     "BaseHTTPRequestHandler", "SimpleHTTPRequestHandler",
 ]
 
@@ -129,6 +129,10 @@ class ThreadingHTTPServer(socketserver.ThreadingMixIn, HTTPServer):
     daemon_threads = True
 
 
+class ThreadPoolHTTPServer(socketserver.ThreadPoolMixIn, HTTPServer):
+    daemon_threads = True
+
+
 class HTTPSServer(HTTPServer):
     def __init__(self, server_address, RequestHandlerClass,
                  bind_and_activate=True, *, certfile, keyfile=None,
@@ -170,6 +174,10 @@ class ThreadingHTTPSServer(socketserver.ThreadingMixIn, HTTPSServer):
     daemon_threads = True
 
 
+class ThreadPoolHTTPSServer(socketserver.ThreadPoolMixIn, HTTPSServer):
+    daemon_threads = True
+
+
 class BaseHTTPRequestHandler(socketserver.StreamRequestHandler):
 
     """HTTP request handler base class.
@@ -1195,6 +1195,9 @@ def invalidate_caches():
         # Also invalidate the caches of NamespacePaths
         # https://bugs.python.org/issue45703
         NamespacePath._epoch += 1
+        # The path index is read again when next needed.
+        global _path_index
+        _path_index = None
 
         from importlib.metadata import MetadataPathFinder
         MetadataPathFinder.invalidate_caches()
@@ -1318,6 +1321,55 @@ def find_distributions(*args, **kwargs):
         return MetadataPathFinder.find_distributions(*args, **kwargs)
 
 
+# Index of directory listings shared between processes, see compileall.
+_PATH_INDEX_MAGIC = b'PYIDX\x00\x01\n'
+_path_index = None
+
+
+def _load_path_index(data):
+    """Return the index serialized in data, or an empty dict if invalid.
+
+    The index maps directories to a (st_mtime, names) tuple.
+    """
+    if data[:len(_PATH_INDEX_MAGIC)] != _PATH_INDEX_MAGIC:
+        return {}
+    try:
+        index = marshal.loads(memoryview(data)[len(_PATH_INDEX_MAGIC):])
+    except (EOFError, ValueError, TypeError):
+        return {}
+    if type(index) is not dict:
+        return {}
+    for path, entry in index.items():
+        if (type(path) is not str or type(entry) is not tuple
+                or len(entry) != 2 or type(entry[1]) is not tuple):
+            return {}
+    return index
+
+
+def _dump_path_index(index):
+    """Serialize an index of directory listings."""
+    return _PATH_INDEX_MAGIC + marshal.dumps(index)
+
+
+def _get_path_index():
+    """Return the index named by the PYTHONIMPORTINDEX environment variable."""
+    global _path_index
+    if _path_index is None:
+        _path_index = {}
+        key = 'PYTHONIMPORTINDEX' if _MS_WINDOWS else b'PYTHONIMPORTINDEX'
+        if sys.flags.ignore_environment:
+            filename = None
+        else:
+            filename = _os.environ.get(key)
+        if filename:
+            try:
+                with _io.FileIO(filename, 'r') as file:
+                    _path_index = _load_path_index(file.read())
+            except OSError:
+                pass
+    return _path_index
+
+
 class FileFinder:
 
     """File-based finder.
@@ -1365,7 +1417,7 @@ def find_spec(self, fullname, target=None):
         except OSError:
             mtime = -1
         if mtime != self._path_mtime:
-            self._fill_cache()
+            self._fill_cache(mtime)
             self._path_mtime = mtime
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
@@ -1404,15 +1456,23 @@ def find_spec(self, fullname, target=None):
             return spec
         return None
 
-    def _fill_cache(self):
-        """Fill the cache of potential modules and packages for this directory."""
+    def _fill_cache(self, mtime=-1):
+        """Fill the cache of potential modules and packages for this directory.
+
+        The listing is taken from the path index if it is up to date with
+        the mtime of the directory.
+        """
         path = self.path
-        try:
-            contents = _os.listdir(path or _os.getcwd())
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            # Directory has either been removed, turned into a file, or made
-            # unreadable.
-            contents = []
+        entry = _get_path_index().get(path)
+        if entry is not None and mtime != -1 and entry[0] == mtime:
+            contents = entry[1]
+        else:
+            try:
+                contents = _os.listdir(path or _os.getcwd())
+            except (FileNotFoundError, PermissionError, NotADirectoryError):
+                # Directory has either been removed, turned into a file, or
+                # made unreadable.
+                contents = []
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -1488,6 +1548,267 @@ def __repr__(self):
         return f'FileFinder({self.path!r})'
 
 
+# Archive of marshalled code objects, see compileall.write_code_pack().
+#
+# The header is made of the magic number below, MAGIC_NUMBER and the size of
+# the index.  The index is a marshalled dict mapping module names to
+# (offset, size, is_package, relpath, source) tuples; offsets are relative to
+# the end of the index.  relpath is the '/'-separated path of the source file
+# relative to the archive.  source is None or the (path, mtime_ns, size)
+# stamp of the source file the module was compiled from.
+_CODE_PACK_SUFFIX = '.pycpack'
+_CODE_PACK_MAGIC = b'PYCPACK\x00'
+_code_pack_cache = {}
+
+
+def _dump_code_pack(modules):
+    """Serialize an iterable of (fullname, relpath, is_package, code, source).
+    """
+    index = {}
+    blobs = []
+    offset = 0
+    for fullname, relpath, is_package, code, source in modules:
+        data = marshal.dumps(code)
+        index[fullname] = (offset, len(data), is_package, relpath, source)
+        blobs.append(data)
+        offset += len(data)
+    index_data = marshal.dumps(index)
+    return b''.join([_CODE_PACK_MAGIC, MAGIC_NUMBER,
+                     _pack_uint32(len(index_data)), index_data, *blobs])
+
+
+class _CodePack:
+
+    """An open code pack.
+
+    The file is kept open and the code of each module is read with a single
+    pread() at a known offset, without stat() or open() calls.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+        if hasattr(_os, 'pread'):
+            with _io.open_code(path) as file:
+                try:
+                    self._fd = _os.dup(file.fileno())
+                except (AttributeError, OSError, ValueError):
+                    pass
+        header = self._read(0, 16)
+        if header[:8] != _CODE_PACK_MAGIC or header[8:12] != MAGIC_NUMBER:
+            raise ImportError(f'bad magic number in code pack {path!r}',
+                              path=path)
+        index_size = _unpack_uint32(header[12:])
+        try:
+            self.index = marshal.loads(self._read(16, index_size))
+        except (EOFError, ValueError, TypeError):
+            self.index = None
+        if type(self.index) is not dict:
+            raise ImportError(f'bad index in code pack {path!r}', path=path)
+        self._data_offset = 16 + index_size
+
+    def __del__(self, _close=_os.close):
+        if self._fd is not None:
+            _close(self._fd)
+
+    def _read(self, offset, size):
+        if self._fd is not None:
+            data = _os.pread(self._fd, size, offset)
+        else:
+            with _io.open_code(self.path) as file:
+                file.seek(offset)
+                data = file.read(size)
+        if len(data) != size:
+            raise ImportError(f'truncated code pack {self.path!r}',
+                              path=self.path)
+        return data
+
+    def get_data(self, fullname):
+        """Return the marshalled code of the module."""
+        offset, size = self.index[fullname][:2]
+        return self._read(self._data_offset + offset, size)
+
+
+def _get_code_pack(path):
+    """Return the open code pack at path.
+
+    Dropping a pack from the cache closes it once no import is reading it.
+    """
+    try:
+        return _code_pack_cache[path]
+    except KeyError:
+        pack = _code_pack_cache[path] = _CodePack(path)
+        _bootstrap._verbose_message('code pack {!r}: {} modules', path,
+                                    len(pack.index))
+        return pack
+
+
+def _code_pack_source_changed(source):
+    """Return True if the stamped source file was modified.
+
+    A missing source file is not a change: it may not be deployed with the
+    code pack.
+    """
+    path, mtime_ns, size = source
+    try:
+        st = _path_stat(path)
+    except OSError:
+        return False
+    return st.st_mtime_ns != mtime_ns or st.st_size != size
+
+
+class CodePackFinder:
+
+    """Finder for modules in a code pack.
+
+    The path is either the path of the code pack or a path inside it, as
+    found in the __path__ of its packages.
+
+    """
+
+    def __init__(self, path):
+        """Raise ImportError if path is not in a code pack."""
+        if _CODE_PACK_SUFFIX not in path:
+            raise ImportError('not a code pack', path=path)
+        archive = path
+        prefix = []
+        while not archive.endswith(_CODE_PACK_SUFFIX):
+            archive, tail = _path_split(archive)
+            if not archive:
+                raise ImportError('not a code pack', path=path)
+            prefix.append(tail)
+        archive = _path_abspath(archive)
+        if not _path_isfile(archive):
+            raise ImportError('not a code pack', path=path)
+        try:
+            _get_code_pack(archive)
+        except OSError as exc:
+            raise ImportError(f'cannot open code pack {archive!r}',
+                              path=path) from exc
+        self.path = path
+        self.archive = archive
+        self.prefix = '.'.join(reversed(prefix))
+
+    def invalidate_caches(self):
+        """Reopen the code pack, in case it has been replaced."""
+        _code_pack_cache.pop(self.archive, None)
+
+    def find_spec(self, fullname, target=None):
+        """Try to find a spec for the specified module.
+
+        Returns the matching spec, or None if not found.
+        """
+        if fullname.rpartition('.')[0] != self.prefix:
+            return None
+        try:
+            index = _get_code_pack(self.archive).index
+        except (ImportError, OSError):
+            return None
+        try:
+            offset, size, is_package, relpath, source = index[fullname]
+        except KeyError:
+            return None
+        if source is not None and _code_pack_source_changed(source):
+            _bootstrap._verbose_message('code pack {!r}: {} changed since {} '
+                                        'was packed', self.archive, source[0],
+                                        fullname)
+            return None
+        filename = _path_join(self.archive, *relpath.split('/'))
+        loader = CodePackLoader(fullname, filename, self.archive)
+        if is_package:
+            smsl = [_path_split(filename)[0]]
+            if source is not None:
+                # Changed and new submodules are found in the sources.
+                smsl.append(_path_split(source[0])[0])
+        else:
+            smsl = None
+        return spec_from_file_location(fullname, filename, loader=loader,
+                                       submodule_search_locations=smsl)
+
+    def __repr__(self):
+        return f'CodePackFinder({self.path!r})'
+
+
+class _CodePackImporter:
+
+    """Meta path finder for the code pack named by PYTHONCODEPACK.
+
+    Like frozen modules, the top-level modules of the code pack are found
+    before those of sys.path.  Their submodules are found through the
+    __path__ of their package, which is inside the code pack.
+
+    """
+
+    def __init__(self, finder):
+        self.finder = finder
+
+    def find_spec(self, fullname, path=None, target=None):
+        if path is not None:
+            return None
+        return self.finder.find_spec(fullname, target)
+
+    def invalidate_caches(self):
+        self.finder.invalidate_caches()
+
+    def __repr__(self):
+        return f'_CodePackImporter({self.finder.path!r})'
+
+
+def _get_startup_code_pack():
+    """Return a meta path finder for PYTHONCODEPACK, or None."""
+    key = 'PYTHONCODEPACK' if _MS_WINDOWS else b'PYTHONCODEPACK'
+    if sys.flags.ignore_environment:
+        return None
+    path = _os.environ.get(key)
+    if not path:
+        return None
+    if not _MS_WINDOWS:
+        path = path.decode(sys.getfilesystemencoding(),
+                           sys.getfilesystemencodeerrors())
+    try:
+        return _CodePackImporter(CodePackFinder(path))
+    except ImportError:
+        _bootstrap._verbose_message('cannot use code pack {!r}', path)
+        return None
+
+
+class CodePackLoader(_LoaderBasics):
+
+    """Loader for modules in a code pack."""
+
+    def __init__(self, fullname, path, archive):
+        self.name = fullname
+        self.path = path
+        self.archive = archive
+
+    def __eq__(self, other):
+        return (self.__class__ == other.__class__ and
+                self.__dict__ == other.__dict__)
+
+    def __hash__(self):
+        return hash(self.name) ^ hash(self.path)
+
+    @_check_name
+    def get_filename(self, fullname):
+        """Return the path of the source file, inside the code pack."""
+        return self.path
+
+    def get_code(self, fullname):
+        pack = _get_code_pack(self.archive)
+        try:
+            data = pack.get_data(fullname)
+        except KeyError:
+            raise ImportError(f'{fullname!r} is not in code pack '
+                              f'{self.archive!r}', name=fullname) from None
+        return _compile_bytecode(data, name=fullname,
+                                 bytecode_path=self.archive,
+                                 source_path=self.path)
+
+    def get_source(self, fullname):
+        """Return None as there is no source code."""
+        return None
+
+
 class AppleFrameworkLoader(ExtensionFileLoader):
     """A loader for modules that have been packaged as frameworks for
     compatibility with Apple's iOS App Store policies.
@@ -1587,5 +1908,9 @@ def _install(_bootstrap_module):
     """Install the path-based import components."""
     _set_bootstrap_module(_bootstrap_module)
     supported_loaders = _get_supported_file_loaders()
-    sys.path_hooks.extend([FileFinder.path_hook(*supported_loaders)])
+    sys.path_hooks.extend([CodePackFinder,
+                           FileFinder.path_hook(*supported_loaders)])
+    startup_code_pack = _get_startup_code_pack()
+    if startup_code_pack is not None:
+        sys.meta_path.append(startup_code_pack)
     sys.meta_path.append(PathFinder)
@@ -21,6 +21,8 @@
 from ._bootstrap_external import AppleFrameworkLoader
 from ._bootstrap_external import NamespaceLoader
 from ._bootstrap_external import NamespacePath
+from ._bootstrap_external import CodePackFinder
+from ._bootstrap_external import CodePackLoader
 
 
 def all_suffixes():
@@ -29,11 +31,12 @@ def all_suffixes():
 
 
 __all__ = ['AppleFrameworkLoader', 'BYTECODE_SUFFIXES', 'BuiltinImporter',
-           'DEBUG_BYTECODE_SUFFIXES', 'EXTENSION_SUFFIXES',
-           'ExtensionFileLoader', 'FileFinder', 'FrozenImporter', 'ModuleSpec',
-           'NamespaceLoader', 'OPTIMIZED_BYTECODE_SUFFIXES', 'PathFinder',
-           'SOURCE_SUFFIXES', 'SourceFileLoader', 'SourcelessFileLoader',
-           'WindowsRegistryFinder', 'all_suffixes']
+           'CodePackFinder', 'CodePackLoader', 'DEBUG_BYTECODE_SUFFIXES',
+           'EXTENSION_SUFFIXES', 'ExtensionFileLoader', 'FileFinder',
+           'FrozenImporter', 'ModuleSpec', 'NamespaceLoader',
+           'OPTIMIZED_BYTECODE_SUFFIXES', 'PathFinder', 'SOURCE_SUFFIXES',
+           'SourceFileLoader', 'SourcelessFileLoader', 'WindowsRegistryFinder',
+           'all_suffixes']
 
 
 def __getattr__(name):
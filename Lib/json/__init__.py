@@ -96,16 +96,22 @@
     Expecting property name enclosed in double quotes: line 1 column 3 (char 2)
 """
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
+    'dump', 'dumps', 'load', 'loads', 'iterload', 'dump_lines', 'load_lines',
     'JSONDecoder', 'JSONDecodeError', 'JSONEncoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
 from .decoder import JSONDecoder, JSONDecodeError
+from .decoder import WHITESPACE_STR, _StreamDecoder, _stream_error
 from .encoder import JSONEncoder
 import codecs
 
+# Approximate number of characters dump() passes to each fp.write() call.
+_DUMP_BUFFER_SIZE = 8192
+# Size of the fp.read() calls of iterload().
+_ITERLOAD_READ_SIZE = 65536
+
 _default_encoder = JSONEncoder(
     skipkeys=False,
     ensure_ascii=True,
@@ -175,10 +181,23 @@ def dump(obj, fp, *, skipkeys=False, ensure_ascii=True, check_circular=True,
             check_circular=check_circular, allow_nan=allow_nan, indent=indent,
             separators=separators,
             default=default, sort_keys=sort_keys, **kw).iterencode(obj)
-    # could accelerate with writelines in some versions of Python, at
-    # a debuggability cost
-    for chunk in iterable:
-        fp.write(chunk)
+    # The encoder produces many tiny chunks: join them so that fp.write()
+    # is called about once per _DUMP_BUFFER_SIZE characters.  Whatever was
+    # encoded is still written if the encoder fails halfway.
+    chunks = []
+    size = 0
+    try:
+        for chunk in iterable:
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= _DUMP_BUFFER_SIZE:
+                data = ''.join(chunks)
+                chunks.clear()
+                size = 0
+                fp.write(data)
+    finally:
+        if chunks:
+            fp.write(''.join(chunks))
 
 
 def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
@@ -241,9 +260,79 @@ def dumps(obj, *, skipkeys=False, ensure_ascii=True, check_circular=True,
         **kw).encode(obj)
 
 
+def dump_lines(iterable, fp, *, skipkeys=False, ensure_ascii=True,
+        check_circular=True, allow_nan=True, cls=None, separators=None,
+        default=None, sort_keys=False, **kw):
+    """Serialize each object of ``iterable`` as a line of JSON to ``fp``
+    (a ``.write()``-supporting file-like object), in the newline-delimited
+    JSON format (also known as JSON Lines).
+
+    The objects are serialized one at a time, so ``iterable`` can be a
+    generator producing more objects than would fit in memory.
+
+    The arguments have the same meaning as in ``dump()``.  There is no
+    ``indent`` argument, since each object must be on a single line.
+
+    """
+    # cached encoder
+    if (not skipkeys and ensure_ascii and
+        check_circular and allow_nan and
+        cls is None and separators is None and
+        default is None and not sort_keys and not kw):
+        encode = _default_encoder.encode
+    else:
+        if cls is None:
+            cls = JSONEncoder
+        encode = cls(skipkeys=skipkeys, ensure_ascii=ensure_ascii,
+            check_circular=check_circular, allow_nan=allow_nan, indent=None,
+            separators=separators,
+            default=default, sort_keys=sort_keys, **kw).encode
+    # Like dump(), write about _DUMP_BUFFER_SIZE characters at a time.
+    lines = []
+    size = 0
+    try:
+        for obj in iterable:
+            line = encode(obj)
+            lines.append(line)
+            lines.append('\n')
+            size += len(line) + 1
+            if size >= _DUMP_BUFFER_SIZE:
+                data = ''.join(lines)
+                lines.clear()
+                size = 0
+                fp.write(data)
+    finally:
+        if lines:
+            fp.write(''.join(lines))
+
+
 _default_decoder = JSONDecoder()
 
 
+def _make_decoder(cls, object_hook, parse_float, parse_int, parse_constant,
+                  object_pairs_hook, array_hook, kw):
+    if (cls is None and object_hook is None and
+            parse_int is None and parse_float is None and
+            parse_constant is None and object_pairs_hook is None
+            and array_hook is None and not kw):
+        return _default_decoder
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if array_hook is not None:
+        kw['array_hook'] = array_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    return cls(**kw)
+
+
 def detect_encoding(b):
     bstartswith = b.startswith
     if bstartswith((codecs.BOM_UTF32_BE, codecs.BOM_UTF32_LE)):
@@ -386,6 +475,88 @@ def loads(s, *, cls=None, object_hook=None, parse_float=None,
     return cls(**kw).decode(s)
 
 
+def iterload(fp, *, path=None, cls=None, object_hook=None, parse_float=None,
+             parse_int=None, parse_constant=None, object_pairs_hook=None,
+             array_hook=None, **kw):
+    """Deserialize ``fp`` (a ``.read()``-supporting text or binary file-like
+    object) incrementally and return an iterator of Python objects.
+
+    If ``path`` is None, ``fp`` contains a sequence of JSON documents,
+    which may be separated by whitespace such as newlines, and each
+    document is yielded.  Otherwise ``fp`` contains a single JSON document
+    and ``path`` is a sequence of object keys (``str``) and array indices
+    (``int``) locating an array or an object in it: each item of the
+    array, or each ``(key, value)`` pair of the object, is yielded.
+    Nothing is yielded if there is no array or object at ``path``.
+
+    ``fp`` is read in blocks, and only the text of the object being
+    decoded is kept in memory, so a sequence of documents or the items of
+    a large array can be decoded in bounded memory.  Values which are not
+    on ``path`` are still decoded entirely.  Binary files are decoded like
+    ``bytes`` passed to ``loads()``.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    decoder = _make_decoder(cls, object_hook, parse_float, parse_int,
+                            parse_constant, object_pairs_hook, array_hook, kw)
+    stream = _StreamDecoder(decoder, path)
+    data = fp.read(_ITERLOAD_READ_SIZE)
+    if isinstance(data, str):
+        if data.startswith('\ufeff'):
+            raise JSONDecodeError("Unexpected UTF-8 BOM (decode using utf-8-sig)",
+                                  data, 0)
+        decode = None
+    else:
+        if not isinstance(data, (bytes, bytearray)):
+            raise TypeError(f'the JSON object must be str, bytes or bytearray, '
+                            f'not {data.__class__.__name__}')
+        # detect_encoding() needs the first 4 bytes.
+        while 0 < len(data) < 4:
+            more = fp.read(_ITERLOAD_READ_SIZE)
+            if not more:
+                break
+            data += more
+        decode = codecs.getincrementaldecoder(
+            detect_encoding(data))('surrogatepass').decode
+    while data:
+        yield from stream.feed(decode(data) if decode else data)
+        # Read at least as much as the incomplete value being decoded.
+        data = fp.read(max(_ITERLOAD_READ_SIZE, stream.wanted))
+    if decode:
+        yield from stream.feed(decode(b'', True))
+    yield from stream.close()
+
+
+def load_lines(fp, *, cls=None, object_hook=None, parse_float=None,
+               parse_int=None, parse_constant=None, object_pairs_hook=None,
+               array_hook=None, **kw):
+    """Deserialize ``fp`` (an iterable of lines, such as a text or binary
+    file object, in the newline-delimited JSON format, also known as JSON
+    Lines) and return an iterator of the Python objects of its lines.
+
+    Each line must contain a single JSON document.  Blank lines are
+    ignored.  The lines are read and decoded one at a time.  Binary lines
+    are decoded from UTF-8.
+
+    The other arguments have the same meaning as in ``load()``.
+    """
+    decode = _make_decoder(cls, object_hook, parse_float, parse_int,
+                           parse_constant, object_pairs_hook, array_hook,
+                           kw).decode
+    offset = 0
+    for lineno, line in enumerate(fp, 1):
+        if not isinstance(line, str):
+            line = line.decode('utf-8', 'surrogatepass')
+        if line.strip(WHITESPACE_STR):
+            try:
+                obj = decode(line)
+            except JSONDecodeError as err:
+                raise _stream_error(err.msg, line, err.pos,
+                                    offset, lineno, offset) from None
+            yield obj
+        offset += len(line)
+
+
 def __getattr__(name):
     if name == "__version__":
         from warnings import _deprecated
@@ -263,6 +263,326 @@ def JSONArray(s_and_end, scan_once, array_hook, _w=WHITESPACE.match, _ws=WHITESP
     return values, end
 
 
+# A value cut by the end of the available text is only known to be
+# incomplete if the cut is in its last characters: '-Infinity' is the
+# longest token.
+_MAX_TOKEN_LENGTH = 9
+NUMBER_TAIL = re.compile(r'[-+.0-9eE]*', FLAGS)
+
+# Yielded by the parsers of _StreamDecoder when they need more text.
+_NEED_DATA = object()
+# Followed by _StreamDecoder to find where an incomplete value may end.
+_NESTING = re.compile(r'[][{}"]')
+_STRING_CHARS = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*', FLAGS)
+_TOKEN_END = re.compile(r'[^-+.0-9a-zA-Z]')
+
+
+def _stream_error(msg, doc, pos, offset, lineno, linestart):
+    """Return a JSONDecodeError for doc[pos], where doc is the part of a
+    stream starting at index offset, on line lineno starting at index
+    linestart."""
+    err = JSONDecodeError(msg, doc, pos)
+    err.pos = offset + pos
+    if err.lineno == 1:
+        err.colno = err.pos - linestart + 1
+    err.lineno += lineno - 1
+    err.args = ('%s: line %d column %d (char %d)'
+                % (msg, err.lineno, err.colno, err.pos),)
+    return err
+
+
+class _StreamDecoder:
+    """Decode JSON values from text received in parts.
+
+    The text is kept only until the value containing it is decoded.  If
+    path is None, the text is a sequence of JSON documents, which are
+    returned.  Otherwise, it is a single document, and the items of the
+    array or the (key, value) pairs of the object found by following the
+    object keys and array indices of path are returned.
+    """
+
+    def __init__(self, decoder, path=None):
+        self.scan_once = decoder.scan_once
+        self.strict = decoder.strict
+        self.buf = ''
+        self.pos = 0
+        self.eof = False
+        # The incomplete value being decoded is followed through the text
+        # received, and decoded again once it may be complete, or once the
+        # text after pos is wanted characters long.
+        self.complete = True
+        self.wanted = 0
+        # Nesting depth in the incomplete array, object or string, or None
+        # for a number or a literal.
+        self.depth = None
+        self.in_string = False
+        self.escape = False
+        # Position of buf in the stream, for error messages.
+        self.offset = 0
+        self.lineno = 1
+        self.linestart = 0
+        if path is None:
+            self.parser = self._parse_documents()
+        else:
+            self.parser = self._parse_document(tuple(path))
+
+    def feed(self, s):
+        """Add s to the text; return the list of the values completed."""
+        buf = self.buf
+        pos = self.pos
+        if pos:
+            # Discard the text already decoded.
+            newlines = buf.count('\n', 0, pos)
+            if newlines:
+                self.lineno += newlines
+                self.linestart = self.offset + buf.rindex('\n', 0, pos) + 1
+            self.offset += pos
+            buf = buf[pos:]
+            self.pos = 0
+        self.buf = buf + s
+        if not self._track(s) and len(self.buf) - self.pos < self.wanted:
+            # Don't decode the incomplete value again yet.
+            return []
+        return self._run()
+
+    def close(self):
+        """End the text; return the list of the remaining values."""
+        self.eof = True
+        return self._run()
+
+    def _run(self):
+        values = []
+        for value in self.parser:
+            if value is _NEED_DATA:
+                break
+            values.append(value)
+        return values
+
+    def _track(self, s, i=0, _nesting=_NESTING.search,
+               _string_chars=_STRING_CHARS.match,
+               _token_end=_TOKEN_END.search):
+        """Follow the incomplete value through s[i:]; return True if it
+        may be complete.
+
+        An array, an object or a string may be complete once it is closed,
+        and a number or a literal once another character follows it.
+        """
+        if self.complete:
+            return True
+        if self.depth is None:
+            self.complete = _token_end(s, i) is not None
+            return self.complete
+        depth = self.depth
+        in_string = self.in_string
+        n = len(s)
+        if self.escape and i < n:
+            # The previous text ended with a backslash in a string.
+            self.escape = False
+            i += 1
+        while i < n:
+            if in_string:
+                i = _string_chars(s, i).end()
+                if i == n:
+                    break
+                if s[i] == '\\':
+                    self.escape = True
+                    break
+                in_string = False
+                i += 1
+            else:
+                m = _nesting(s, i)
+                if m is None:
+                    break
+                i = m.end()
+                c = s[i - 1]
+                if c == '"':
+                    in_string = True
+                    continue
+                depth += 1 if c in '[{' else -1
+            if not depth:
+                self.complete = True
+                return True
+        self.depth = depth
+        self.in_string = in_string
+        return False
+
+    def _error(self, msg, pos):
+        return _stream_error(msg, self.buf, pos,
+                             self.offset, self.lineno, self.linestart)
+
+    def _peek(self, _w=WHITESPACE.match):
+        """Skip whitespace; return the next character, or '' if there is
+        no more text yet."""
+        self.pos = pos = _w(self.buf, self.pos).end()
+        return self.buf[pos:pos + 1]
+
+    def _skip_whitespace(self):
+        """Skip whitespace; return the next character, or '' at the end."""
+        while True:
+            nextchar = self._peek()
+            if nextchar or self.eof:
+                return nextchar
+            self.complete = True
+            self.wanted = 1
+            yield _NEED_DATA
+
+    def _scan_ready(self, scan, _number_tail=NUMBER_TAIL.fullmatch):
+        """Decode the value or the key starting at the current position.
+
+        Return _NEED_DATA if more text is needed: an error in the last
+        characters of the text, or a number ending with the text, may only
+        mean that the value is not complete.  It is decoded again from its
+        start once it may be complete, or once the text after its start has
+        doubled: iterload() reads at least as much text as the incomplete
+        value, and feed() decodes it again a bounded number of times.
+        """
+        buf = self.buf
+        pos = self.pos
+        try:
+            value, end = scan(buf, pos)
+        except StopIteration as err:
+            if self.eof or len(buf) - err.value > _MAX_TOKEN_LENGTH:
+                raise self._error("Expecting value", err.value) from None
+        except JSONDecodeError as err:
+            if self.eof or (err.msg != "Unterminated string starting at"
+                            and len(buf) - err.pos > _MAX_TOKEN_LENGTH):
+                raise self._error(err.msg, err.pos) from None
+        else:
+            if (self.eof or buf[pos] not in '-0123456789'
+                    or not _number_tail(buf, end)):
+                self.pos = end
+                return value
+        self.complete = False
+        self.wanted = 2 * (len(buf) - pos)
+        self.depth = 0 if buf[pos] in '[{"' else None
+        self.in_string = self.escape = False
+        self._track(buf, pos)
+        return _NEED_DATA
+
+    def _scan(self, scan):
+        while (value := self._scan_ready(scan)) is _NEED_DATA:
+            yield _NEED_DATA
+        return value
+
+    def _scan_value(self):
+        return (yield from self._scan(self.scan_once))
+
+    def _scan_key(self):
+        strict = self.strict
+        return (yield from self._scan(
+            lambda s, end: scanstring(s, end + 1, strict)))
+
+    def _parse_documents(self):
+        scan_once = self.scan_once
+        while self._peek() or (yield from self._skip_whitespace()):
+            value = self._scan_ready(scan_once)
+            if value is _NEED_DATA:
+                value = yield from self._scan_value()
+            yield value
+
+    def _parse_document(self, path):
+        if not (yield from self._skip_whitespace()):
+            raise self._error("Expecting value", self.pos)
+        yield from self._select(path)
+        if (yield from self._skip_whitespace()):
+            raise self._error("Extra data", self.pos)
+
+    def _select(self, path):
+        nextchar = self.buf[self.pos]
+        if not path:
+            if nextchar == '[':
+                yield from self._parse_array(None)
+            elif nextchar == '{':
+                yield from self._parse_object(self._yield_member)
+            else:
+                yield from self._scan_value()
+            return
+        key = path[0]
+        subpath = path[1:]
+        def select(k):
+            if k == key:
+                yield from self._select(subpath)
+            else:
+                yield from self._scan_value()
+        if nextchar == '[' and isinstance(key, int):
+            yield from self._parse_array(select)
+        elif nextchar == '{' and isinstance(key, str):
+            yield from self._parse_object(select)
+        else:
+            yield from self._scan_value()
+
+    def _yield_member(self, key):
+        yield key, (yield from self._scan_value())
+
+    def _parse_array(self, parse_item):
+        """Parse the array at the current position, calling parse_item()
+        with the index of each item to parse it, or yielding the items if
+        parse_item is None."""
+        scan_once = self.scan_once
+        self.pos += 1
+        nextchar = self._peek() or (yield from self._skip_whitespace())
+        if nextchar == ']':
+            self.pos += 1
+            return
+        index = 0
+        while True:
+            if not nextchar:
+                raise self._error("Expecting value", self.pos)
+            if parse_item is not None:
+                yield from parse_item(index)
+            else:
+                value = self._scan_ready(scan_once)
+                if value is _NEED_DATA:
+                    value = yield from self._scan_value()
+                yield value
+            nextchar = self._peek() or (yield from self._skip_whitespace())
+            if nextchar == ']':
+                self.pos += 1
+                return
+            if nextchar != ',':
+                raise self._error("Expecting ',' delimiter", self.pos)
+            comma_idx = self.pos
+            self.pos += 1
+            nextchar = self._peek() or (yield from self._skip_whitespace())
+            if nextchar == ']':
+                raise self._error(
+                    "Illegal trailing comma before end of array", comma_idx)
+            index += 1
+
+    def _parse_object(self, parse_member):
+        """Parse the object at the current position, calling
+        parse_member() with the key of each member to parse its value."""
+        self.pos += 1
+        nextchar = yield from self._skip_whitespace()
+        if nextchar == '}':
+            self.pos += 1
+            return
+        while True:
+            if nextchar != '"':
+                raise self._error(
+                    "Expecting property name enclosed in double quotes",
+                    self.pos)
+            key = yield from self._scan_key()
+            if (yield from self._skip_whitespace()) != ':':
+                raise self._error("Expecting ':' delimiter", self.pos)
+            self.pos += 1
+            if not (yield from self._skip_whitespace()):
+                raise self._error("Expecting value", self.pos)
+            yield from parse_member(key)
+            nextchar = yield from self._skip_whitespace()
+            if nextchar == '}':
+                self.pos += 1
+                return
+            if nextchar != ',':
+                raise self._error("Expecting ',' delimiter", self.pos)
+            comma_idx = self.pos
+            self.pos += 1
+            nextchar = yield from self._skip_whitespace()
+            if nextchar == '}':
+                raise self._error(
+                    "Illegal trailing comma before end of object", comma_idx)
+
+
 class JSONDecoder(object):
     """Simple JSON <https://json.org> decoder
 
@@ -348,7 +668,8 @@ def __init__(self, *, object_hook=None, parse_float=None,
         self.parse_string = scanstring
         self.memo = {}
         self.scan_once = scanner.make_scanner(self)
-
+        # State of the sequence being decoded by feed().
+        self._stream = None
 
     def decode(self, s, _w=WHITESPACE.match):
         """Return the Python representation of ``s`` (a ``str`` instance
@@ -375,3 +696,41 @@ def raw_decode(self, s, idx=0):
         except StopIteration as err:
             raise JSONDecodeError("Expecting value", s, err.value) from None
         return obj, end
+
+    def feed(self, s):
+        """Feed ``s`` (a ``str`` instance containing a part of a sequence
+        of JSON documents) to the decoder and return the list of the Python
+        representations of the documents it completed.
+
+        The documents may be separated by whitespace, such as newlines.
+        Only the text of the document being decoded is kept between calls.
+        An incomplete document is decoded again from its start when a part
+        which may complete it is fed, or when the text fed since its start
+        has doubled.
+
+        Unlike ``decode()``, this keeps state in the decoder until
+        ``close()`` is called: use a separate decoder for each sequence,
+        and don't share it between threads.
+
+        """
+        if self._stream is None:
+            self._stream = _StreamDecoder(self)
+        try:
+            return self._stream.feed(s)
+        except:
+            self._stream = None
+            raise
+
+    def close(self):
+        """Signal the end of the sequence of JSON documents fed with
+        ``feed()`` and return the list of the remaining documents.
+
+        Raise ``JSONDecodeError`` if the sequence ends within a document.
+        The decoder can then decode a new sequence.
+
+        """
+        stream = self._stream
+        self._stream = None
+        if stream is None:
+            return []
+        return stream.close()
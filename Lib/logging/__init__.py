@@ -628,6 +628,11 @@ def __repr__(self):
     default_time_format = '%Y-%m-%d %H:%M:%S'
     default_msec_format = '%s,%03d'
 
+    # The last (whole seconds, converter, date format, formatted time) used by
+    # formatTime().  Records are usually created many times per second, so
+    # this saves calling the converter and time.strftime() for most of them.
+    _last_time = None
+
     def formatTime(self, record, datefmt=None):
         """
         Return the creation time of the specified LogRecord as formatted text.
@@ -646,13 +651,19 @@ def formatTime(self, record, datefmt=None):
         formatters, for example if you want all logging times to be shown in GMT,
         set the 'converter' attribute in the Formatter class.
         """
-        ct = self.converter(record.created)
-        if datefmt:
-            s = time.strftime(datefmt, ct)
+        converter = self.converter
+        fmt = datefmt or self.default_time_format
+        # Floor like the converter: int() would truncate negative times.
+        seconds = record.created // 1
+        last = self._last_time
+        if (last is not None and last[0] == seconds and
+                last[1] == converter and last[2] == fmt):
+            s = last[3]
         else:
-            s = time.strftime(self.default_time_format, ct)
-            if self.default_msec_format:
-                s = self.default_msec_format % (s, record.msecs)
+            s = time.strftime(fmt, converter(record.created))
+            self._last_time = (seconds, converter, fmt, s)
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
         return s
 
     def formatException(self, ei):
@@ -1030,6 +1041,17 @@ def handle(self, record):
                 self.emit(record)
         return rv
 
+    def handleBatch(self, records):
+        """
+        Conditionally emit the specified logging records.
+
+        This version just calls handle() for each record. Subclasses may
+        override it to emit several records at once, for instance with a
+        single write to the underlying stream.
+        """
+        for record in records:
+            self.handle(record)
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1161,6 +1183,56 @@ def emit(self, record):
         except Exception:
             self.handleError(record)
 
+    def handleBatch(self, records):
+        """
+        Conditionally emit the specified logging records.
+
+        The records which pass the filters are formatted and written to the
+        stream with a single write, followed by a single flush.
+        """
+        if (type(self).handle is not Handler.handle or
+                type(self).emit is not StreamHandler.emit):
+            # A customized handle() or emit() must see every record.
+            Handler.handleBatch(self, records)
+        else:
+            self._emitBatch(records)
+
+    def _emitBatch(self, records):
+        with self.lock:
+            msgs, last = self._formatBatch(records)
+            if msgs:
+                self._writeBatch(msgs, last)
+
+    def _formatBatch(self, records):
+        # Return the messages of the records which pass the filters, and
+        # the last of these records.
+        msgs = []
+        last = None
+        for record in records:
+            rv = self.filter(record)
+            if isinstance(rv, LogRecord):
+                record = rv
+            if not rv:
+                continue
+            try:
+                msgs.append(self.format(record) + self.terminator)
+            except RecursionError:  # See issue 36272
+                raise
+            except Exception:
+                self.handleError(record)
+            else:
+                last = record
+        return msgs, last
+
+    def _writeBatch(self, msgs, last):
+        try:
+            self.stream.write(''.join(msgs))
+            self.flush()
+        except RecursionError:  # See issue 36272
+            raise
+        except Exception:
+            self.handleError(last)
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1267,6 +1339,27 @@ def emit(self, record):
         if self.stream:
             StreamHandler.emit(self, record)
 
+    def handleBatch(self, records):
+        """
+        Conditionally emit the specified logging records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it once a record passes the filters, like emit().
+        """
+        if (type(self).handle is not Handler.handle or
+                type(self).emit is not FileHandler.emit):
+            Handler.handleBatch(self, records)
+            return
+        with self.lock:
+            msgs, last = self._formatBatch(records)
+            if not msgs:
+                return
+            if self.stream is None:
+                if self.mode != 'w' or not self._closed:
+                    self.stream = self._open()
+            if self.stream:
+                self._writeBatch(msgs, last)
+
     def __repr__(self):
         level = getLevelName(self.level)
         return '<%s %s (%s)>' % (self.__class__.__name__, self.baseFilename, level)
@@ -1567,15 +1567,23 @@ class QueueListener(object):
     """
     _sentinel = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 batch_size=1):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If batch_size is greater than one, up to that many records which
+        are already waiting in the queue are passed together to the
+        handlers' handleBatch() method.
         """
+        if batch_size < 1:
+            raise ValueError('batch_size must be at least 1')
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.batch_size = batch_size
 
     def __enter__(self):
         """
@@ -1639,6 +1647,28 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def _handle_batch(self, records):
+        """
+        Handle several records at once.
+
+        The records are prepared and passed to each handler's handleBatch()
+        method.  If handle() is overridden, it is called for each record
+        instead.
+        """
+        if type(self).handle is not QueueListener.handle:
+            for record in records:
+                self.handle(record)
+            return
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if batch:
+                handler.handleBatch(batch)
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1656,9 +1686,30 @@ def _monitor(self):
                     if has_task_done:
                         q.task_done()
                     break
-                self.handle(record)
+                if self.batch_size == 1:
+                    self.handle(record)
+                    if has_task_done:
+                        q.task_done()
+                    continue
+                # Collect the records which are already waiting, without
+                # blocking for more.
+                records = [record]
+                stop = False
+                while len(records) < self.batch_size:
+                    try:
+                        record = self.dequeue(False)
+                    except queue.Empty:
+                        break
+                    if record is self._sentinel:
+                        stop = True
+                        break
+                    records.append(record)
+                self._handle_batch(records)
                 if has_task_done:
-                    q.task_done()
+                    for _ in range(len(records) + stop):
+                        q.task_done()
+                if stop:
+                    break
             except queue.Empty:
                 break
 
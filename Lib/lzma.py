@@ -35,6 +35,10 @@
 # Value 2 no longer used
 _MODE_WRITE    = 3
 
+# Size of the input blocks compressed concurrently when workers are used.
+# Like xz, use three times the dictionary size of the default preset.
+_PARALLEL_BLOCK_SIZE = 3 * 8 * 1024 * 1024
+
 
 class LZMAFile(_streams.BaseStream):
 
@@ -48,7 +52,7 @@ class LZMAFile(_streams.BaseStream):
     """
 
     def __init__(self, filename=None, mode="r", *,
-                 format=None, check=-1, preset=None, filters=None):
+                 format=None, check=-1, preset=None, filters=None, workers=1):
         """Open an LZMA-compressed file in binary mode.
 
         filename can be either an actual file name (given as a str,
@@ -90,6 +94,11 @@ def __init__(self, filename=None, mode="r", *,
         filters (if provided) should be a sequence of dicts. Each dict
         should have an entry for "id" indicating ID of the filter, plus
         additional entries for options to the filter.
+
+        When opening a file for writing in FORMAT_XZ, workers is the number
+        of threads used to compress the data; 0 uses one thread per CPU.
+        If it is greater than 1, the data is compressed into a sequence of
+        independent streams.
         """
         self._fp = None
         self._closefp = False
@@ -109,8 +118,13 @@ def __init__(self, filename=None, mode="r", *,
             if format is None:
                 format = FORMAT_XZ
             mode_code = _MODE_WRITE
-            self._compressor = LZMACompressor(format=format, check=check,
-                                              preset=preset, filters=filters)
+            if workers == 1:
+                self._compressor = LZMACompressor(format=format, check=check,
+                                                  preset=preset,
+                                                  filters=filters)
+            else:
+                self._compressor = _parallel_compressor(format, check, preset,
+                                                        filters, workers)
             self._pos = 0
         else:
             raise ValueError("Invalid mode: {!r}".format(mode))
@@ -279,7 +293,7 @@ def tell(self):
 
 def open(filename, mode="rb", *,
          format=None, check=-1, preset=None, filters=None,
-         encoding=None, errors=None, newline=None):
+         encoding=None, errors=None, newline=None, workers=1):
     """Open an LZMA-compressed file in binary or text mode.
 
     filename can be either an actual file name (given as a str, bytes,
@@ -290,7 +304,7 @@ def open(filename, mode="rb", *,
     "a", or "ab" for binary mode, or "rt", "wt", "xt", or "at" for text
     mode.
 
-    The format, check, preset and filters arguments specify the
+    The format, check, preset, filters and workers arguments specify the
     compression settings, as for LZMACompressor, LZMADecompressor and
     LZMAFile.
 
@@ -316,7 +330,7 @@ def open(filename, mode="rb", *,
 
     lz_mode = mode.replace("t", "")
     binary_file = LZMAFile(filename, lz_mode, format=format, check=check,
-                           preset=preset, filters=filters)
+                           preset=preset, filters=filters, workers=workers)
 
     if "t" in mode:
         encoding = io.text_encoding(encoding)
@@ -325,15 +339,37 @@ def open(filename, mode="rb", *,
         return binary_file
 
 
-def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None):
+def _parallel_compressor(format, check, preset, filters, workers):
+    if workers < 0:
+        raise ValueError("workers must be greater or equal to 0")
+    if format != FORMAT_XZ:
+        raise ValueError("workers is only supported for FORMAT_XZ")
+    # Check the arguments before any data is compressed.
+    LZMACompressor(format, check, preset, filters)
+    # Every block is compressed into a separate stream.  decompress() and
+    # LZMAFile read the concatenation of the streams back.
+    return _streams.ParallelCompressor(
+        lambda block: compress(block, format, check, preset, filters),
+        _PARALLEL_BLOCK_SIZE, workers)
+
+
+def compress(data, format=FORMAT_XZ, check=-1, preset=None, filters=None,
+             *, workers=1):
     """Compress a block of data.
 
     Refer to LZMACompressor's docstring for a description of the
     optional arguments *format*, *check*, *preset* and *filters*.
 
+    workers, if given, is the number of threads used to compress the data
+    as a sequence of independent streams; 0 uses one thread per CPU.  It
+    is only supported for FORMAT_XZ.
+
     For incremental compression, use an LZMACompressor instead.
     """
-    comp = LZMACompressor(format, check, preset, filters)
+    if workers == 1:
+        comp = LZMACompressor(format, check, preset, filters)
+    else:
+        comp = _parallel_compressor(format, check, preset, filters, workers)
     return comp.compress(data) + comp.flush()
 
 
@@ -392,11 +392,13 @@ def _close(self, _close=_multiprocessing.closesocket):
             _close(self._handle)
         _write = _multiprocessing.send
         _read = _multiprocessing.recv
+        _readinto = None
     else:
         def _close(self, _close=os.close):
             _close(self._handle)
         _write = os.write
         _read = os.read
+        _readinto = os.readinto
 
     def _send(self, buf, write=_write):
         remaining = len(buf)
@@ -407,9 +409,25 @@ def _send(self, buf, write=_write):
                 break
             buf = buf[n:]
 
-    def _recv(self, size, read=_read):
+    def _recv(self, size, read=_read, readinto=_readinto):
         buf = io.BytesIO()
         handle = self._handle
+        if readinto is not None and size > BUFSIZE:
+            # Read large messages straight into the final buffer: this avoids
+            # copying every chunk and does not cap the size of each read.
+            buf.seek(size - 1)
+            buf.write(b'\0')
+            with buf.getbuffer() as view:
+                pos = 0
+                while pos < size:
+                    n = readinto(handle, view[pos:])
+                    if n == 0:
+                        if pos == 0:
+                            raise EOFError
+                        else:
+                            raise OSError("got end of file during message")
+                    pos += n
+            return buf
         remaining = size
         while remaining > 0:
             to_read = min(BUFSIZE, remaining)
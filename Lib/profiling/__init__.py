@@ -1,6 +1,6 @@
 """Python profiling tools.
 
-This package provides two types of profilers:
+This package provides three types of profilers:
 
 - profiling.tracing: Deterministic tracing profiler that instruments every
   function call and return. Higher overhead but provides exact call counts
@@ -8,6 +8,9 @@
 
 - profiling.sampling: Statistical sampling profiler that periodically samples
   the call stack. Low overhead and suitable for production use.
+
+- profiling.imports: Import-time profiler that records the tree of imports
+  with their time, memory and bytecode cache status.
 """
 
-__all__ = ("tracing", "sampling")
+__all__ = ("tracing", "sampling", "imports")
@@ -0,0 +1,539 @@
+"""Import-time profiler for Python.
+
+This module records the tree of imports made by a program, with the wall
+time, the memory allocated and the bytecode cache status of each module.
+"""
+
+__all__ = ("ImportProfiler", "ImportRecord", "LazyImportRecord", "main")
+
+import _thread
+import importlib._bootstrap
+import importlib._bootstrap_external
+import sys
+import time
+import tracemalloc
+
+# Formats written by the collectors of profiling.sampling.
+FORMAT_EXTENSIONS = {
+    "text": "txt",
+    "collapsed": "txt",
+    "flamegraph": "html",
+    "gecko": "json",
+}
+
+# Status of the thread for the collectors, see profiling.sampling.constants.
+_THREAD_STATUS_HAS_GIL = 1 << 0
+_THREAD_STATUS_ON_CPU = 1 << 1
+_THREAD_STATUS_MAIN_THREAD = 1 << 5
+
+_active_profiler = None
+_audit_hook_installed = False
+
+
+class ImportRecord:
+    """An import of a module and the imports it made.
+
+    Times are in nanoseconds, as returned by time.perf_counter_ns().
+    Memory sizes are in bytes, or None if tracemalloc was not tracing.
+    """
+
+    def __init__(self, name, thread_id, start_ns, memory_start):
+        self.name = name
+        self.thread_id = thread_id
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.memory_start = memory_start
+        self.memory = None
+        self.pyc = None
+        self.failed = False
+        self.children = []
+
+    @property
+    def cumulative_ns(self):
+        """Time spent importing the module, including its imports."""
+        return self.end_ns - self.start_ns
+
+    @property
+    def self_ns(self):
+        """Time spent importing the module, excluding its imports."""
+        return self.cumulative_ns - sum(c.cumulative_ns for c in self.children)
+
+    @property
+    def self_memory(self):
+        """Memory allocated by the module, excluding its imports."""
+        if self.memory is None:
+            return None
+        return self.memory - sum(c.memory or 0 for c in self.children)
+
+    def __repr__(self):
+        return (f"<ImportRecord {self.name!r} "
+                f"cumulative_ns={self.cumulative_ns} pyc={self.pyc!r}>")
+
+
+class LazyImportRecord:
+    """The reification of a lazy import.
+
+    filename and lineno locate the lazy import statement, trigger_filename,
+    trigger_lineno and trigger_function the code which used the name and
+    triggered the import.  record is the ImportRecord of the module loaded
+    by the reification, or None if the module was already loaded.
+    """
+
+    def __init__(self, name, fromlist, filename, lineno, frame, thread_id,
+                 start_ns, importing):
+        self.name = name
+        self.fromlist = fromlist
+        self.filename = filename
+        self.lineno = lineno
+        if frame is not None:
+            self.trigger_filename = frame.f_code.co_filename
+            self.trigger_lineno = frame.f_lineno
+            self.trigger_function = frame.f_code.co_name
+        else:
+            self.trigger_filename = None
+            self.trigger_lineno = None
+            self.trigger_function = None
+        self.thread_id = thread_id
+        self.start_ns = start_ns
+        self.importing = importing
+        self.record = None
+
+    @property
+    def full_name(self):
+        """The name of the module, followed by the imported name if any."""
+        if isinstance(self.fromlist, str):
+            return f"{self.name}.{self.fromlist}"
+        return self.name
+
+    @property
+    def cumulative_ns(self):
+        """Time spent loading the module, or 0 if it was already loaded."""
+        if self.record is None:
+            return 0
+        return self.record.cumulative_ns
+
+    @property
+    def at_import_time(self):
+        """True if the import was reified by module-level code."""
+        return self.trigger_function == "<module>"
+
+    def __repr__(self):
+        return (f"<LazyImportRecord {self.name!r} "
+                f"cumulative_ns={self.cumulative_ns} "
+                f"trigger={self.trigger_function!r}>")
+
+
+def _audit_hook(event, args):
+    if event != "import.lazy":
+        return
+    profiler = _active_profiler
+    if profiler is not None:
+        # The caller of the hook is the frame which used the lazy name.
+        profiler._reify(*args, sys._getframe(1))
+
+
+class ImportProfiler:
+    """Record the imports made while the profiler is enabled.
+
+    The profiler wraps the functions of importlib which load modules, so
+    only imports which are not already in sys.modules are recorded.  Only
+    one profiler can be enabled at a time.  Memory is only measured if
+    tracemalloc is tracing when the profiler is enabled.
+
+    The reifications of lazy imports are recorded in reifications, using
+    the "import.lazy" audit event, and the names of the modules imported
+    lazily but never loaded in unreified, when the profiler is disabled.
+    """
+
+    def __init__(self):
+        self.records = []
+        self.reifications = []
+        self.unreified = []
+        self._lazy_modules = set()
+        self._pending = {}
+        self._stacks = {}
+        self._patched = None
+        self._trace_memory = False
+        self._main_thread_id = None
+
+    def enable(self):
+        global _active_profiler, _audit_hook_installed
+        if _active_profiler is not None:
+            raise RuntimeError("an import profiler is already enabled")
+        if not _audit_hook_installed:
+            # Audit hooks cannot be removed: the hook is shared by all
+            # profilers and does nothing when none is enabled.
+            sys.addaudithook(_audit_hook)
+            _audit_hook_installed = True
+        # With -X lazy_imports=all, the imports of this module are lazy too:
+        # reify them before the hooks, which must not import, use them.
+        time, tracemalloc, importlib._bootstrap_external
+        self._lazy_modules = set(getattr(sys, "lazy_modules", ()))
+        self._trace_memory = tracemalloc.is_tracing()
+        self._main_thread_id = _thread.get_ident()
+
+        bootstrap = importlib._bootstrap
+        external = importlib._bootstrap_external
+        find_and_load = bootstrap._find_and_load
+        compile_bytecode = external._compile_bytecode
+        write_atomic = external._write_atomic
+
+        def _find_and_load(name, import_, **kwargs):
+            if name in sys.modules:
+                # Being initialized: wait for it, there is nothing to load.
+                return find_and_load(name, import_, **kwargs)
+            record = self._enter(name)
+            try:
+                return find_and_load(name, import_, **kwargs)
+            except BaseException:
+                record.failed = True
+                raise
+            finally:
+                self._exit(record)
+
+        def _compile_bytecode(*args, **kwargs):
+            self._set_pyc("hit")
+            return compile_bytecode(*args, **kwargs)
+
+        def _write_atomic(*args, **kwargs):
+            result = write_atomic(*args, **kwargs)
+            self._set_pyc("miss")
+            return result
+
+        self._patched = [
+            (bootstrap, "_find_and_load", find_and_load),
+            (external, "_compile_bytecode", compile_bytecode),
+            (external, "_write_atomic", write_atomic),
+        ]
+        bootstrap._find_and_load = _find_and_load
+        external._compile_bytecode = _compile_bytecode
+        external._write_atomic = _write_atomic
+        _active_profiler = self
+
+    def disable(self):
+        global _active_profiler
+        if _active_profiler is not self:
+            return
+        for module, name, func in self._patched:
+            setattr(module, name, func)
+        self._patched = None
+        self._pending.clear()
+        # sys.lazy_modules keeps some names which were reified, or which
+        # were loaded eagerly by another import.
+        lazy_modules = set(getattr(sys, "lazy_modules", ()))
+        lazy_modules -= self._lazy_modules
+        lazy_modules -= {r.full_name for r in self.reifications}
+        self.unreified = sorted(name for name in lazy_modules
+                                if name not in sys.modules)
+        _active_profiler = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
+
+    def _memory(self):
+        if self._trace_memory:
+            return tracemalloc.get_traced_memory()[0]
+        return None
+
+    def _enter(self, name):
+        thread_id = _thread.get_ident()
+        stack = self._stacks.setdefault(thread_id, [])
+        record = ImportRecord(name, thread_id, time.perf_counter_ns(),
+                              self._memory())
+        # The first import after a reification in the thread is the one it
+        # made, unless the module was already loaded.
+        reification = self._pending.pop(thread_id, None)
+        if reification is not None and (
+                name == reification.name
+                or name.startswith(reification.name + ".")):
+            reification.record = record
+        if stack:
+            stack[-1].children.append(record)
+        else:
+            self.records.append(record)
+        stack.append(record)
+        return record
+
+    def _exit(self, record):
+        record.end_ns = time.perf_counter_ns()
+        if record.memory_start is not None:
+            record.memory = self._memory() - record.memory_start
+        if record.pyc is None:
+            spec = getattr(sys.modules.get(record.name), "__spec__", None)
+            loader = getattr(spec, "loader", None)
+            if isinstance(loader, importlib._bootstrap_external.SourceLoader):
+                record.pyc = "compile"
+        self._stacks[record.thread_id].pop()
+
+    def _reify(self, name, fromlist, filename, lineno, frame):
+        thread_id = _thread.get_ident()
+        stack = self._stacks.get(thread_id)
+        reification = LazyImportRecord(
+            name, fromlist, filename, lineno, frame, thread_id,
+            time.perf_counter_ns(), stack[-1].name if stack else None)
+        self.reifications.append(reification)
+        self._pending[thread_id] = reification
+
+    def _set_pyc(self, status):
+        stack = self._stacks.get(_thread.get_ident())
+        if stack:
+            stack[-1].pyc = status
+
+    def iter_records(self):
+        """Yield (depth, record) for all records, in import order."""
+        todo = [(0, record) for record in reversed(self.records)]
+        while todo:
+            depth, record = todo.pop()
+            yield depth, record
+            todo.extend((depth + 1, child)
+                        for child in reversed(record.children))
+
+    def print_tree(self, file=None):
+        """Print the tree of imports, like -X importtime."""
+        if file is None:
+            file = sys.stderr
+        memory = self._trace_memory
+        header = "  self [us] | cumulative [us] |"
+        if memory:
+            header += "  self [KiB] |"
+        print(f"{header} pyc     | imported package", file=file)
+        for depth, record in self.iter_records():
+            line = (f"{record.self_ns // 1000:11,d} | "
+                    f"{record.cumulative_ns // 1000:15,d} |")
+            if memory:
+                line += f" {record.self_memory / 1024:11,.1f} |"
+            pyc = "error" if record.failed else record.pyc or "-"
+            print(f"{line} {pyc:<7} | {'  ' * depth}{record.name}", file=file)
+
+    def print_lazy_report(self, file=None):
+        """Print the reified and unreified lazy imports.
+
+        Imports which were never reified, or were reified outside of
+        module-level code, are the ones for which being lazy saves time.
+        """
+        if file is None:
+            file = sys.stderr
+        deferred = [r for r in self.reifications if not r.at_import_time]
+        eager = [r for r in self.reifications if r.at_import_time]
+        print("Lazy imports never reified (safe to keep lazy):", file=file)
+        for name in self.unreified:
+            print(f"  {name}", file=file)
+        if not self.unreified:
+            print("  (none)", file=file)
+        print(file=file)
+        print("Lazy imports reified after import time (deferred):", file=file)
+        _print_reifications(deferred, file)
+        print(file=file)
+        print("Lazy imports reified at import time (no saving, "
+              "consider importing eagerly):", file=file)
+        _print_reifications(eager, file)
+
+    def replay(self, collector, interval_usec=10):
+        """Feed the recorded imports to a profiling.sampling collector.
+
+        The imports are sampled every interval_usec microseconds of the
+        recorded timeline: each import becomes a frame named after the
+        module, and the number of samples of a stack is proportional to the
+        time spent in the innermost import.
+        """
+        if not self.records:
+            return
+        origin = min(record.start_ns for record in self.records)
+        interval_ns = interval_usec * 1000
+        segments = []
+        for record in self.records:
+            _collect_segments(record, [], segments)
+        segments.sort(key=lambda segment: segment[:2])
+        for start, thread_id, end, frames in segments:
+            # Samples are taken at multiples of the interval since origin.
+            first = origin + -(-(start - origin) // interval_ns) * interval_ns
+            timestamps = [t // 1000 for t in range(first, end, interval_ns)]
+            if not timestamps:
+                continue
+            status = _THREAD_STATUS_HAS_GIL | _THREAD_STATUS_ON_CPU
+            if thread_id == self._main_thread_id:
+                status |= _THREAD_STATUS_MAIN_THREAD
+            thread = _ThreadInfo(thread_id, frames, status)
+            collector.collect([_InterpreterInfo(0, [thread])], timestamps)
+
+    def export(self, filename, format="collapsed", interval_usec=10):
+        """Write the recorded imports to filename.
+
+        format is "text" for the output of print_tree(), "lazy" for the
+        output of print_lazy_report(), or one of the formats of
+        profiling.sampling: "collapsed", "flamegraph" or "gecko".
+        """
+        if format in ("text", "lazy"):
+            with open(filename, "w", encoding="utf-8") as file:
+                if format == "text":
+                    self.print_tree(file)
+                else:
+                    self.print_lazy_report(file)
+            return True
+        collector = _create_collector(format, interval_usec)
+        self.replay(collector, interval_usec)
+        if format == "flamegraph":
+            total_ns = sum(record.cumulative_ns for record in self.records)
+            collector.set_stats(interval_usec, total_ns / 1e9,
+                                1e6 / interval_usec)
+        return collector.export(filename)
+
+
+def _location(filename, lineno):
+    if filename is None:
+        return "?"
+    return f"{filename}:{lineno}"
+
+
+def _print_reifications(reifications, file):
+    if not reifications:
+        print("  (none)", file=file)
+        return
+    print("  cumulative [us] | lazy import | declared at | reified at",
+          file=file)
+    for r in sorted(reifications, key=lambda r: -r.cumulative_ns):
+        trigger = _location(r.trigger_filename, r.trigger_lineno)
+        if r.trigger_function is not None:
+            trigger += f" in {r.trigger_function}"
+        print(f"  {r.cumulative_ns // 1000:15,d} | {r.full_name} | "
+              f"{_location(r.filename, r.lineno)} | {trigger}", file=file)
+
+
+class _InterpreterInfo:
+    def __init__(self, interpreter_id, threads):
+        self.interpreter_id = interpreter_id
+        self.threads = threads
+
+
+class _ThreadInfo:
+    def __init__(self, thread_id, frame_info, status):
+        self.thread_id = thread_id
+        self.frame_info = frame_info
+        self.status = status
+
+
+def _frame(record):
+    # Like the special frames of the sampling profiler, a "~" filename with
+    # no line number is displayed as the bare name.
+    return ("~", None, record.name, None)
+
+
+def _collect_segments(record, stack, segments):
+    """Append the (start, thread_id, end, frames) time segments of record.
+
+    frames is the stack of imports during the segment, innermost first.
+    """
+    stack = [_frame(record)] + stack
+    cursor = record.start_ns
+    for child in record.children:
+        if child.start_ns > cursor:
+            segments.append((cursor, record.thread_id, child.start_ns, stack))
+        _collect_segments(child, stack, segments)
+        cursor = child.end_ns
+    if record.end_ns > cursor:
+        segments.append((cursor, record.thread_id, record.end_ns, stack))
+
+
+def _create_collector(format, interval_usec):
+    from profiling.sampling.stack_collector import (
+        CollapsedStackCollector, FlamegraphCollector)
+    from profiling.sampling.gecko_collector import GeckoCollector
+
+    if format == "collapsed":
+        return CollapsedStackCollector(interval_usec)
+    elif format == "flamegraph":
+        return FlamegraphCollector(interval_usec)
+    elif format == "gecko":
+        return GeckoCollector(interval_usec)
+    raise ValueError(f"unknown format: {format!r}")
+
+
+def main(args=None):
+    import argparse
+    import io
+    import os
+    import runpy
+    import types
+
+    parser = argparse.ArgumentParser(
+        prog="python -m profiling.imports",
+        description="Profile the imports of a Python script or module.",
+    )
+    format_group = parser.add_mutually_exclusive_group()
+    format_group.add_argument(
+        "--collapsed", action="store_const", const="collapsed", dest="format",
+        help="write collapsed stack traces for flamegraphs")
+    format_group.add_argument(
+        "--flamegraph", action="store_const", const="flamegraph",
+        dest="format", help="write an interactive HTML flamegraph")
+    format_group.add_argument(
+        "--gecko", action="store_const", const="gecko", dest="format",
+        help="write the Gecko format for Firefox Profiler")
+    format_group.add_argument(
+        "--lazy", action="store_const", const="lazy", dest="format",
+        help="report the lazy imports which were reified or not, "
+             "instead of the tree of imports")
+    parser.set_defaults(format="text")
+    parser.add_argument(
+        "-o", "--output", dest="outfile",
+        help="output file (default: stderr for the text and lazy formats, "
+             "FORMAT_PID.EXT for the other formats)")
+    parser.add_argument(
+        "-i", "--interval", type=int, default=10, metavar="USEC",
+        help="sampling interval of the recorded imports, in microseconds, "
+             "for the collapsed, flamegraph and gecko formats "
+             "(default: %(default)s)")
+    parser.add_argument(
+        "--memory", action="store_true",
+        help="measure the memory allocated by each import with tracemalloc")
+    parser.add_argument(
+        "-m", dest="module", action="store_true",
+        help="run the target as a module, like python -m")
+    parser.add_argument("target", help="script file or module name")
+    parser.add_argument("args", nargs=argparse.REMAINDER,
+                        help="arguments passed to the target")
+    options = parser.parse_args(args)
+    if options.interval <= 0:
+        parser.error("the interval must be positive")
+
+    # The target may chdir.
+    outfile = options.outfile
+    if outfile is None and options.format not in ("text", "lazy"):
+        extension = FORMAT_EXTENSIONS[options.format]
+        outfile = f"{options.format}_{os.getpid()}.{extension}"
+    if outfile is not None:
+        outfile = os.path.abspath(outfile)
+
+    sys.argv[:] = [options.target, *options.args]
+    if not options.module:
+        # Compile the script before profiling, like profiling.tracing.
+        sys.path.insert(0, os.path.dirname(options.target))
+        with io.open_code(options.target) as file:
+            code = compile(file.read(), options.target, "exec",
+                           module="__main__")
+        module = types.ModuleType("__main__")
+        module.__file__ = options.target
+        module.__builtins__ = __builtins__
+        sys.modules["__main__"] = module
+    if options.memory:
+        tracemalloc.start()
+    profiler = ImportProfiler()
+    try:
+        with profiler:
+            if options.module:
+                runpy.run_module(options.target, run_name="__main__",
+                                 alter_sys=True)
+            else:
+                exec(code, module.__dict__)
+    finally:
+        if outfile is None:
+            if options.format == "lazy":
+                profiler.print_lazy_report()
+            else:
+                profiler.print_tree()
+        else:
+            profiler.export(outfile, options.format, options.interval)
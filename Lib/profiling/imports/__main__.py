@@ -0,0 +1,6 @@
+"""Run the import profiler from the command line."""
+
+from profiling.imports import main
+
+if __name__ == '__main__':
+    main()
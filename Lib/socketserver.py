@@ -21,6 +21,8 @@
         - synchronous (one request is handled at a time)
         - forking (each request is handled by a new process)
         - threading (each request is handled by a new thread)
+        - thread pool (requests are handled by a fixed set of threads)
+        - prefork (a fixed set of processes each accept requests)
 
 The classes in this module favor the server type that is simplest to
 write: a synchronous TCP/IP server.  This is bad class design, but
@@ -123,6 +125,8 @@ class will essentially render the service "deaf" while one request is
 import socket
 import selectors
 import os
+import queue
+import signal
 import sys
 import threading
 from io import BufferedIOBase
@@ -131,9 +135,10 @@ class will essentially render the service "deaf" while one request is
 __all__ = ["BaseServer", "TCPServer", "UDPServer",
            "ThreadingUDPServer", "ThreadingTCPServer",
            "BaseRequestHandler", "StreamRequestHandler",
-           "DatagramRequestHandler", "ThreadingMixIn"]
+           "DatagramRequestHandler", "ThreadingMixIn", "ThreadPoolMixIn"]
 if hasattr(os, "fork"):
-    __all__.extend(["ForkingUDPServer","ForkingTCPServer", "ForkingMixIn"])
+    __all__.extend(["ForkingUDPServer","ForkingTCPServer", "ForkingMixIn",
+                    "PreforkMixIn"])
 if hasattr(socket, "AF_UNIX"):
     __all__.extend(["UnixStreamServer","UnixDatagramServer",
                     "ThreadingUnixStreamServer",
@@ -639,6 +644,239 @@ def server_close(self):
             self.collect_children(blocking=self.block_on_close)
 
 
+    class PreforkMixIn:
+        """Mix-in class to accept requests in a fixed set of worker processes.
+
+        serve_forever() forks the workers and then supervises them,
+        replacing workers that exit.  Each worker runs its own accept loop.
+        If allow_reuse_port is true and SO_REUSEPORT is supported, every
+        worker binds its own listening socket and the kernel balances
+        connections between them; otherwise the workers share the
+        listening socket of the parent.
+        """
+
+        # Number of worker processes; None means os.process_cpu_count().
+        workers = None
+        # Process IDs of the current worker processes.
+        active_workers = None
+        # If true, server_close() waits until all worker processes exit.
+        block_on_close = True
+
+        _is_worker = False
+        _worker_stopping = False
+        _worker_poll_interval = 0.5
+        _reload_request = False
+        _retiring_workers = None
+
+        def _uses_reuse_port(self):
+            return (self.allow_reuse_port and hasattr(socket, "SO_REUSEPORT")
+                    and self.address_family in (socket.AF_INET,
+                                                socket.AF_INET6))
+
+        def server_activate(self):
+            # With SO_REUSEPORT the parent only reserves the address; a
+            # listening socket in the parent would get connections too.
+            if self._is_worker or not self._uses_reuse_port():
+                super().server_activate()
+
+        def serve_forever(self, poll_interval=0.5):
+            """Start the worker processes and supervise them until shutdown.
+
+            Polls for shutdown and reload requests every poll_interval
+            seconds.
+            """
+            shutdown_request = vars(self).setdefault(
+                '_prefork_shutdown_request', threading.Event())
+            is_shut_down = vars(self).setdefault(
+                '_prefork_is_shut_down', threading.Event())
+            is_shut_down.clear()
+            self._worker_poll_interval = poll_interval
+            try:
+                if self.active_workers is None:
+                    self.active_workers = set()
+                    self._retiring_workers = set()
+                self._start_workers()
+                while not shutdown_request.wait(poll_interval):
+                    if self._reload_request:
+                        self._reload_request = False
+                        old = self.active_workers
+                        self.active_workers = set()
+                        self._start_workers()
+                        self._stop_workers(old)
+                    self.collect_workers()
+                    self.service_actions()
+            finally:
+                self._stop_workers(self.active_workers)
+                self.active_workers = set()
+                shutdown_request.clear()
+                is_shut_down.set()
+
+        def shutdown(self):
+            """Stops the serve_forever loop and the worker processes.
+
+            Blocks until the loop has finished.  The workers finish the
+            requests they are handling; server_close() waits for them.
+            """
+            vars(self).setdefault(
+                '_prefork_shutdown_request', threading.Event()).set()
+            vars(self).setdefault(
+                '_prefork_is_shut_down', threading.Event()).wait()
+
+        def reload(self):
+            """Replace the worker processes with new ones.
+
+            New workers are started first; the old ones then finish the
+            requests they are handling and exit.  Can be called from a
+            signal handler or from another thread while serve_forever()
+            is running.
+            """
+            self._reload_request = True
+
+        def collect_workers(self):
+            """Reap exited workers and replace those that exited unexpectedly."""
+            for pid in self._retiring_workers.copy():
+                if self._reap_worker(pid, os.WNOHANG):
+                    self._retiring_workers.discard(pid)
+            for pid in self.active_workers.copy():
+                if self._reap_worker(pid, os.WNOHANG):
+                    self.active_workers.discard(pid)
+                    self._start_worker()
+
+        def _reap_worker(self, pid, flags):
+            try:
+                return os.waitpid(pid, flags)[0] == pid
+            except ChildProcessError:
+                # someone else reaped it
+                return True
+
+        def _start_workers(self):
+            workers = self.workers or os.process_cpu_count() or 1
+            while len(self.active_workers) < workers:
+                self._start_worker()
+
+        def _stop_workers(self, pids):
+            for pid in pids:
+                try:
+                    os.kill(pid, signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+            self._retiring_workers |= pids
+
+        def _start_worker(self):
+            # The worker closes its end of the pipe once it is ready to
+            # accept requests.
+            ready_r, ready_w = os.pipe()
+            # Block SIGTERM until the worker has installed its own handler.
+            mask = signal.pthread_sigmask(signal.SIG_BLOCK, {signal.SIGTERM})
+            try:
+                pid = os.fork()
+            except:
+                signal.pthread_sigmask(signal.SIG_SETMASK, mask)
+                os.close(ready_r)
+                os.close(ready_w)
+                raise
+            if pid:
+                # Parent process
+                signal.pthread_sigmask(signal.SIG_SETMASK, mask)
+                os.close(ready_w)
+                try:
+                    # Returns at EOF: when the worker is ready or has exited.
+                    os.read(ready_r, 1)
+                finally:
+                    os.close(ready_r)
+                    self.active_workers.add(pid)
+                return
+            # Worker process.
+            # This must never return, hence os._exit()!
+            status = 1
+            try:
+                os.close(ready_r)
+                self._worker_ready_fd = ready_w
+                self._is_worker = True
+                self.active_workers = None
+                self._retiring_workers = None
+                signal.signal(signal.SIGTERM, self._stop_worker)
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, {signal.SIGTERM})
+                self._serve_worker(self._worker_poll_interval)
+                status = 0
+            except Exception:
+                import traceback
+                traceback.print_exc()
+            finally:
+                try:
+                    self.server_close()
+                finally:
+                    os._exit(status)
+
+        def _stop_worker(self, signum, frame):
+            self._worker_stopping = True
+
+        def _serve_worker(self, poll_interval):
+            if self._uses_reuse_port():
+                self.socket.close()
+                self.socket = socket.socket(self.address_family,
+                                            self.socket_type)
+                if (self.allow_reuse_address
+                        and hasattr(socket, "SO_REUSEADDR")):
+                    self.socket.setsockopt(socket.SOL_SOCKET,
+                                           socket.SO_REUSEADDR, 1)
+                self.socket.setsockopt(socket.SOL_SOCKET,
+                                       socket.SO_REUSEPORT, 1)
+                self.socket.bind(self.server_address)
+                self.server_activate()
+            else:
+                # The socket is shared with the other workers: when one
+                # of them takes the request, accept() must not block the
+                # others.
+                self.socket.setblocking(False)
+            os.close(self._worker_ready_fd)
+            # With ThreadPoolMixIn, do not wait for an idle thread longer
+            # than the poll interval, to notice SIGTERM.
+            self._pool_poll_interval = poll_interval
+            parent = os.getppid()
+            with _ServerSelector() as selector:
+                selector.register(self, selectors.EVENT_READ)
+                while not self._worker_stopping:
+                    ready = selector.select(poll_interval)
+                    if self._worker_stopping:
+                        break
+                    if ready:
+                        self._handle_request_noblock()
+                    elif os.getppid() != parent:
+                        # The parent died without stopping its workers.
+                        break
+                    self.service_actions()
+                if self._uses_reuse_port():
+                    # Requests queued on this worker's own socket are lost
+                    # when it is closed: handle those already waiting.
+                    for _ in range(self.request_queue_size):
+                        if not selector.select(0):
+                            break
+                        self._handle_request_noblock()
+
+        def get_request(self):
+            request, client_address = super().get_request()
+            if (self._is_worker and not self._uses_reuse_port()
+                    and self.socket_type == socket.SOCK_STREAM):
+                # On some platforms, like macOS and BSD, the accepted
+                # socket inherits O_NONBLOCK from the shared listening
+                # socket, and accept() only resets it if the listening
+                # socket has a timeout.
+                request.settimeout(socket.getdefaulttimeout())
+            return request, client_address
+
+        def server_close(self):
+            if not self._is_worker:
+                if self.active_workers is not None:
+                    self._stop_workers(self.active_workers)
+                    self.active_workers = set()
+                    if self.block_on_close:
+                        for pid in self._retiring_workers:
+                            self._reap_worker(pid, 0)
+                        self._retiring_workers.clear()
+            super().server_close()
+
+
 class _Threads(list):
     """
     Joinable list of all non-daemon threads.
@@ -712,6 +950,106 @@ def server_close(self):
         self._threads.join()
 
 
+class ThreadPoolMixIn:
+    """Mix-in class to handle requests in a fixed pool of threads."""
+
+    # Number of threads; None means min(32, os.process_cpu_count() + 4).
+    pool_size = None
+    # Decides how threads will act upon termination of the
+    # main process
+    daemon_threads = False
+    # If true, server_close() waits until the pool threads terminate.
+    block_on_close = True
+
+    _pool = None
+    # True while _handle_request_noblock() holds an idle pool thread.
+    _pool_reserved = False
+    # How long to wait for an idle pool thread before polling again, or
+    # None to block, as handle_request() does.
+    _pool_poll_interval = None
+
+    def process_request_thread(self, request, client_address):
+        """Same as in BaseServer but in a pool thread.
+
+        In addition, exception handling is done here.
+
+        """
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def _start_pool(self):
+        if self._pool is None:
+            size = self.pool_size or min(32, (os.process_cpu_count() or 1) + 4)
+            self._pool_idle = threading.Semaphore(size)
+            self._pool_requests = queue.SimpleQueue()
+            self._pool = []
+            for _ in range(size):
+                t = threading.Thread(target=self._pool_worker)
+                t.daemon = self.daemon_threads
+                self._pool.append(t)
+                t.start()
+
+    def serve_forever(self, poll_interval=0.5):
+        self._pool_poll_interval = poll_interval
+        try:
+            super().serve_forever(poll_interval)
+        finally:
+            self._pool_poll_interval = None
+
+    def _handle_request_noblock(self):
+        """Accept a request only once a pool thread is idle.
+
+        While all threads are busy, new connections wait in the listen
+        backlog and serve_forever() keeps polling for shutdown().
+        """
+        self._start_pool()
+        if not self._pool_idle.acquire(timeout=self._pool_poll_interval):
+            return
+        self._pool_reserved = True
+        try:
+            super()._handle_request_noblock()
+        finally:
+            if self._pool_reserved:
+                # No request was accepted.
+                self._pool_reserved = False
+                self._pool_idle.release()
+
+    def process_request(self, request, client_address):
+        """Hand the request to a pool thread.
+
+        Blocks while all threads are busy, unless a thread has been
+        reserved for the request before it was accepted.
+        """
+        self._start_pool()
+        if self._pool_reserved:
+            self._pool_reserved = False
+        else:
+            self._pool_idle.acquire()
+        self._pool_requests.put((request, client_address))
+
+    def _pool_worker(self):
+        while (item := self._pool_requests.get()) is not None:
+            try:
+                self.process_request_thread(*item)
+            finally:
+                self._pool_idle.release()
+
+    def server_close(self):
+        super().server_close()
+        pool = self._pool
+        if pool is not None:
+            self._pool = None
+            for _ in pool:
+                self._pool_requests.put(None)
+            if self.block_on_close and not self.daemon_threads:
+                for t in pool:
+                    t.join()
+
+
 if hasattr(os, "fork"):
     class ForkingUDPServer(ForkingMixIn, UDPServer): pass
     class ForkingTCPServer(ForkingMixIn, TCPServer): pass
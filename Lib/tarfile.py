@@ -363,7 +363,8 @@ class _Stream:
     """
 
     def __init__(self, name, mode, comptype, fileobj, bufsize,
-                 compresslevel, preset, mtime):
+                 compresslevel, preset, mtime, level=None, options=None,
+                 zstd_dict=None):
         """Construct a _Stream object.
         """
         self._extfileobj = True
@@ -427,10 +428,13 @@ def __init__(self, name, mode, comptype, fileobj, bufsize,
                 except ImportError:
                     raise CompressionError("compression.zstd module is not available") from None
                 if mode == "r":
-                    self.cmp = zstd.ZstdDecompressor()
+                    self.cmp = zstd.ZstdDecompressor(zstd_dict=zstd_dict,
+                                                     options=options)
                     self.exception = zstd.ZstdError
                 else:
-                    self.cmp = zstd.ZstdCompressor()
+                    self.cmp = zstd.ZstdCompressor(level=level,
+                                                   options=options,
+                                                   zstd_dict=zstd_dict)
             elif comptype != "tar":
                 raise CompressionError("unknown compression type %r" % comptype)
 
@@ -477,10 +481,18 @@ def __write(self, s):
         """Write string s to the stream if a whole new block
            is ready to be written.
         """
-        self.buf += s
-        while len(self.buf) > self.bufsize:
-            self.fileobj.write(self.buf[:self.bufsize])
-            self.buf = self.buf[self.bufsize:]
+        buf = self.buf + s
+        bufsize = self.bufsize
+        if len(buf) <= bufsize:
+            self.buf = buf
+            return
+        # Write all the complete blocks before keeping the rest, rather than
+        # copying the remaining data again after each block.
+        pos = 0
+        while len(buf) - pos > bufsize:
+            self.fileobj.write(buf[pos:pos + bufsize])
+            pos += bufsize
+        self.buf = buf[pos:]
 
     def close(self):
         """Close the _Stream object. No operation should be
@@ -1997,12 +2009,22 @@ def not_compressed(comptype):
                 )
             if "preset" in kwargs and comptype not in ("xz",):
                 raise ValueError("preset is only valid for w|xz mode")
+            if "level" in kwargs and comptype not in ("zst",):
+                raise ValueError("level is only valid for w|zst mode")
+            for key in ("options", "zstd_dict"):
+                if key in kwargs and comptype not in ("zst",):
+                    raise ValueError(
+                        f"{key} is only valid for r|zst and w|zst modes")
 
             compresslevel = kwargs.pop("compresslevel", 6)
             preset = kwargs.pop("preset", None)
             mtime = kwargs.pop("mtime", None)
+            level = kwargs.pop("level", None)
+            options = kwargs.pop("options", None)
+            zstd_dict = kwargs.pop("zstd_dict", None)
             stream = _Stream(name, filemode, comptype, fileobj, bufsize,
-                             compresslevel, preset, mtime)
+                             compresslevel, preset, mtime, level, options,
+                             zstd_dict)
             try:
                 t = cls(name, filemode, stream, **kwargs)
             except:
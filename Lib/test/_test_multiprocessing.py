@@ -3937,6 +3937,18 @@ def test_connection(self):
         conn.send_bytes(really_big_msg)
         self.assertEqual(conn.recv_bytes(), really_big_msg)
 
+        big_obj = list(range(100_000))
+        conn.send(big_obj)
+        self.assertEqual(conn.recv(), big_obj)
+
+        if self.TYPE == 'processes':
+            big_arr = array.array('i', range(100_000))
+            buffer = array.array('i', [0] * (len(big_arr) + 1))
+            conn.send_bytes(big_arr)
+            self.assertEqual(conn.recv_bytes_into(buffer, buffer.itemsize),
+                             len(big_arr) * buffer.itemsize)
+            self.assertEqual(buffer[1:], big_arr)
+
         conn.send_bytes(SENTINEL)                          # tell child to quit
         child_conn.close()
 
@@ -3948,6 +3960,20 @@ def test_connection(self):
 
         p.join()
 
+    def test_recv_truncated_message(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        for size in (100, 1024 * 1024):
+            with self.subTest(size=size):
+                r, w = os.pipe()
+                reader = multiprocessing.connection.Connection(r, writable=False)
+                self.addCleanup(reader.close)
+                os.write(w, struct.pack("!i", size) + b'x' * 10)
+                os.close(w)
+                with self.assertRaisesRegex(OSError, 'end of file'):
+                    reader.recv_bytes()
+
     def test_duplex_false(self):
         reader, writer = self.Pipe(duplex=False)
         self.assertEqual(writer.send(1), None)
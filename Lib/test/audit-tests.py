@@ -776,6 +776,27 @@ def test_import_statement():
         actual,
     )
 
+
+def test_lazy_import():
+    code = compile("lazy import test.audit_test_data.submodule\n"
+                   "lazy from pythoninfo import collect_sys\n",
+                   "lazy_module.py", "exec")
+    namespace = {}
+    exec(code, namespace)
+
+    with TestHook() as hook:
+        # Using the names reifies the lazy imports.
+        exec("test; collect_sys", namespace)
+
+    actual = [a for e, a in hook.seen if e == "import.lazy"]
+    assertSequenceEqual(
+        [
+            ("test.audit_test_data.submodule", None, "lazy_module.py", 1),
+            ("pythoninfo", "collect_sys", "lazy_module.py", 2),
+        ],
+        actual,
+    )
+
 if __name__ == "__main__":
     from test.support import suppress_msvcrt_asserts
 
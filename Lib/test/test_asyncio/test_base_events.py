@@ -2,7 +2,6 @@
 
 import concurrent.futures
 import errno
-import math
 import platform
 import socket
 import sys
@@ -402,21 +401,17 @@ def test_thread(loop, debug, create_loop=False):
         test_thread(self.loop, False, create_loop=True)
 
     def test__run_once(self):
-        h1 = asyncio.TimerHandle(time.monotonic() + 5.0, lambda: True, (),
-                                 self.loop, None)
-        h2 = asyncio.TimerHandle(time.monotonic() + 10.0, lambda: True, (),
-                                 self.loop, None)
+        h1 = self.loop.call_at(time.monotonic() + 5.0, lambda: True)
+        h2 = self.loop.call_at(time.monotonic() + 10.0, lambda: True)
 
         h1.cancel()
 
         self.loop._process_events = mock.Mock()
-        self.loop._scheduled.append(h1)
-        self.loop._scheduled.append(h2)
         self.loop._run_once()
 
         t = self.loop._selector.select.call_args[0][0]
         self.assertTrue(9.5 < t < 10.5, t)
-        self.assertEqual([h2], self.loop._scheduled)
+        self.assertEqual([h2], list(self.loop._scheduled))
         self.assertTrue(self.loop._process_events.called)
 
     def test_set_debug(self):
@@ -434,11 +429,9 @@ def cb(loop):
             processed = True
             handle = loop.call_soon(lambda: True)
 
-        h = asyncio.TimerHandle(time.monotonic() - 1, cb, (self.loop,),
-                                self.loop, None)
+        self.loop.call_at(time.monotonic() - 1, cb, self.loop)
 
         self.loop._process_events = mock.Mock()
-        self.loop._scheduled.append(h)
         self.loop._run_once()
 
         self.assertTrue(processed)
@@ -447,78 +440,37 @@ def cb(loop):
     def test__run_once_cancelled_event_cleanup(self):
         self.loop._process_events = mock.Mock()
 
-        self.assertTrue(
-            0 < base_events._MIN_CANCELLED_TIMER_HANDLES_FRACTION < 1.0)
-
         def cb():
             pass
 
-        # Set up one "blocking" event that will not be cancelled to
-        # ensure later cancelled events do not make it to the head
-        # of the queue and get cleaned.
-        not_cancelled_count = 1
-        self.loop.call_later(3000, cb)
-
-        # Add less than threshold (base_events._MIN_SCHEDULED_TIMER_HANDLES)
-        # cancelled handles, ensure they aren't removed
-
-        cancelled_count = 2
-        for x in range(2):
-            h = self.loop.call_later(3600, cb)
+        # Cancelled handles are removed from the scheduled timers
+        # immediately, wherever they are in the queue.
+        not_cancelled = [self.loop.call_later(delay, cb)
+                         for delay in (3000, 100, 3600)]
+        cancelled = [self.loop.call_later(delay, cb)
+                     for delay in (50, 3600, 100, 5000)]
+        self.assertEqual(len(self.loop._scheduled), 7)
+        for h in cancelled:
             h.cancel()
-
-        # Add some cancelled events that will be at head and removed
-        cancelled_count += 2
-        for x in range(2):
-            h = self.loop.call_later(100, cb)
             h.cancel()
-
-        # This test is invalid if _MIN_SCHEDULED_TIMER_HANDLES is too low
-        self.assertLessEqual(cancelled_count + not_cancelled_count,
-            base_events._MIN_SCHEDULED_TIMER_HANDLES)
-
-        self.assertEqual(self.loop._timer_cancelled_count, cancelled_count)
+        self.assertEqual(len(self.loop._scheduled), 3)
+        self.assertEqual(set(self.loop._scheduled), set(not_cancelled))
+        self.assertIs(self.loop._scheduled.peek(), not_cancelled[1])
 
         self.loop._run_once()
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertTrue(99 < t <= 100, t)
+        self.assertEqual(len(self.loop._scheduled), 3)
 
-        cancelled_count -= 2
-
-        self.assertEqual(self.loop._timer_cancelled_count, cancelled_count)
-
-        self.assertEqual(len(self.loop._scheduled),
-            cancelled_count + not_cancelled_count)
-
-        # Need enough events to pass _MIN_CANCELLED_TIMER_HANDLES_FRACTION
-        # so that deletion of cancelled events will occur on next _run_once
-        add_cancel_count = int(math.ceil(
-            base_events._MIN_SCHEDULED_TIMER_HANDLES *
-            base_events._MIN_CANCELLED_TIMER_HANDLES_FRACTION)) + 1
-
-        add_not_cancel_count = max(base_events._MIN_SCHEDULED_TIMER_HANDLES -
-            add_cancel_count, 0)
-
-        # Add some events that will not be cancelled
-        not_cancelled_count += add_not_cancel_count
-        for x in range(add_not_cancel_count):
-            self.loop.call_later(3600, cb)
-
-        # Add enough cancelled events
-        cancelled_count += add_cancel_count
-        for x in range(add_cancel_count):
-            h = self.loop.call_later(3600, cb)
-            h.cancel()
-
-        # Ensure all handles are still scheduled
-        self.assertEqual(len(self.loop._scheduled),
-            cancelled_count + not_cancelled_count)
-
+        # Cancelling a handle which already ran or whose loop is closed
+        # is a no-op.
+        h = self.loop.call_later(-1, cb)
         self.loop._run_once()
-
-        # Ensure cancelled events were removed
-        self.assertEqual(len(self.loop._scheduled), not_cancelled_count)
-
-        # Ensure only uncancelled events remain scheduled
-        self.assertTrue(all([not x._cancelled for x in self.loop._scheduled]))
+        self.assertEqual(len(self.loop._scheduled), 3)
+        h.cancel()
+        self.loop.close()
+        self.assertEqual(len(self.loop._scheduled), 0)
+        not_cancelled[0].cancel()
 
     def test_run_until_complete_type_error(self):
         self.assertRaises(TypeError,
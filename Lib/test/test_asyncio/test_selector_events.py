@@ -655,6 +655,71 @@ def test_read_ready(self):
 
         self.protocol.data_received.assert_called_with(b'data')
 
+    def test_read_ready_full_buffer(self):
+        transport = self.socket_transport()
+        transport.max_size = 4
+
+        # A full read is followed by another read in the same event.
+        self.sock.recv.side_effect = [b'data', b'ab', b'unused']
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recv.call_count, 2)
+        self.protocol.data_received.assert_has_calls(
+            [mock.call(b'data'), mock.call(b'ab')])
+
+    def test_read_ready_full_buffer_limit(self):
+        transport = self.socket_transport()
+        transport.max_size = 4
+
+        self.sock.recv.return_value = b'data'
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recv.call_count,
+                         asyncio.constants.MAX_READS_PER_EVENT)
+
+    def test_read_ready_full_buffer_tryagain(self):
+        transport = self.socket_transport()
+        transport.max_size = 4
+        transport._fatal_error = mock.Mock()
+
+        self.sock.recv.side_effect = [b'data', BlockingIOError]
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recv.call_count, 2)
+        self.protocol.data_received.assert_called_once_with(b'data')
+        self.assertFalse(transport._fatal_error.called)
+
+    def test_read_ready_full_buffer_paused(self):
+        transport = self.socket_transport()
+        transport.max_size = 4
+
+        self.sock.recv.return_value = b'data'
+        self.protocol.data_received.side_effect = (
+            lambda data: transport.pause_reading())
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recv.call_count, 1)
+
+    def test_read_ready_full_buffer_set_protocol(self):
+        transport = self.socket_transport()
+        transport.max_size = 4
+        transport._fatal_error = mock.Mock()
+        buffered = mock.Mock(asyncio.BufferedProtocol)
+        buffered.get_buffer.return_value = bytearray(4)
+
+        # The next read uses the method of the new protocol.
+        self.sock.recv.return_value = b'data'
+        self.protocol.data_received.side_effect = (
+            lambda data: transport.set_protocol(buffered))
+        transport._read_ready()
+        self.assertEqual(self.sock.recv.call_count, 1)
+        self.assertFalse(transport._fatal_error.called)
+
+        self.sock.recv_into.return_value = 2
+        transport._read_ready()
+        buffered.buffer_updated.assert_called_once_with(2)
+        self.assertFalse(transport._fatal_error.called)
+
     def test_read_ready_eof(self):
         transport = self.socket_transport()
         transport.close = mock.Mock()
@@ -1256,6 +1321,46 @@ def test_read_ready(self):
         self.protocol.get_buffer.assert_called_with(-1)
         self.protocol.buffer_updated.assert_called_with(10)
 
+    def test_read_ready_full_buffer(self):
+        transport = self.socket_transport()
+        self.buf = bytearray(4)
+
+        self.sock.recv_into.side_effect = [4, 2, 4]
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recv_into.call_count, 2)
+        self.protocol.buffer_updated.assert_has_calls(
+            [mock.call(4), mock.call(2)])
+
+    def test_read_ready_full_buffer_closed(self):
+        transport = self.socket_transport()
+        self.buf = bytearray(4)
+
+        self.sock.recv_into.return_value = 4
+        self.protocol.buffer_updated.side_effect = (
+            lambda nbytes: transport.close())
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recv_into.call_count, 1)
+
+    def test_read_ready_full_buffer_set_protocol(self):
+        transport = self.socket_transport()
+        transport._fatal_error = mock.Mock()
+        self.buf = bytearray(4)
+        protocol = mock.Mock(asyncio.Protocol)
+
+        self.sock.recv_into.return_value = 4
+        self.protocol.buffer_updated.side_effect = (
+            lambda nbytes: transport.set_protocol(protocol))
+        transport._read_ready()
+        self.assertEqual(self.sock.recv_into.call_count, 1)
+        self.assertFalse(transport._fatal_error.called)
+
+        self.sock.recv.return_value = b'ab'
+        transport._read_ready()
+        protocol.data_received.assert_called_once_with(b'ab')
+        self.assertFalse(transport._fatal_error.called)
+
     def test_read_ready_eof(self):
         transport = self.socket_transport()
         transport.close = mock.Mock()
@@ -1346,6 +1451,41 @@ def test_read_ready(self):
         self.protocol.datagram_received.assert_called_with(
             b'data', ('0.0.0.0', 1234))
 
+    def test_read_ready_multiple(self):
+        transport = self.datagram_transport()
+
+        self.sock.recvfrom.side_effect = [
+            (b'data1', ('0.0.0.0', 1234)),
+            (b'data2', ('0.0.0.0', 1235)),
+            BlockingIOError,
+        ]
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recvfrom.call_count, 3)
+        self.protocol.datagram_received.assert_has_calls([
+            mock.call(b'data1', ('0.0.0.0', 1234)),
+            mock.call(b'data2', ('0.0.0.0', 1235)),
+        ])
+
+    def test_read_ready_limit(self):
+        transport = self.datagram_transport()
+
+        self.sock.recvfrom.return_value = (b'data', ('0.0.0.0', 1234))
+        transport._read_ready()
+
+        self.assertEqual(self.protocol.datagram_received.call_count,
+                         asyncio.constants.MAX_READS_PER_EVENT)
+
+    def test_read_ready_paused(self):
+        transport = self.datagram_transport()
+
+        self.sock.recvfrom.return_value = (b'data', ('0.0.0.0', 1234))
+        self.protocol.datagram_received.side_effect = (
+            lambda data, addr: transport.pause_reading())
+        transport._read_ready()
+
+        self.assertEqual(self.sock.recvfrom.call_count, 1)
+
     def test_transport_inheritance(self):
         transport = self.datagram_transport()
         self.assertIsInstance(transport, asyncio.DatagramTransport)
@@ -2,10 +2,12 @@
 
 import asyncio
 import errno
+import io
 import os
 import socket
 import sys
 import tempfile
+import threading
 import unittest
 from asyncio import base_events
 from asyncio import constants
@@ -489,6 +491,73 @@ def test_sendfile_ssl_partial(self):
         self.assertEqual(srv_proto.data, self.DATA[1000:1100])
         self.assertEqual(self.file.tell(), 1100)
 
+    def test_sendfile_ssl_block_order(self):
+        # The fallback reads the next block while sending the current one;
+        # blocks must be sent in order and not overwritten while in use.
+        data = bytes(range(256)) * 1024
+        file = io.BytesIO(data)
+        srv_proto, cli_proto = self.prepare_sendfile(is_ssl=True)
+        ret = self.run_loop(
+            self.loop.sendfile(cli_proto.transport, file, 100,
+                               len(data) - 1000))
+        cli_proto.transport.close()
+        self.run_loop(srv_proto.done)
+        self.assertEqual(ret, len(data) - 1000)
+        self.assertEqual(srv_proto.data, data[100:-900])
+        self.assertEqual(file.tell(), len(data) - 900)
+
+    def test_sendfile_ssl_cancel_during_read(self):
+        # Cancelling the fallback while it reads the next block waits for
+        # the read before moving the file position, and restores the
+        # protocol of the transport.
+        reading = threading.Event()
+        release = threading.Event()
+        reads = []
+        seeks_during_read = []
+
+        class SlowFile(io.BytesIO):
+            in_read = False
+
+            def readinto(self, b):
+                self.in_read = True
+                if self.tell():
+                    reading.set()
+                    release.wait(support.SHORT_TIMEOUT)
+                n = super().readinto(b)
+                reads.append(n)
+                self.in_read = False
+                return n
+
+            def seek(self, *args):
+                if self.in_read:
+                    seeks_during_read.append(args)
+                return super().seek(*args)
+
+        file = SlowFile(b'x' * (constants.SENDFILE_FALLBACK_READBUFFER_SIZE
+                                * 4))
+        srv_proto, cli_proto = self.prepare_sendfile(is_ssl=True)
+        transport = cli_proto.transport
+
+        async def cancel_sendfile():
+            task = self.loop.create_task(self.loop.sendfile(transport, file))
+            await self.loop.run_in_executor(None, reading.wait,
+                                            support.SHORT_TIMEOUT)
+            task.cancel()
+            self.loop.call_later(0.1, release.set)
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        self.run_loop(cancel_sendfile())
+        self.assertEqual(len(reads), 2)
+        self.assertFalse(file.in_read)
+        self.assertEqual(seeks_during_read, [])
+        self.assertIs(transport.get_protocol(), cli_proto)
+        self.assertTrue(transport.is_reading())
+        transport.close()
+        self.run_loop(srv_proto.done)
+        self.assertEqual(srv_proto.nbytes,
+                         constants.SENDFILE_FALLBACK_READBUFFER_SIZE)
+
     def test_sendfile_close_peer_after_receiving(self):
         srv_proto, cli_proto = self.prepare_sendfile(
             close_after=len(self.DATA))
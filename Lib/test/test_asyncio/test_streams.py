@@ -62,6 +62,68 @@ def test_open_unix_connection(self):
             conn_fut = asyncio.open_unix_connection(httpd.address)
             self._basetest_open_connection(conn_fut)
 
+    def test_open_connection_buffered_protocol(self):
+        # The stream helpers receive into a reusable buffer; data larger
+        # than that buffer must still arrive intact and in order.
+        data = bytes(range(256)) * 1024
+
+        async def handle(reader, writer):
+            writer.write(data)
+            await writer.drain()
+            writer.close()
+            await writer.wait_closed()
+
+        async def main():
+            server = await asyncio.start_server(
+                handle, socket_helper.HOSTv4, 0)
+            async with server:
+                addr = server.sockets[0].getsockname()
+                reader, writer = await asyncio.open_connection(*addr)
+                self.assertIsInstance(writer.transport.get_protocol(),
+                                      asyncio.BufferedProtocol)
+                received = await reader.read()
+                writer.close()
+                await writer.wait_closed()
+            return received
+
+        self.assertEqual(self.loop.run_until_complete(main()), data)
+
+    def test_open_connection_shared_buffer(self):
+        # The connections of a loop share one receive buffer; data read
+        # concurrently on several connections must not be mixed up.
+        async def handle(reader, writer):
+            n = (await reader.readexactly(1))[0]
+            for _ in range(64):
+                writer.write(bytes([n]) * 4096)
+                await writer.drain()
+                await asyncio.sleep(0)
+            writer.close()
+            await writer.wait_closed()
+
+        async def client(addr, n):
+            reader, writer = await asyncio.open_connection(*addr)
+            writer.write(bytes([n]))
+            received = await reader.read()
+            protocol = writer.transport.get_protocol()
+            writer.close()
+            await writer.wait_closed()
+            return protocol, received
+
+        async def main():
+            server = await asyncio.start_server(
+                handle, socket_helper.HOSTv4, 0)
+            async with server:
+                addr = server.sockets[0].getsockname()
+                return await asyncio.gather(*[client(addr, n)
+                                              for n in range(1, 5)])
+
+        results = self.loop.run_until_complete(main())
+        for n, (protocol, received) in enumerate(results, 1):
+            self.assertEqual(received, bytes([n]) * 4096 * 64)
+        buffers = {id(protocol.get_buffer(-1).obj)
+                   for protocol, received in results}
+        self.assertEqual(len(buffers), 1)
+
     def _basetest_open_connection_no_loop_ssl(self, open_connection_fut):
         messages = []
         self.loop.set_exception_handler(lambda loop, ctx: messages.append(ctx))
@@ -343,5 +343,8 @@ def test_builtin__import__(self):
     def test_import_statement(self):
         self.do_test("test_import_statement")
 
+    def test_lazy_import(self):
+        self.do_test("test_lazy_import")
+
 if __name__ == "__main__":
     unittest.main()
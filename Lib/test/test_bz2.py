@@ -261,6 +261,15 @@ def testWrite(self):
         with open(self.filename, 'rb') as f:
             self.assertEqual(ext_decompress(f.read()), self.TEXT)
 
+    def testWriteWorkers(self):
+        with support.swap_attr(bz2, '_PARALLEL_BLOCK_UNIT', 100):
+            with BZ2File(self.filename, "w", workers=3) as bz2f:
+                for i in range(0, len(self.TEXT), 70):
+                    bz2f.write(self.TEXT[i:i + 70])
+        with BZ2File(self.filename) as bz2f:
+            self.assertEqual(bz2f.read(), self.TEXT)
+        self.assertRaises(ValueError, BZ2File, self.filename, "w", workers=-1)
+
     def testWriteChunks10(self):
         with BZ2File(self.filename, "w") as bz2f:
             n = 0
@@ -1070,6 +1079,16 @@ def testCompressEmptyString(self):
         text = bz2.compress(b'')
         self.assertEqual(text, self.EMPTY_DATA)
 
+    def testCompressWorkers(self):
+        with support.swap_attr(bz2, '_PARALLEL_BLOCK_UNIT', 100):
+            for workers in (0, 2, 4):
+                data = bz2.compress(self.TEXT, workers=workers)
+                self.assertEqual(bz2.decompress(data), self.TEXT)
+                self.assertEqual(ext_decompress(data), self.TEXT)
+            self.assertEqual(bz2.decompress(bz2.compress(b'', workers=2)), b'')
+        self.assertRaises(ValueError, bz2.compress, self.TEXT, workers=-1)
+        self.assertRaises(ValueError, bz2.compress, self.TEXT, 0, workers=2)
+
     def testDecompress(self):
         text = bz2.decompress(self.DATA)
         self.assertEqual(text, self.TEXT)
@@ -12,6 +12,7 @@
 import string
 import sys
 from test import support
+from test.support import script_helper
 from test.support.import_helper import import_fresh_module
 import types
 import unittest
@@ -19,6 +20,7 @@
 from collections import namedtuple, Counter, OrderedDict, _count_elements
 from collections import UserDict, UserString, UserList
 from collections import ChainMap
+from collections import SortedList, SortedSet, SortedDict
 from collections import deque
 from collections.abc import Awaitable, Coroutine
 from collections.abc import AsyncIterator, AsyncIterable, AsyncGenerator
@@ -2476,6 +2478,263 @@ def test_symmetric_difference(self):
             self.assertEqual(pp, r)
 
 
+################################################################################
+### SortedList, SortedSet, SortedDict
+################################################################################
+
+class TestSortedList(unittest.TestCase):
+
+    def check(self, sl, expected):
+        self.assertEqual(len(sl), len(expected))
+        self.assertEqual(list(sl), expected)
+        self.assertEqual(list(reversed(sl)), expected[::-1])
+
+    def test_basics(self):
+        sl = SortedList([5, 1, 4, 1])
+        self.check(sl, [1, 1, 4, 5])
+        sl.add(3)
+        sl.update([0, 6])
+        self.check(sl, [0, 1, 1, 3, 4, 5, 6])
+        self.assertIn(4, sl)
+        self.assertNotIn(2, sl)
+        self.assertEqual(sl[0], 0)
+        self.assertEqual(sl[-1], 6)
+        self.assertEqual(sl[1:4], [1, 1, 3])
+        self.assertEqual(sl[::-2], [6, 4, 1, 0])
+        self.assertRaises(IndexError, sl.__getitem__, 7)
+        self.assertRaises(IndexError, sl.__getitem__, -8)
+        self.assertEqual(sl.index(1), 1)
+        self.assertEqual(sl.index(1, 2), 2)
+        self.assertRaises(ValueError, sl.index, 1, 3)
+        self.assertRaises(ValueError, sl.index, 2)
+        self.assertEqual(sl.count(1), 2)
+        self.assertEqual(sl.count(2), 0)
+        self.assertEqual(sl.bisect_left(1), 1)
+        self.assertEqual(sl.bisect_right(1), 3)
+        self.assertEqual(sl.bisect(1), 3)
+        sl.remove(1)
+        sl.discard(1)
+        sl.discard(1)
+        self.assertRaises(ValueError, sl.remove, 1)
+        self.check(sl, [0, 3, 4, 5, 6])
+        self.assertEqual(sl.pop(), 6)
+        self.assertEqual(sl.pop(0), 0)
+        self.assertRaises(IndexError, sl.pop, 3)
+        del sl[1]
+        self.check(sl, [3, 5])
+        sl.clear()
+        self.check(sl, [])
+        self.assertRaises(IndexError, sl.pop)
+        self.assertIsInstance(sl, Sequence)
+        self.assertNotIsInstance(sl, MutableSequence)
+
+    def test_imported_on_first_use(self):
+        code = '''if 1:
+            import collections, sys
+            assert 'collections._sorted' not in sys.modules
+            assert 'SortedList' in dir(collections)
+            from collections import SortedList
+            assert 'collections._sorted' in sys.modules
+            assert SortedList is sys.modules['collections._sorted'].SortedList
+            assert collections.SortedDict([(1, 2)]) == {1: 2}
+        '''
+        script_helper.assert_python_ok('-c', code)
+        with self.assertRaises(AttributeError):
+            collections.SortedTuple
+
+    def test_key(self):
+        sl = SortedList(['bb', 'a', 'ccc', 'D'], key=str.lower)
+        self.assertIs(sl.key, str.lower)
+        self.check(sl, ['a', 'bb', 'ccc', 'D'])
+        self.assertEqual(sl.bisect_left('B'), 1)
+        self.assertEqual(sl.bisect_right('BB'), 2)
+        self.assertEqual(list(sl.irange('b', 'D')), ['bb', 'ccc', 'D'])
+        self.assertNotIn('A', sl)
+        self.assertEqual(sl.count('A'), 0)
+        sl.remove('D')
+        self.check(sl, ['a', 'bb', 'ccc'])
+
+    def test_random(self):
+        # Enough values to split and merge the internal sublists
+        sl = SortedList()
+        expected = []
+        for i in range(6000):
+            value = randrange(1000)
+            op = randrange(5)
+            if op < 3:
+                sl.add(value)
+                expected.append(value)
+                expected.sort()
+            elif op == 3 and expected:
+                value = choice(expected)
+                sl.remove(value)
+                expected.remove(value)
+            elif expected:
+                index = randrange(-len(expected), len(expected))
+                self.assertEqual(sl.pop(index), expected.pop(index))
+        self.check(sl, expected)
+        for i in range(0, len(expected), 97):
+            self.assertEqual(sl[i], expected[i])
+        self.assertEqual(sl[50:2500:3], expected[50:2500:3])
+        del sl[100:2000:2]
+        del expected[100:2000:2]
+        self.check(sl, expected)
+        while expected:
+            sl.remove(expected.pop(randrange(len(expected))))
+        self.check(sl, [])
+
+    def test_equal_keys_across_sublists(self):
+        values = list(range(5000))
+        sl = SortedList(reversed(values), key=lambda x: x // 2500)
+        self.assertEqual(list(map(sl.key, sl)), sorted(map(sl.key, values)))
+        self.assertEqual(sorted(sl), values)
+        for value in (0, 2499, 2500, 4999, 1234, 3333):
+            self.assertIn(value, sl)
+            self.assertEqual(sl[sl.index(value)], value)
+            self.assertEqual(sl.count(value), 1)
+        self.assertNotIn(5000, sl)
+        for value in range(0, 5000, 7):
+            sl.remove(value)
+        self.assertEqual(set(sl), set(values) - set(range(0, 5000, 7)))
+
+    def test_irange(self):
+        sl = SortedList(range(0, 3000, 3))
+        self.assertEqual(list(sl.irange(10, 20)), [12, 15, 18])
+        self.assertEqual(list(sl.irange(12, 18)), [12, 15, 18])
+        self.assertEqual(list(sl.irange(12, 18, inclusive=(False, False))),
+                         [15])
+        self.assertEqual(list(sl.irange(12, 18, reverse=True)), [18, 15, 12])
+        self.assertEqual(list(sl.irange(maximum=6)), [0, 3, 6])
+        self.assertEqual(list(sl.irange(2990)), [2991, 2994, 2997])
+        self.assertEqual(list(sl.irange(20, 10)), [])
+        self.assertEqual(list(sl.irange(1000, 2000)),
+                         list(range(1002, 2001, 3)))
+        self.assertEqual(list(sl.irange(1000, 2000, reverse=True)),
+                         list(range(1998, 1001, -3)))
+
+    def test_copy_repr_eq(self):
+        sl = SortedList([3, 1, 2])
+        self.assertEqual(repr(sl), 'SortedList([1, 2, 3])')
+        self.assertEqual(repr(SortedList(key=abs)),
+                         'SortedList([], key=<built-in function abs>)')
+        for dup in (sl.copy(), copy.copy(sl), copy.deepcopy(sl),
+                    pickle.loads(pickle.dumps(sl))):
+            self.assertIsNot(dup, sl)
+            self.assertEqual(dup, sl)
+            dup.add(0)
+            self.assertNotEqual(dup, sl)
+        self.assertNotEqual(sl, [1, 2, 3])
+        self.assertRaises(TypeError, hash, sl)
+        self.assertEqual(SortedList[int].__origin__, SortedList)
+
+
+class TestSortedSet(unittest.TestCase):
+
+    def test_basics(self):
+        ss = SortedSet('abracadabra')
+        self.assertEqual(list(ss), ['a', 'b', 'c', 'd', 'r'])
+        self.assertEqual(len(ss), 5)
+        self.assertEqual(ss[1], 'b')
+        self.assertEqual(ss[-2:], ['d', 'r'])
+        self.assertEqual(ss.index('c'), 2)
+        self.assertRaises(ValueError, ss.index, 'z')
+        self.assertEqual(ss.count('a'), 1)
+        self.assertEqual(list(ss.irange('b', 'd')), ['b', 'c', 'd'])
+        ss.add('a')
+        ss.add('e')
+        self.assertEqual(list(ss), ['a', 'b', 'c', 'd', 'e', 'r'])
+        ss.discard('b')
+        ss.remove('c')
+        self.assertRaises(KeyError, ss.remove, 'c')
+        self.assertEqual(ss.pop(), 'r')
+        self.assertEqual(ss.pop(0), 'a')
+        del ss[0]
+        self.assertEqual(list(ss), ['e'])
+        self.assertNotIn('d', ss)
+        ss.update('xyx')
+        self.assertEqual(list(reversed(ss)), ['y', 'x', 'e'])
+        del ss[:2]
+        self.assertEqual(list(ss), ['y'])
+        self.assertEqual(ss, {'y'})
+        ss.clear()
+        self.assertEqual(len(ss), 0)
+        self.assertIsInstance(ss, MutableSet)
+        self.assertIsInstance(ss, Sequence)
+
+    def test_set_operations(self):
+        ss = SortedSet([3, -1, 2], key=abs)
+        self.assertEqual(list(ss), [-1, 2, 3])
+        union = ss | {-4}
+        self.assertIsInstance(union, SortedSet)
+        self.assertIs(union.key, abs)
+        self.assertEqual(list(union), [-1, 2, 3, -4])
+        self.assertEqual(list(ss & {2, 3, 5}), [2, 3])
+        self.assertEqual(list(ss - {2}), [-1, 3])
+        self.assertEqual(list(ss ^ {2, 4}), [-1, 3, 4])
+        self.assertLess(SortedSet([2]), ss)
+        ss |= {0}
+        self.assertEqual(list(ss), [0, -1, 2, 3])
+        self.assertEqual(repr(ss), 'SortedSet([0, -1, 2, 3], '
+                                   'key=<built-in function abs>)')
+        self.assertEqual(ss.copy(), ss)
+        self.assertRaises(TypeError, hash, ss)
+
+
+class TestSortedDict(unittest.TestCase):
+
+    def test_basics(self):
+        sd = SortedDict({'b': 2, 'a': 1})
+        sd['c'] = 3
+        sd['a'] = 0
+        self.assertEqual(list(sd), ['a', 'b', 'c'])
+        self.assertEqual(list(sd.keys()), ['a', 'b', 'c'])
+        self.assertEqual(list(sd.values()), [0, 2, 3])
+        self.assertEqual(list(sd.items()), [('a', 0), ('b', 2), ('c', 3)])
+        self.assertEqual(list(reversed(sd.items())),
+                         [('c', 3), ('b', 2), ('a', 0)])
+        self.assertEqual(sd, {'a': 0, 'b': 2, 'c': 3})
+        self.assertEqual(sd.peekitem(), ('c', 3))
+        self.assertEqual(sd.peekitem(0), ('a', 0))
+        self.assertEqual(sd.index('b'), 1)
+        self.assertRaises(ValueError, sd.index, 'd')
+        self.assertEqual(sd.bisect_left('b'), 1)
+        self.assertEqual(sd.bisect_right('b'), 2)
+        self.assertEqual(list(sd.irange('b')), ['b', 'c'])
+        self.assertEqual(sd.get('z', 5), 5)
+        self.assertEqual(sd.setdefault('d', 4), 4)
+        self.assertEqual(sd.pop('b'), 2)
+        self.assertEqual(sd.pop('b', None), None)
+        self.assertRaises(KeyError, sd.pop, 'b')
+        del sd['a']
+        self.assertRaises(KeyError, sd.__delitem__, 'a')
+        self.assertEqual(sd.popitem(), ('d', 4))
+        self.assertEqual(sd.popitem(0), ('c', 3))
+        self.assertRaises(KeyError, sd.popitem)
+        self.assertEqual(repr(sd), 'SortedDict({})')
+        self.assertIsInstance(sd, MutableMapping)
+
+    def test_update(self):
+        sd = SortedDict([(3, 'c'), (1, 'a'), (3, 'C')], key=lambda k: -k)
+        sd.update({2: 'b'})
+        sd.update(UserDict({1: 'A'}))
+        self.assertEqual(list(sd.items()), [(3, 'C'), (2, 'b'), (1, 'A')])
+        self.assertRaises(TypeError, sd.update, x=None)
+        sd = SortedDict({'b': 1}, key=None)
+        sd.update([('c', 2)], a=3)
+        self.assertEqual(list(sd.items()), [('a', 3), ('b', 1), ('c', 2)])
+        sd = SortedDict(key=lambda k: -k)
+        sd.update((k, str(k)) for k in range(1000))
+        self.assertEqual(list(sd), list(range(999, -1, -1)))
+        self.assertEqual(repr(SortedDict({2: 'b', 1: 'a'})),
+                         "SortedDict({1: 'a', 2: 'b'})")
+        dup = sd.copy()
+        self.assertEqual(dup, sd)
+        self.assertEqual(list(dup), list(sd))
+        sd.clear()
+        self.assertEqual(len(sd), 0)
+        self.assertEqual(len(dup), 1000)
+
+
 def load_tests(loader, tests, pattern):
     tests.addTest(doctest.DocTestSuite(collections))
     return tests
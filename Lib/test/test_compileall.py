@@ -880,6 +880,68 @@ def test_pyc_invalidation_mode(self):
             data = fp.read()
         self.assertEqual(int.from_bytes(data[4:8], 'little'), 0b01)
 
+    def _backdate(self, *dirs):
+        mtime = time.time() - 60
+        for dir in dirs:
+            os.utime(dir, (mtime, mtime))
+
+    def test_path_index(self):
+        index = os.path.join(self.directory, 'index')
+        self.assertRunOK('-q', self.directory)
+        self.assertCompiled(self.barfn)
+        # Recently modified directories are not indexed.
+        self._backdate(self.directory, self.pkgdir)
+        self.assertRunOK('-q', '--path-index', index, self.directory)
+        # Add a module without changing the mtime of the package directory:
+        # it is missing from the index, which is still considered valid.
+        st = os.stat(self.pkgdir)
+        script_helper.make_script(self.pkgdir, 'ham', '')
+        os.utime(self.pkgdir, ns=(st.st_atime_ns, st.st_mtime_ns))
+        code = 'import foo.bar; import foo.ham'
+        script_helper.assert_python_ok('-c', code, PYTHONPATH=self.directory)
+        rc, out, err = script_helper.assert_python_failure(
+            '-c', code, PYTHONPATH=self.directory, PYTHONIMPORTINDEX=index)
+        self.assertIn(b"No module named 'foo.ham'", err)
+        # The index is not used with -E.
+        script_helper.assert_python_ok(
+            '-E', '-c', f'import sys; sys.path.insert(0, {self.directory!r}); '
+            + code, PYTHONIMPORTINDEX=index)
+
+    def test_path_index_racy_directory(self):
+        from importlib._bootstrap_external import _load_path_index
+        index = os.path.join(self.directory, 'index')
+        self._backdate(self.directory)
+        compileall.write_path_index(index, [self.directory])
+        with open(index, 'rb') as f:
+            entries = _load_path_index(f.read())
+        self.assertIn(self.directory, entries)
+        self.assertNotIn(self.pkgdir, entries)
+
+    def test_path_index_write_error(self):
+        index = os.path.join(self.directory, 'missing', 'index')
+        rc, out, err = self.assertRunNotOK('--path-index', index,
+                                           self.directory)
+        self.assertIn(b"Can't write path index", out)
+
+    def test_code_pack(self):
+        pack = os.path.join(self.directory, 'app.pycpack')
+        self.assertRunOK('-q', '--code-pack', pack, self.directory)
+        self.assertCompiled(self.barfn)
+        script_helper.assert_python_ok(
+            '-c', 'import foo.bar; assert foo.bar.__file__.startswith('
+            f'{pack!r})', PYTHONPATH=pack)
+        # Compiling errors are reported, the other modules are packed.
+        script_helper.make_script(self.pkgdir, 'bad', 'def')
+        rc, out, err = self.assertRunNotOK('-q', '--code-pack', pack,
+                                           self.directory)
+        self.assertIn(b'SyntaxError', out)
+        script_helper.assert_python_ok('-c', 'import foo.bar',
+                                       PYTHONPATH=pack)
+
+    def test_code_pack_without_directory(self):
+        rc, out, err = self.assertRunNotOK('--code-pack', 'app.pycpack')
+        self.assertIn(b'--code-pack requires directories', err)
+
     @skipUnless(_have_multiprocessing, "requires multiprocessing")
     def test_workers(self):
         bar2fn = script_helper.make_script(self.directory, 'bar2', '')
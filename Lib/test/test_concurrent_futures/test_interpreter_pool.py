@@ -343,6 +343,20 @@ def test_submit_exception_in_func(self):
                              getattr(Exception, attr))
         self.assertEqual(cause.excinfo.msg, 'spam')
 
+    def test_submit_kwargs(self):
+        fut = self.executor.submit(dict, func=1, args=(2,), kwargs={})
+        self.assertEqual(fut.result(), {'func': 1, 'args': (2,), 'kwargs': {}})
+
+    def test_submit_exception_after_success(self):
+        # The results queue keeps working across calls in the same worker.
+        with self.executor_type(1) as executor:
+            self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+            for msg in ('spam', 'eggs'):
+                fut = executor.submit(fail, ValueError, msg)
+                with self.assertRaisesRegex(ValueError, msg):
+                    fut.result()
+            self.assertEqual(executor.submit(mul, 2, 3).result(), 6)
+
     def test_saturation(self):
         blocker = queues.create()
         executor = self.executor_type(4)
@@ -24,6 +24,37 @@ def record_finished(n):
         self.executor.shutdown(wait=True)
         self.assertCountEqual(finished, range(10))
 
+    def test_map_saturation(self):
+        executor = self.executor_type(4)
+        sem = threading.Semaphore(0)
+        n = 15 * executor._max_workers
+        fs = executor._submit_many(sem.acquire, [()] * n)
+        self.assertEqual(len(fs), n)
+        self.assertEqual(len(executor._threads), executor._max_workers)
+        for i in range(n):
+            sem.release()
+        executor.shutdown(wait=True)
+        self.assertTrue(all(f.result() for f in fs))
+
+    def test_map_after_shutdown(self):
+        self.executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.executor.map(abs, range(10))
+        # Nothing is submitted for empty input.
+        self.assertEqual(list(self.executor.map(abs, [])), [])
+
+    def test_map_submit_override(self):
+        submitted = []
+        class Executor(self.executor_type):
+            def submit(self, fn, /, *args, **kwargs):
+                submitted.append(args)
+                return super().submit(fn, *args, **kwargs)
+
+        with Executor(2) as executor:
+            results = list(executor.map(mul, [1, 2, 3], [4, 5, 6]))
+        self.assertEqual(results, [4, 10, 18])
+        self.assertEqual(submitted, [(1, 4), (2, 5), (3, 6)])
+
     def test_default_workers(self):
         executor = self.executor_type()
         expected = min(32, (os.process_cpu_count() or 1) + 4)
@@ -768,6 +768,32 @@ def test_compress(self):
                 with gzip.GzipFile(fileobj=io.BytesIO(datac), mode="rb") as f:
                     self.assertEqual(f.read(), data)
 
+    def test_compress_workers(self):
+        data = data1 * 50 + os.urandom(1000) + data2 * 50
+        with mock.patch.object(gzip, '_PARALLEL_BLOCK_SIZE', 1000):
+            for workers in (0, 2, 4):
+                with self.subTest(workers=workers):
+                    datac = gzip.compress(data, workers=workers)
+                    self.assertEqual(gzip.decompress(datac), data)
+                    self.assertEqual(zlib.decompress(datac, 31), data)
+            self.assertEqual(gzip.decompress(gzip.compress(b'', workers=2)),
+                             b'')
+        with self.assertRaises(ValueError):
+            gzip.compress(data1, workers=-1)
+
+    def test_write_workers(self):
+        data = data1 * 50 + os.urandom(1000) + data2 * 50
+        with mock.patch.object(gzip, '_PARALLEL_BLOCK_SIZE', 1000):
+            with gzip.GzipFile(self.filename, 'wb', workers=3) as f:
+                f.write(data1)
+                f.flush()
+                for i in range(0, len(data), 700):
+                    f.write(data[i:i + 700])
+                f.flush(zlib.Z_FULL_FLUSH)
+                f.write(memoryview(data2))
+        with gzip.GzipFile(self.filename, 'rb') as f:
+            self.assertEqual(f.read(), data1 + data + data2)
+
     def test_compress_mtime(self):
         mtime = 123456789
         for data in [data1, data2]:
@@ -26,6 +26,7 @@ def test_py_functions(self):
     def test_c_functions(self):
         for fname in func_names:
             self.assertEqual(getattr(c_heapq, fname).__module__, '_heapq', fname)
+        self.assertEqual(c_heapq.Heap.__module__, '_heapq')
 
 
 def load_tests(loader, tests, ignore):
@@ -412,6 +413,141 @@ class TestHeapC(TestHeap, TestCase):
     module = c_heapq
 
 
+class TestHeapClass:
+
+    def check_drain(self, heap, expected):
+        self.assertEqual(len(heap), len(expected))
+        self.assertEqual(sorted(heap), sorted(expected))
+        result = []
+        while heap:
+            result.append(heap.pop())
+        self.assertEqual(result, sorted(expected))
+
+    def test_push_pop(self):
+        heap = self.module.Heap()
+        self.assertEqual(len(heap), 0)
+        self.assertFalse(heap)
+        self.assertIsNone(heap.key)
+        data = [random.random() for i in range(256)]
+        for item in data:
+            handle = heap.push(item)
+            self.assertIs(handle.item, item)
+            self.assertEqual(heap.peek(), min(data[:len(heap)]))
+        self.check_drain(heap, data)
+        self.assertRaises(IndexError, heap.pop)
+        self.assertRaises(IndexError, heap.peek)
+
+    def test_init(self):
+        for size in range(30):
+            data = [random.randrange(50) for i in range(size)]
+            self.check_drain(self.module.Heap(data), data)
+            self.check_drain(self.module.Heap(iter(data)), data)
+        self.assertRaises(TypeError, self.module.Heap, 10)
+        self.assertRaises(TypeError, self.module.Heap, [], [])
+        self.assertRaises(TypeError, self.module.Heap, [1, 'a', 2])
+
+    def test_key(self):
+        data = [(random.random(), object()) for i in range(100)]
+        heap = self.module.Heap(data[:50], key=itemgetter(0))
+        self.assertIs(heap.key.__class__, itemgetter)
+        for item in data[50:]:
+            heap.push(item)
+        self.assertEqual([heap.pop() for i in range(len(data))],
+                         sorted(data, key=itemgetter(0)))
+        heap = self.module.Heap(key=None)
+        self.assertIsNone(heap.key)
+
+    def test_remove_update(self):
+        heap = self.module.Heap(key=lambda x: -x)
+        handles = {}
+        for i in range(1000):
+            op = random.randrange(4)
+            if op == 0 or not handles:
+                item = random.randrange(100)
+                handles[heap.push(item)] = item
+            elif op == 1:
+                handle = random.choice(list(handles))
+                self.assertEqual(heap.remove(handle), handles.pop(handle))
+                self.assertRaises(ValueError, heap.remove, handle)
+                self.assertRaises(ValueError, heap.update, handle, 1)
+            elif op == 2:
+                handle = random.choice(list(handles))
+                item = random.randrange(100)
+                heap.update(handle, item)
+                self.assertIs(handle.item, item)
+                handles[handle] = item
+            else:
+                self.assertEqual(heap.peek(), max(handles.values()))
+            self.assertEqual(len(heap), len(handles))
+        expected = sorted(handles.values(), reverse=True)
+        self.assertEqual([heap.pop() for i in range(len(heap))], expected)
+
+    def test_invalid_handle(self):
+        heap1 = self.module.Heap()
+        heap2 = self.module.Heap()
+        handle1 = heap1.push(1)
+        handle2 = heap2.push(1)
+        self.assertRaises(ValueError, heap1.remove, handle2)
+        self.assertRaises(ValueError, heap2.update, handle1, 2)
+        self.assertRaises(TypeError, heap1.remove, 1)
+        self.assertRaises(TypeError, heap1.update, None, 1)
+        self.assertEqual(heap1.pop(), 1)
+        self.assertRaises(ValueError, heap1.remove, handle1)
+        self.assertEqual(len(heap2), 1)
+
+    def test_clear(self):
+        heap = self.module.Heap()
+        handles = [heap.push(i) for i in range(10)]
+        heap.clear()
+        self.assertEqual(len(heap), 0)
+        self.assertEqual(list(heap), [])
+        for handle in handles:
+            self.assertRaises(ValueError, heap.remove, handle)
+        handle = heap.push(5)
+        self.assertEqual(heap.remove(handle), 5)
+
+    def test_cmp_err(self):
+        heap = self.module.Heap([3, 1, 2])
+        handle = heap.push(0)
+        self.assertRaises(ZeroDivisionError, heap.push, CmpErr())
+        self.assertEqual(len(heap), 5)
+        self.assertRaises(ZeroDivisionError, heap.update, handle, CmpErr())
+        self.assertEqual(len(heap), 5)
+        # All items are still in the heap
+        items = list(heap)
+        self.assertEqual(sorted(x for x in items if type(x) is int), [1, 2, 3])
+        self.assertEqual([type(x) for x in items].count(CmpErr), 2)
+
+    def test_key_err(self):
+        heap = self.module.Heap(key=lambda x: 1 // x)
+        handle = heap.push(1)
+        self.assertRaises(ZeroDivisionError, heap.push, 0)
+        self.assertRaises(ZeroDivisionError, heap.update, handle, 0)
+        self.assertRaises(ZeroDivisionError, self.module.Heap, [1, 0],
+                          key=heap.key)
+        self.assertIs(handle.item, 1)
+        self.assertEqual(list(heap), [1])
+
+
+class TestHeapClassPython(TestHeapClass, TestCase):
+    module = py_heapq
+
+
+@skipUnless(c_heapq, 'requires _heapq')
+class TestHeapClassC(TestHeapClass, TestCase):
+    module = c_heapq
+
+    def test_comparison_modifying_heap(self):
+        class EvilClass(int):
+            def __lt__(self, other):
+                heap.pop()
+                return NotImplemented
+
+        heap = self.module.Heap([1, 2])
+        self.assertRaises(RuntimeError, heap.push, EvilClass(0))
+        self.assertEqual(len(heap), 3)
+
+
 #==============================================================================
 
 class LenOnly:
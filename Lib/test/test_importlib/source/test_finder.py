@@ -8,6 +8,7 @@
 import stat
 import sys
 import tempfile
+from test.support import swap_item
 from test.support.import_helper import make_legacy_pyc
 import unittest
 
@@ -143,6 +144,35 @@ def test_invalidate_caches(self):
         finder.invalidate_caches()
         self.assertEqual(finder._path_mtime, -1)
 
+    def test_path_index(self):
+        with util.create_modules('mod') as mapping:
+            root = mapping['.root']
+            finder = self.get_finder(root)
+            mtime = os.stat(root).st_mtime
+            index = {finder.path: (mtime, ())}
+            with swap_item(finder._fill_cache.__globals__,
+                           '_path_index', index):
+                # The listing of the directory is taken from the index.
+                self.assertEqual(self._find(finder, 'mod'), self.NOT_FOUND)
+                # The index is ignored if the directory has been modified.
+                index[finder.path] = (mtime - 1, ())
+                finder.invalidate_caches()
+                loader = self._find(finder, 'mod', loader_only=True)
+                self.assertHasAttr(loader, 'exec_module')
+
+    def test_load_path_index(self):
+        namespace = self.machinery.FileFinder._fill_cache.__globals__
+        load = namespace['_load_path_index']
+        dump = namespace['_dump_path_index']
+        index = {'/a': (1.5, ('b', 'c.py')), '/a/b': (2.0, ())}
+        data = dump(index)
+        self.assertEqual(load(data), index)
+        self.assertEqual(load(data[:-1]), {})
+        self.assertEqual(load(b'garbage'), {})
+        self.assertEqual(load(data[:8] + b'\0' + data[9:]), {})
+        self.assertEqual(load(dump({'/a': [1.5, ()]})), {})
+        self.assertEqual(load(dump(['/a'])), {})
+
     # Regression test for http://bugs.python.org/issue14846
     def test_dir_removal_handling(self):
         mod = 'mod'
@@ -452,6 +452,8 @@ def test_machinery(self):
             'AppleFrameworkLoader',
             'BYTECODE_SUFFIXES',
             'BuiltinImporter',
+            'CodePackFinder',
+            'CodePackLoader',
             'DEBUG_BYTECODE_SUFFIXES',
             'EXTENSION_SUFFIXES',
             'ExtensionFileLoader',
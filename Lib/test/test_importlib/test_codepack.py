@@ -0,0 +1,277 @@
+import compileall
+import importlib
+from importlib import machinery
+import os
+import sys
+import traceback
+import unittest
+
+from test.support import import_helper
+from test.support import os_helper
+from test.support import script_helper
+
+
+class CodePackTests(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = self.enterContext(os_helper.temp_dir())
+        self.pack = os.path.join(self.directory, 'app.pycpack')
+        self.src = os.path.join(self.directory, 'src')
+        self.enterContext(import_helper.isolated_modules())
+        self.addCleanup(sys.path_importer_cache.clear)
+        self.addCleanup(importlib.invalidate_caches)
+
+    def write_module(self, relpath, source):
+        path = os.path.join(self.src, *relpath.split('/'))
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(source)
+
+    def write_pack(self, *dirs):
+        success = compileall.write_code_pack(self.pack, dirs or [self.src],
+                                             quiet=2)
+        self.assertTrue(success)
+        importlib.invalidate_caches()
+
+    def import_from_pack(self, name):
+        with import_helper.DirsOnSysPath(self.pack):
+            return importlib.import_module(name)
+
+    def test_import(self):
+        self.write_module('spam.py', 'x = 1\n')
+        self.write_module('pkg/__init__.py', 'from . import sub\n')
+        self.write_module('pkg/sub.py', 'y = 2\n')
+        self.write_module('pkg/sub2/__init__.py', '')
+        self.write_module('pkg/sub2/eggs.py', 'def f():\n    1/0\n')
+        self.write_pack()
+        # The modules are not read from the sources.
+        os_helper.rmtree(self.src)
+
+        spam = self.import_from_pack('spam')
+        self.assertEqual(spam.x, 1)
+        self.assertEqual(spam.__file__, os.path.join(self.pack, 'spam.py'))
+        self.assertIsInstance(spam.__loader__, machinery.CodePackLoader)
+        self.assertFalse(spam.__loader__.is_package('spam'))
+        self.assertIsNone(spam.__loader__.get_source('spam'))
+
+        pkg = self.import_from_pack('pkg')
+        self.assertEqual(pkg.sub.y, 2)
+        self.assertEqual(pkg.__path__, [os.path.join(self.pack, 'pkg')])
+        self.assertTrue(pkg.__loader__.is_package('pkg'))
+
+        eggs = self.import_from_pack('pkg.sub2.eggs')
+        try:
+            eggs.f()
+        except ZeroDivisionError as exc:
+            filename = traceback.extract_tb(exc.__traceback__)[-1].filename
+        self.assertEqual(filename,
+                         os.path.join(self.pack, 'pkg', 'sub2', 'eggs.py'))
+
+    def test_find_spec(self):
+        self.write_module('spam.py', '')
+        self.write_module('pkg/__init__.py', '')
+        self.write_module('pkg/sub.py', '')
+        self.write_pack()
+        finder = machinery.CodePackFinder(self.pack)
+        self.assertEqual(finder.prefix, '')
+        self.assertIsNone(finder.find_spec('eggs'))
+        self.assertIsNone(finder.find_spec('pkg.sub'))
+        spec = finder.find_spec('spam')
+        self.assertEqual(spec.origin, os.path.join(self.pack, 'spam.py'))
+        self.assertIsNone(spec.submodule_search_locations)
+
+        finder = machinery.CodePackFinder(os.path.join(self.pack, 'pkg'))
+        self.assertEqual(finder.prefix, 'pkg')
+        self.assertIsNone(finder.find_spec('spam'))
+        self.assertIsNone(finder.find_spec('sub'))
+        spec = finder.find_spec('pkg.sub')
+        self.assertEqual(spec.origin, os.path.join(self.pack, 'pkg', 'sub.py'))
+
+    def test_precedence(self):
+        other = os.path.join(self.directory, 'other')
+        os.mkdir(other)
+        with open(os.path.join(other, 'spam.py'), 'w') as f:
+            f.write('origin = "other"\n')
+        self.write_module('spam.py', 'origin = "src"\n')
+        self.write_module('eggs.py', 'kind = "module"\n')
+        self.write_module('eggs/__init__.py', 'kind = "package"\n')
+        self.write_module('bad-name.py', '')
+        self.write_module('ham/eggs.py', '')
+        self.write_pack(self.src, other)
+        finder = machinery.CodePackFinder(self.pack)
+        self.assertIsNone(finder.find_spec('bad-name'))
+        # Only regular packages are packed.
+        self.assertIsNone(finder.find_spec('ham'))
+        self.assertEqual(self.import_from_pack('spam').origin, 'src')
+        self.assertEqual(self.import_from_pack('eggs').kind, 'package')
+
+    def test_syntax_error(self):
+        self.write_module('good.py', '')
+        self.write_module('bad.py', 'def\n')
+        success = compileall.write_code_pack(self.pack, [self.src], quiet=2)
+        self.assertFalse(success)
+        finder = machinery.CodePackFinder(self.pack)
+        self.assertIsNotNone(finder.find_spec('good'))
+        self.assertIsNone(finder.find_spec('bad'))
+
+    def test_optimize(self):
+        self.write_module('spam.py', 'assert False\ndebug = __debug__\n')
+        compileall.write_code_pack(self.pack, [self.src], optimize=1, quiet=2)
+        self.assertIs(self.import_from_pack('spam').debug, False)
+
+    def test_invalidate_caches(self):
+        self.write_module('spam.py', 'x = 1\n')
+        self.write_pack()
+        self.assertEqual(self.import_from_pack('spam').x, 1)
+        self.write_module('spam.py', 'x = 2\n')
+        self.write_module('eggs.py', '')
+        # write_pack() invalidates the caches.
+        self.write_pack()
+        del sys.modules['spam']
+        self.assertEqual(self.import_from_pack('spam').x, 2)
+        self.import_from_pack('eggs')
+
+    def test_not_a_code_pack(self):
+        for path in ['', self.directory, self.pack,
+                     os.path.join(self.directory, 'app.pycpackage'),
+                     os.path.join(self.directory, 'app.pycpack.d', 'spam')]:
+            with self.subTest(path=path):
+                with self.assertRaises(ImportError):
+                    machinery.CodePackFinder(path)
+
+    def test_bad_code_pack(self):
+        self.write_module('spam.py', '')
+        self.write_pack()
+        with open(self.pack, 'rb') as f:
+            data = f.read()
+        for bad in [b'', data[:8], b'PYCPACK\x00\0\0\0\0' + data[12:],
+                    data[:17]]:
+            with self.subTest(bad=bad):
+                with open(self.pack, 'wb') as f:
+                    f.write(bad)
+                importlib.invalidate_caches()
+                with self.assertRaises(ImportError):
+                    machinery.CodePackFinder(self.pack)
+
+    def test_truncated(self):
+        self.write_module('spam.py', 'x = 1\n')
+        self.write_pack()
+        finder = machinery.CodePackFinder(self.pack)
+        spec = finder.find_spec('spam')
+        os.truncate(self.pack, os.path.getsize(self.pack) - 1)
+        with self.assertRaises(ImportError):
+            spec.loader.get_code('spam')
+
+    def test_path_hook(self):
+        self.write_module('spam.py', '')
+        self.write_pack()
+        # CodePackFinder is installed by default, even with -S.
+        script_helper.assert_python_ok(
+            '-S', '-c', 'import sys; sys.path.insert(0, sys.argv[1]); '
+            'import spam; assert spam.__file__.startswith(sys.argv[1])',
+            self.pack)
+
+    def test_startup_code_pack(self):
+        self.write_module('spam.py', 'x = "pack"\n')
+        self.write_module('pkg/__init__.py', '')
+        self.write_module('pkg/sub.py', '')
+        self.write_pack()
+        os.mkdir(os.path.join(self.directory, 'path'))
+        script_helper.make_script(os.path.join(self.directory, 'path'),
+                                  'spam', 'x = "path"')
+        code = ('import spam, pkg.sub; print(spam.x, spam.__file__); '
+                'print(pkg.sub.__file__)')
+        # The modules of the code pack are found before sys.path.
+        rc, out, err = script_helper.assert_python_ok(
+            '-c', code, PYTHONCODEPACK=self.pack,
+            PYTHONPATH=os.path.join(self.directory, 'path'))
+        self.assertEqual(out.decode().splitlines(), [
+            f'pack {os.path.join(self.pack, "spam.py")}',
+            os.path.join(self.pack, 'pkg', 'sub.py'),
+        ])
+        # PYTHONCODEPACK is ignored with -E.
+        rc, out, err = script_helper.assert_python_ok(
+            '-E', '-c', 'import sys; sys.path.insert(0, sys.argv[1]); '
+            'import spam; print(spam.x)',
+            os.path.join(self.directory, 'path'), PYTHONCODEPACK=self.pack)
+        self.assertEqual(out.strip(), b'path')
+        # A missing code pack is ignored.
+        script_helper.assert_python_failure(
+            '-c', 'import spam', PYTHONCODEPACK=self.pack + '.missing')
+        rc, out, err = script_helper.assert_python_ok(
+            '-v', '-c', 'pass', PYTHONCODEPACK=self.pack + '.missing')
+        self.assertIn(b'cannot use code pack', err)
+
+    def test_modules(self):
+        self.write_module('spam.py', '')
+        self.write_module('eggs.py', '')
+        self.write_module('pkg/__init__.py', '')
+        self.write_module('pkg/sub.py', '')
+        self.write_module('pkg/sub2.py', '')
+        success = compileall.write_code_pack(self.pack, [self.src], quiet=2,
+                                             modules={'spam', 'pkg.sub'})
+        self.assertTrue(success)
+        finder = machinery.CodePackFinder(self.pack)
+        self.assertIsNotNone(finder.find_spec('spam'))
+        self.assertIsNone(finder.find_spec('eggs'))
+        self.assertIsNotNone(finder.find_spec('pkg'))
+        # Packages are packed with all their submodules.
+        finder = machinery.CodePackFinder(os.path.join(self.pack, 'pkg'))
+        self.assertIsNotNone(finder.find_spec('pkg.sub2'))
+
+    def test_modules_stdlib(self):
+        # Standard library modules are not packed from modules.
+        self.write_module('spam.py', '')
+        self.write_module('json/__init__.py', '')
+        success = compileall.write_code_pack(self.pack, [self.src], quiet=2,
+                                             modules={'spam', 'json.decoder'})
+        self.assertTrue(success)
+        finder = machinery.CodePackFinder(self.pack)
+        self.assertIsNotNone(finder.find_spec('spam'))
+        self.assertIsNone(finder.find_spec('json'))
+
+    def test_modules_changed(self):
+        self.write_module('spam.py', 'x = 1\n')
+        self.write_module('eggs.py', 'x = 1\n')
+        self.write_module('pkg/__init__.py', '')
+        self.write_module('pkg/sub.py', 'x = 1\n')
+        self.write_module('pkg/sub2.py', 'x = 1\n')
+        success = compileall.write_code_pack(
+            self.pack, [self.src], quiet=2,
+            modules={'spam', 'eggs', 'pkg'})
+        self.assertTrue(success)
+        self.write_module('spam.py', 'x = 2  # changed\n')
+        self.write_module('pkg/sub.py', 'x = 2  # changed\n')
+        self.write_module('pkg/new.py', 'x = 2\n')
+        os.unlink(os.path.join(self.src, 'pkg', 'sub2.py'))
+
+        finder = machinery.CodePackFinder(self.pack)
+        self.assertIsNone(finder.find_spec('spam'))
+        self.assertIsNotNone(finder.find_spec('eggs'))
+        pkg_spec = finder.find_spec('pkg')
+        self.assertEqual(pkg_spec.submodule_search_locations,
+                         [os.path.join(self.pack, 'pkg'),
+                          os.path.join(os.path.abspath(self.src), 'pkg')])
+
+        with import_helper.DirsOnSysPath(self.pack, self.src):
+            spam = importlib.import_module('spam')
+            eggs = importlib.import_module('eggs')
+            sub = importlib.import_module('pkg.sub')
+            sub2 = importlib.import_module('pkg.sub2')
+            new = importlib.import_module('pkg.new')
+        # Modified modules are imported from their source file.
+        self.assertEqual(spam.x, 2)
+        self.assertEqual(spam.__file__, os.path.join(self.src, 'spam.py'))
+        self.assertEqual(sub.x, 2)
+        self.assertNotIsInstance(sub.__loader__, machinery.CodePackLoader)
+        self.assertEqual(new.x, 2)
+        # Unchanged modules and modules without a source file are imported
+        # from the code pack.
+        self.assertEqual(eggs.x, 1)
+        self.assertIsInstance(eggs.__loader__, machinery.CodePackLoader)
+        self.assertEqual(sub2.x, 1)
+        self.assertIsInstance(sub2.__loader__, machinery.CodePackLoader)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,6 +9,26 @@ def test_dump(self):
         self.json.dump({}, sio)
         self.assertEqual(sio.getvalue(), '{}')
 
+    def test_dump_large(self):
+        class Stream(StringIO):
+            writes = 0
+            def write(self, s):
+                self.writes += 1
+                return super().write(s)
+
+        obj = [{'key': i, 'values': [i] * 10} for i in range(2000)]
+        sio = Stream()
+        self.json.dump(obj, sio)
+        self.assertEqual(sio.getvalue(), self.dumps(obj))
+        # Small chunks are written together.
+        self.assertLess(sio.writes, len(sio.getvalue()) // 1000)
+
+    def test_dump_partial_output_on_error(self):
+        sio = StringIO()
+        with self.assertRaises(TypeError):
+            self.json.dump([1, 2, object()], sio)
+        self.assertStartsWith(sio.getvalue(), '[1, 2')
+
     def test_dumps(self):
         self.assertEqual(self.dumps({}), '{}')
 
@@ -0,0 +1,279 @@
+import codecs
+import decimal
+from io import BytesIO, StringIO
+from unittest import mock
+from test.test_json import PyTest, CTest
+
+
+DOCS = [
+    1, -2.5e3, 12345678901234567890, 'a"\\\xe9\U0001f600', None, True,
+    [1, [2, {'x': None}]], {'k': [False, 'v']}, [], {},
+]
+
+
+class ChunkedReader:
+    """File-like object returning at most size characters or bytes."""
+
+    def __init__(self, data, size=1):
+        self.file = (StringIO if isinstance(data, str) else BytesIO)(data)
+        self.size = size
+
+    def read(self, size=-1):
+        return self.file.read(self.size)
+
+
+class TestStream:
+    def feed_chunks(self, decoder, text, size):
+        values = []
+        for i in range(0, len(text), size):
+            values.extend(decoder.feed(text[i:i + size]))
+        values.extend(decoder.close())
+        return values
+
+    def test_feed(self):
+        text = '\n'.join(self.dumps(doc) for doc in DOCS) + ' 7 [8]9'
+        expected = DOCS + [7, [8], 9]
+        for size in (1, 2, 3, 7, len(text)):
+            with self.subTest(size=size):
+                decoder = self.json.JSONDecoder()
+                self.assertEqual(self.feed_chunks(decoder, text, size),
+                                 expected)
+
+    def test_feed_incomplete_values(self):
+        decoder = self.json.JSONDecoder()
+        self.assertEqual(decoder.feed(' 12'), [])
+        self.assertEqual(decoder.feed('3.'), [])
+        self.assertEqual(decoder.feed('5e'), [])
+        self.assertEqual(decoder.feed('1 "ab'), [123.5e1])
+        self.assertEqual(decoder.feed('c" tr'), ['abc'])
+        self.assertEqual(decoder.feed('ue -Inf'), [True])
+        self.assertEqual(decoder.feed('inity'), [])
+        self.assertEqual(decoder.close(), [float('-inf')])
+        # The decoder can be reused.
+        self.assertEqual(decoder.feed('[1]'), [[1]])
+        self.assertEqual(decoder.close(), [])
+        self.assertEqual(decoder.close(), [])
+
+    def test_feed_hooks(self):
+        decoder = self.json.JSONDecoder(parse_float=decimal.Decimal,
+                                        object_pairs_hook=list)
+        self.assertEqual(self.feed_chunks(decoder, '{"a": 1.5} 2.5', 2),
+                         [[('a', decimal.Decimal('1.5'))],
+                          decimal.Decimal('2.5')])
+
+    def test_feed_errors(self):
+        for text, msg, pos in [
+            ('[1, 2', "Expecting ',' delimiter", 5),
+            ('[1 2]', "Expecting ',' delimiter", 3),
+            ('"abc', 'Unterminated string starting at', 0),
+            ('tru', 'Expecting value', 0),
+            ('1 x', 'Expecting value', 2),
+            ('{"a" 1}', "Expecting ':' delimiter", 5),
+            ('[1,]', 'Illegal trailing comma before end of array', 2),
+        ]:
+            for size in (1, 2, len(text)):
+                with self.subTest(text=text, size=size):
+                    decoder = self.json.JSONDecoder()
+                    with self.assertRaises(self.JSONDecodeError) as cm:
+                        self.feed_chunks(decoder, text, size)
+                    self.assertEqual(cm.exception.msg, msg)
+                    self.assertEqual(cm.exception.pos, pos)
+                    # The decoder is reset after an error.
+                    self.assertEqual(decoder.feed('[0]'), [[0]])
+
+    def test_feed_error_position(self):
+        decoder = self.json.JSONDecoder()
+        self.assertEqual(decoder.feed('[1]\n[2]\n  '), [[1], [2]])
+        # The error could be caused by the end of the text.
+        self.assertEqual(decoder.feed('[3,]'), [])
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            decoder.close()
+        err = cm.exception
+        self.assertEqual((err.pos, err.lineno, err.colno), (12, 3, 5))
+        self.assertEqual(str(err), 'Illegal trailing comma before end of '
+                                   'array: line 3 column 5 (char 12)')
+
+    def test_feed_keeps_only_the_current_value(self):
+        decoder = self.json.JSONDecoder()
+        for i in range(100):
+            self.assertEqual(decoder.feed('[%d] ' % i), [[i]])
+        self.assertEqual(decoder.feed('["abc", '), [])
+        self.assertLess(len(decoder._stream.buf), 20)
+        self.assertEqual(decoder.feed('1'), [])
+        self.assertEqual(decoder.feed(']'), [['abc', 1]])
+
+    def feed_counting_scans(self, text, size):
+        scan_once = mock.Mock(wraps=self.json.JSONDecoder().scan_once)
+        decoder = self.json.JSONDecoder()
+        decoder.scan_once = scan_once
+        values = []
+        for i in range(0, len(text), size):
+            values.extend(decoder.feed(text[i:i + size]))
+        return values, scan_once.call_count
+
+    def test_feed_large_value(self):
+        # An incomplete value is decoded again once it is closed, or once
+        # the text fed since its start has doubled.
+        value = {'a': ['x' * 100, '"\\'] * 100}
+        text = self.dumps(value)
+        values, scans = self.feed_counting_scans(text, 1)
+        self.assertEqual(values, [value])
+        self.assertLessEqual(scans, len(text).bit_length() + 2)
+
+    def test_feed_large_value_closers(self):
+        # Closing the items of an incomplete array does not decode it again.
+        value = [[i] for i in range(20_000)]
+        text = self.dumps(value)
+        values, scans = self.feed_counting_scans(text + ' [1]', 1024)
+        self.assertEqual(values, [value, [1]])
+        self.assertLessEqual(scans, len(text).bit_length() + 2)
+
+    def test_iterload(self):
+        text = ' '.join(self.dumps(doc) for doc in DOCS)
+        for size in (1, 3, 1000):
+            with self.subTest(size=size):
+                self.assertEqual(
+                    list(self.json.iterload(ChunkedReader(text, size))), DOCS)
+                self.assertEqual(
+                    list(self.json.iterload(
+                        ChunkedReader(text.encode(), size))), DOCS)
+        self.assertEqual(list(self.json.iterload(StringIO(''))), [])
+        self.assertEqual(list(self.json.iterload(BytesIO(b' \n'))), [])
+
+    def test_iterload_path(self):
+        doc = {'meta': {'count': 3, 'skip': [1, {'items': [0]}]},
+               'data': {'items': [{'id': i, 's': 'x' * i} for i in range(20)],
+                        'more': [[1, 2], [3, 4]]}}
+        text = self.dumps(doc)
+        for size in (1, 5, 10000):
+            with self.subTest(size=size):
+                def iterload(path):
+                    return list(self.json.iterload(ChunkedReader(text, size),
+                                                   path=path))
+                self.assertEqual(iterload([]), list(doc.items()))
+                self.assertEqual(iterload(['data', 'items']),
+                                 doc['data']['items'])
+                self.assertEqual(iterload(('data', 'more', 1)), [3, 4])
+                self.assertEqual(iterload(['data', 'items', 2]),
+                                 [('id', 2), ('s', 'xx')])
+                self.assertEqual(iterload(['meta', 'count']), [])
+                self.assertEqual(iterload(['data', 0]), [])
+                self.assertEqual(iterload(['missing']), [])
+        self.assertEqual(list(self.json.iterload(StringIO('[]'), path=())),
+                         [])
+        self.assertEqual(list(self.json.iterload(StringIO(' [1, 2] '),
+                                                 path=())), [1, 2])
+
+    def test_iterload_path_errors(self):
+        for text, msg in [
+            ('', 'Expecting value'),
+            ('[1] [2]', 'Extra data'),
+            ('[1, 2', "Expecting ',' delimiter"),
+            ('[1,]', 'Illegal trailing comma before end of array'),
+            ('{"a": 1,}', 'Illegal trailing comma before end of object'),
+            ('{1: 2}', 'Expecting property name enclosed in double quotes'),
+            ('{"a" 2}', "Expecting ':' delimiter"),
+            ('{"a": }', 'Expecting value'),
+        ]:
+            with self.subTest(text=text):
+                with self.assertRaises(self.JSONDecodeError) as cm:
+                    list(self.json.iterload(ChunkedReader(text), path=()))
+                self.assertEqual(cm.exception.msg, msg)
+
+    def test_iterload_encodings(self):
+        text = self.dumps(DOCS, ensure_ascii=False)
+        for encoding in ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le',
+                         'utf-16-be', 'utf-32', 'utf-32-le', 'utf-32-be'):
+            with self.subTest(encoding=encoding):
+                data = text.encode(encoding)
+                self.assertEqual(
+                    list(self.json.iterload(ChunkedReader(data), path=())),
+                    DOCS)
+        with self.assertRaisesRegex(self.JSONDecodeError, 'BOM'):
+            list(self.json.iterload(StringIO('﻿[]')))
+        with self.assertRaises(TypeError):
+            list(self.json.iterload(mock.Mock(read=lambda size: None)))
+
+    def test_iterload_large_value(self):
+        # Incomplete values are decoded again only when twice as much text
+        # is available.
+        value = ['x' * 100] * 1000
+        text = self.dumps([value, value])
+        scan_once = mock.Mock(wraps=self.json.JSONDecoder().scan_once)
+        class Decoder(self.json.JSONDecoder):
+            def __init__(self, **kw):
+                super().__init__(**kw)
+                self.scan_once = scan_once
+        with mock.patch.object(self.json, '_ITERLOAD_READ_SIZE', 10):
+            self.assertEqual(list(self.json.iterload(StringIO(text), path=(),
+                                                     cls=Decoder)),
+                             [value, value])
+        self.assertLess(scan_once.call_count, 40)
+
+    def test_iterload_hooks(self):
+        self.assertEqual(
+            list(self.json.iterload(StringIO('[1.5, {"a": [2]}]'), path=[],
+                                    parse_float=decimal.Decimal,
+                                    object_hook=sorted, array_hook=tuple)),
+            [decimal.Decimal('1.5'), ['a']])
+
+    def test_lines(self):
+        f = StringIO()
+        self.json.dump_lines(iter(DOCS), f)
+        text = f.getvalue()
+        self.assertEqual(text.count('\n'), len(DOCS))
+        self.assertEqual(text.splitlines(),
+                         [self.dumps(doc) for doc in DOCS])
+        self.assertEqual(list(self.json.load_lines(StringIO(text))), DOCS)
+        self.assertEqual(list(self.json.load_lines(BytesIO(text.encode()))),
+                         DOCS)
+        # Blank lines are ignored.
+        self.assertEqual(list(self.json.load_lines(['1\n', '\n', ' \r\n',
+                                                    '[2]\r\n', '3'])),
+                         [1, [2], 3])
+        self.assertEqual(list(self.json.load_lines([])), [])
+
+    def test_dump_lines_arguments(self):
+        f = StringIO()
+        self.json.dump_lines([{'b': 1, 'a': 'é'}], f, sort_keys=True,
+                             ensure_ascii=False, separators=(',', ':'))
+        self.assertEqual(f.getvalue(), '{"a":"é","b":1}\n')
+        with self.assertRaises(TypeError):
+            self.json.dump_lines([1], StringIO(), indent=2)
+
+    def test_dump_lines_error(self):
+        # The lines before the error are written.
+        f = StringIO()
+        with self.assertRaises(TypeError):
+            self.json.dump_lines([1, [2], object()], f)
+        self.assertEqual(f.getvalue(), '1\n[2]\n')
+
+    def test_dump_lines_buffering(self):
+        f = mock.Mock(wraps=StringIO())
+        self.json.dump_lines([[i] * 100 for i in range(1000)], f)
+        self.assertLess(f.write.call_count, 100)
+        self.assertEqual(list(self.json.load_lines(
+                            StringIO(f.getvalue()))),
+                         [[i] * 100 for i in range(1000)])
+
+    def test_load_lines_errors(self):
+        lines = ['1\n', '\n', '[2,\n', '3\n']
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            list(self.json.load_lines(lines))
+        err = cm.exception
+        self.assertEqual((err.msg, err.lineno, err.colno, err.pos),
+                         ('Expecting value', 4, 1, 7))
+        with self.assertRaises(self.JSONDecodeError) as cm:
+            list(self.json.load_lines(['1\n', '2 3\n']))
+        err = cm.exception
+        self.assertEqual((err.msg, err.lineno, err.colno, err.pos),
+                         ('Extra data', 2, 3, 4))
+        # The lines are decoded lazily.
+        it = self.json.load_lines(['1\n', '[\n'])
+        self.assertEqual(next(it), 1)
+        with self.assertRaises(self.JSONDecodeError):
+            next(it)
+
+
+class TestPyStream(TestStream, PyTest): pass
+class TestCStream(TestStream, CTest): pass
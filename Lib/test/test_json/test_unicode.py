@@ -32,6 +32,21 @@ def test_encoding7(self):
         j = self.dumps(u + "\n", ensure_ascii=False)
         self.assertEqual(j, f'"{u}\\n"')
 
+    def test_encoding_mixed_widths(self):
+        # Escaped strings of different widths appended to the same output
+        items = ['a\n', '\xe9\t', '\N{GREEK SMALL LETTER ALPHA}"',
+                 '\U0001f600\\', 'b\r']
+        self.assertEqual(self.dumps(items, ensure_ascii=False),
+                         '["a\\n", "\xe9\\t", "\N{GREEK SMALL LETTER ALPHA}\\"", '
+                         '"\U0001f600\\\\", "b\\r"]')
+        self.assertEqual(self.dumps(items),
+                         '["a\\n", "\\u00e9\\t", "\\u03b1\\"", '
+                         '"\\ud83d\\ude00\\\\", "b\\r"]')
+        # Non-ASCII separators make the output wider than ASCII
+        self.assertEqual(self.dumps({'\n': '\U0001f600\n'},
+                                    separators=(',', '\u2192')),
+                         '{"\\n"\u2192"\\ud83d\\ude00\\n"}')
+
     def test_ascii_non_printable_encode(self):
         u = '\b\t\n\f\r\x00\x1f\x7f'
         self.assertEqual(self.dumps(u),
@@ -885,6 +885,49 @@ def test_can_represent_stream_with_int_name(self):
         h = logging.StreamHandler(StreamWithIntName())
         self.assertEqual(repr(h), '<StreamHandler 2 (NOTSET)>')
 
+    def test_handle_batch(self):
+        class Stream(io.StringIO):
+            writes = flushes = 0
+            def write(self, data):
+                self.writes += 1
+                return super().write(data)
+            def flush(self):
+                self.flushes += 1
+
+        stream = Stream()
+        h = logging.StreamHandler(stream)
+        h.addFilter(lambda record: record.msg != 'skip')
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('one', 'skip', 'two')]
+        h.handleBatch(records)
+        self.assertEqual(stream.getvalue(), 'one\ntwo\n')
+        self.assertEqual(stream.writes, 1)
+        self.assertEqual(stream.flushes, 1)
+
+        # Nothing is written if every record is filtered out.
+        h.handleBatch(records[1:2])
+        self.assertEqual(stream.writes, 1)
+
+    def test_handle_batch_custom_emit(self):
+        emitted = []
+        class Handler(logging.StreamHandler):
+            def emit(self, record):
+                emitted.append(record)
+
+        h = Handler(io.StringIO())
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('one', 'two')]
+        h.handleBatch(records)
+        self.assertEqual(emitted, records)
+        self.assertEqual(h.stream.getvalue(), '')
+
+    def test_handle_batch_error_handling(self):
+        h = TestStreamHandler(BadStream())
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('one', 'two')]
+        h.handleBatch(records)
+        self.assertIs(h.error_record, records[-1])
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -4677,6 +4720,50 @@ def test_no_messages_in_queue_after_stop(self):
                                     [m.msg if isinstance(m, logging.LogRecord)
                                      else m for m in items]))
 
+        def test_batch_size(self):
+            log_queue = queue.Queue()
+            stream = io.StringIO()
+            handler = logging.StreamHandler(stream)
+            batches = []
+            def handleBatch(records):
+                batches.append(len(records))
+                logging.StreamHandler.handleBatch(handler, records)
+            handler.handleBatch = handleBatch
+            for i in range(7):
+                log_queue.put(logging.makeLogRecord({'msg': str(i)}))
+            listener = logging.handlers.QueueListener(log_queue, handler,
+                                                      batch_size=3)
+            listener.start()
+            listener.stop()
+            self.assertEqual(stream.getvalue(), '0\n1\n2\n3\n4\n5\n6\n')
+            self.assertEqual(batches, [3, 3, 1])
+            # Every record and the sentinel were marked as done.
+            with self.assertRaises(ValueError):
+                log_queue.task_done()
+
+        def test_batch_size_respect_handler_level(self):
+            log_queue = queue.Queue()
+            info_stream = io.StringIO()
+            error_stream = io.StringIO()
+            info_handler = logging.StreamHandler(info_stream)
+            info_handler.setLevel(logging.INFO)
+            error_handler = logging.StreamHandler(error_stream)
+            error_handler.setLevel(logging.ERROR)
+            for level in (logging.DEBUG, logging.INFO, logging.ERROR):
+                log_queue.put(logging.makeLogRecord(
+                    {'msg': logging.getLevelName(level), 'levelno': level}))
+            listener = logging.handlers.QueueListener(
+                log_queue, info_handler, error_handler,
+                respect_handler_level=True, batch_size=10)
+            listener.start()
+            listener.stop()
+            self.assertEqual(info_stream.getvalue(), 'INFO\nERROR\n')
+            self.assertEqual(error_stream.getvalue(), 'ERROR\n')
+
+        def test_batch_size_invalid(self):
+            with self.assertRaises(ValueError):
+                logging.handlers.QueueListener(queue.Queue(), batch_size=0)
+
         def test_calls_task_done_after_stop(self):
             # Issue 36813: Make sure queue.join does not deadlock.
             log_queue = queue.Queue()
@@ -4984,6 +5071,36 @@ class NoMsecFormatter(logging.Formatter):
         f.converter = time.gmtime
         self.assertEqual(f.formatTime(r), '21/04/1993 08:03:00')
 
+    def test_time_cache(self):
+        f = logging.Formatter('%(asctime)s %(message)s')
+        f.converter = time.gmtime
+        r = self.get_record()
+        dt = datetime.datetime(1993, 4, 21, 8, 3, 0, 0, utc)
+        r.created = dt.timestamp()
+        r.msecs = 123
+        with patch('time.strftime', wraps=time.strftime) as strftime:
+            self.assertEqual(f.formatTime(r), '1993-04-21 08:03:00,123')
+            r.created += 0.5
+            r.msecs = 623
+            self.assertEqual(f.formatTime(r), '1993-04-21 08:03:00,623')
+            self.assertEqual(strftime.call_count, 1)
+            # A different second or date format is not served from the cache.
+            r.created += 1
+            self.assertEqual(f.formatTime(r), '1993-04-21 08:03:01,623')
+            self.assertEqual(f.formatTime(r, '%H:%M:%S'), '08:03:01')
+            self.assertEqual(f.formatTime(r), '1993-04-21 08:03:01,623')
+            self.assertEqual(strftime.call_count, 4)
+            # The converter is taken into account.
+            f.converter = lambda t: time.gmtime(t + 3600)
+            self.assertEqual(f.formatTime(r), '1993-04-21 09:03:01,623')
+            # Times before the epoch are floored to the second like
+            # the converter does.
+            f.converter = lambda t: time.gmtime(t + 86400)
+            r.created = -0.5
+            self.assertEqual(f.formatTime(r, '%H:%M:%S'), '23:59:59')
+            r.created = 0.5
+            self.assertEqual(f.formatTime(r, '%H:%M:%S'), '00:00:00')
+
     def test_issue_89047(self):
         f = logging.Formatter(fmt='{asctime}.{msecs:03.0f} {message}', style='{', datefmt="%Y-%m-%d %H:%M:%S")
         for i in range(2500):
@@ -6492,6 +6609,30 @@ def test_delay(self):
         self.assertTrue(os.path.exists(self.fn))
         fh.close()
 
+    def test_delay_handle_batch(self):
+        os.unlink(self.fn)
+        fh = logging.FileHandler(self.fn, encoding='utf-8', delay=True)
+        fh.addFilter(lambda record: record.msg != 'skip')
+        skipped = logging.makeLogRecord({'msg': 'skip'})
+        # The file is not created if every record is filtered out.
+        fh.handleBatch([skipped, skipped])
+        self.assertIsNone(fh.stream)
+        self.assertFalse(os.path.exists(self.fn))
+        fh.handleBatch([skipped, logging.makeLogRecord({'msg': 'one'})])
+        self.assertIsNotNone(fh.stream)
+        fh.close()
+        with open(self.fn, encoding='utf-8') as fp:
+            self.assertEqual(fp.read(), 'one\n')
+
+        # An existing file is not truncated in write mode.
+        fh = logging.FileHandler(self.fn, mode='w', encoding='utf-8',
+                                 delay=True)
+        fh.addFilter(lambda record: record.msg != 'skip')
+        fh.handleBatch([skipped])
+        fh.close()
+        with open(self.fn, encoding='utf-8') as fp:
+            self.assertEqual(fp.read(), 'one\n')
+
     def test_emit_after_closing_in_write_mode(self):
         # Issue #42378
         os.unlink(self.fn)
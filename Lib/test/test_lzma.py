@@ -508,6 +508,20 @@ def test_roundtrip(self):
         ddata = lzma.decompress(cdata, lzma.FORMAT_RAW, filters=FILTERS_RAW_4)
         self.assertEqual(ddata, INPUT)
 
+    def test_compress_workers(self):
+        with support.swap_attr(lzma, '_PARALLEL_BLOCK_SIZE', 100):
+            for workers in (0, 2, 4):
+                cdata = lzma.compress(INPUT, workers=workers)
+                self.assertEqual(lzma.decompress(cdata), INPUT)
+            cdata = lzma.compress(b'', workers=2)
+            self.assertEqual(lzma.decompress(cdata), b'')
+        self.assertRaises(ValueError, lzma.compress, INPUT, workers=-1)
+        for format in (lzma.FORMAT_ALONE, lzma.FORMAT_RAW):
+            self.assertRaises(ValueError, lzma.compress, INPUT, format,
+                              filters=FILTERS_RAW_1, workers=2)
+        self.assertRaises(LZMAError, lzma.compress, INPUT, preset=10,
+                          workers=2)
+
     # Unlike LZMADecompressor, decompress() *does* handle concatenated streams.
 
     def test_decompress_multistream(self):
@@ -1082,6 +1096,18 @@ def test_decompress_limited(self):
         self.assertLessEqual(decomp._buffer.raw.tell(), max_decomp,
             "Excessive amount of data was decompressed")
 
+    def test_write_workers(self):
+        with support.swap_attr(lzma, '_PARALLEL_BLOCK_SIZE', 100):
+            with BytesIO() as dst:
+                with LZMAFile(dst, "w", workers=3) as f:
+                    for i in range(0, len(INPUT), 70):
+                        f.write(INPUT[i:i + 70])
+                dst.seek(0)
+                with LZMAFile(dst) as f:
+                    self.assertEqual(f.read(), INPUT)
+        with self.assertRaises(ValueError):
+            LZMAFile(BytesIO(), "w", format=lzma.FORMAT_ALONE, workers=2)
+
     def test_write(self):
         with BytesIO() as dst:
             with LZMAFile(dst, "w") as f:
@@ -0,0 +1,231 @@
+"""Tests for the profiling.imports module."""
+import importlib
+import io
+import os
+import sys
+import threading
+import tracemalloc
+import unittest
+
+from profiling.imports import ImportProfiler
+from test import support
+from test.support import import_helper, os_helper
+from test.support.script_helper import assert_python_ok, make_script
+
+
+class ImportProfilerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = self.enterContext(os_helper.temp_dir())
+        self.enterContext(import_helper.DirsOnSysPath(self.directory))
+        self.enterContext(import_helper.isolated_modules())
+        self.enterContext(support.swap_attr(sys, 'dont_write_bytecode', False))
+        make_script(self.directory, 'spam', 'import eggs\nimport spam_pkg.ham\n')
+        make_script(self.directory, 'eggs', 'x = 1\n')
+        os.mkdir(os.path.join(self.directory, 'spam_pkg'))
+        make_script(os.path.join(self.directory, 'spam_pkg'), '__init__', '')
+        make_script(os.path.join(self.directory, 'spam_pkg'), 'ham', '')
+        importlib.invalidate_caches()
+
+    def forget(self):
+        for name in ['spam', 'eggs', 'spam_pkg', 'spam_pkg.ham']:
+            sys.modules.pop(name, None)
+
+    def profile(self, name='spam'):
+        with ImportProfiler() as profiler:
+            importlib.import_module(name)
+        return profiler
+
+    def tree(self, profiler):
+        return [('  ' * depth + record.name, record.pyc)
+                for depth, record in profiler.iter_records()]
+
+    def test_tree(self):
+        profiler = self.profile()
+        self.assertEqual(self.tree(profiler), [
+            ('spam', 'miss'),
+            ('  eggs', 'miss'),
+            ('  spam_pkg.ham', 'miss'),
+            ('    spam_pkg', 'miss'),
+        ])
+        spam = profiler.records[0]
+        self.assertEqual(spam.thread_id, threading.get_ident())
+        self.assertFalse(spam.failed)
+        self.assertGreaterEqual(spam.self_ns, 0)
+        self.assertEqual(spam.cumulative_ns,
+                         spam.self_ns + sum(child.cumulative_ns
+                                            for child in spam.children))
+        self.assertIsNone(spam.memory)
+        self.assertIsNone(spam.self_memory)
+
+        # Modules already imported are not recorded.
+        with ImportProfiler() as profiler:
+            import spam
+        self.assertEqual(profiler.records, [])
+
+    def test_pyc_status(self):
+        self.profile()
+        self.forget()
+        profiler = self.profile()
+        self.assertEqual({pyc for _, pyc in self.tree(profiler)}, {'hit'})
+
+        make_script(self.directory, 'spam2', '')
+        with support.swap_attr(sys, 'dont_write_bytecode', True):
+            profiler = self.profile('spam2')
+        self.assertEqual(self.tree(profiler), [('spam2', 'compile')])
+
+        # Extension modules have no bytecode.
+        import_helper.import_module('_testinternalcapi')
+        del sys.modules['_testinternalcapi']
+        profiler = self.profile('_testinternalcapi')
+        self.assertEqual(self.tree(profiler), [('_testinternalcapi', None)])
+
+    def test_failed_import(self):
+        make_script(self.directory, 'bad', 'import eggs\nimport nosuchmodule\n')
+        with ImportProfiler() as profiler:
+            with self.assertRaises(ImportError):
+                import bad
+        self.assertEqual(self.tree(profiler),
+                         [('bad', 'miss'), ('  eggs', 'miss'),
+                          ('  nosuchmodule', None)])
+        self.assertEqual([record.failed for _, record in profiler.iter_records()],
+                         [True, False, True])
+
+    def test_memory(self):
+        make_script(self.directory, 'big', 'data = [object() for _ in range(10000)]\n')
+        tracemalloc.start()
+        self.addCleanup(tracemalloc.stop)
+        profiler = self.profile('big')
+        self.assertGreater(profiler.records[0].memory, 10000 * 16)
+        output = io.StringIO()
+        profiler.print_tree(output)
+        self.assertIn('self [KiB]', output.getvalue())
+
+    def test_lazy_imports(self):
+        make_script(self.directory, 'lazy_spam',
+                    'lazy import eggs\n'
+                    'lazy import spam_pkg.ham\n'
+                    'lazy import lazy_unused\n'
+                    'x = eggs.x\n'
+                    'def f():\n'
+                    '    return spam_pkg.ham\n')
+        make_script(self.directory, 'lazy_unused', '')
+        self.addCleanup(sys.lazy_modules.discard, 'lazy_unused')
+        with ImportProfiler() as profiler:
+            import lazy_spam
+            lazy_spam.f()
+
+        eggs, ham = profiler.reifications
+        filename = lazy_spam.__file__
+        self.assertEqual(eggs.name, 'eggs')
+        self.assertIsNone(eggs.fromlist)
+        self.assertEqual((eggs.filename, eggs.lineno), (filename, 1))
+        self.assertEqual((eggs.trigger_filename, eggs.trigger_lineno,
+                          eggs.trigger_function), (filename, 4, '<module>'))
+        self.assertEqual(eggs.importing, 'lazy_spam')
+        self.assertTrue(eggs.at_import_time)
+        self.assertEqual(eggs.record.name, 'eggs')
+        self.assertEqual(eggs.cumulative_ns, eggs.record.cumulative_ns)
+
+        self.assertEqual(ham.name, 'spam_pkg.ham')
+        self.assertEqual((ham.filename, ham.lineno), (filename, 2))
+        self.assertEqual((ham.trigger_lineno, ham.trigger_function), (6, 'f'))
+        self.assertIsNone(ham.importing)
+        self.assertFalse(ham.at_import_time)
+        self.assertEqual(ham.record.name, 'spam_pkg.ham')
+        self.assertEqual(profiler.unreified, ['lazy_unused'])
+
+        output = io.StringIO()
+        profiler.print_lazy_report(output)
+        report = output.getvalue()
+        self.assertIn('never reified (safe to keep lazy):\n  lazy_unused\n',
+                      report)
+        deferred, eager = report.split('reified at import time')
+        self.assertIn(f'| spam_pkg.ham | {filename}:2 | {filename}:6 in f',
+                      deferred)
+        self.assertIn(f'| eggs | {filename}:1 | {filename}:4 in <module>',
+                      eager)
+
+        # A lazy import of a module already loaded takes no time.
+        sys.modules.pop('lazy_spam')
+        with ImportProfiler() as profiler:
+            import lazy_spam
+        self.assertEqual([r.name for r in profiler.reifications], ['eggs'])
+        self.assertIsNone(profiler.reifications[0].record)
+        self.assertEqual(profiler.reifications[0].cumulative_ns, 0)
+
+    def test_enable(self):
+        find_and_load = importlib._bootstrap._find_and_load
+        profiler = ImportProfiler()
+        with profiler:
+            self.assertIsNot(importlib._bootstrap._find_and_load, find_and_load)
+            with self.assertRaises(RuntimeError):
+                ImportProfiler().enable()
+        self.assertIs(importlib._bootstrap._find_and_load, find_and_load)
+        # Disabling twice is allowed.
+        profiler.disable()
+
+    def test_print_tree(self):
+        profiler = self.profile()
+        output = io.StringIO()
+        profiler.print_tree(output)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0],
+                         '  self [us] | cumulative [us] | pyc     | '
+                         'imported package')
+        self.assertEqual([line.split('|')[-1] for line in lines[1:]],
+                         [' spam', '   eggs', '   spam_pkg.ham',
+                          '     spam_pkg'])
+
+    def test_export_collapsed(self):
+        profiler = self.profile()
+        filename = os.path.join(self.directory, 'stacks.txt')
+        with support.captured_stdout():
+            self.assertTrue(profiler.export(filename, 'collapsed', 1))
+        with open(filename) as f:
+            stacks = {}
+            for line in f:
+                stack, count = line.rsplit(' ', 1)
+                stacks[stack.split(';', 1)[1]] = int(count)
+        self.assertLessEqual(set(stacks), {
+            'spam', 'spam;eggs', 'spam;spam_pkg.ham',
+            'spam;spam_pkg.ham;spam_pkg'})
+        self.assertIn('spam;eggs', stacks)
+        # One sample per microsecond.
+        self.assertAlmostEqual(sum(stacks.values()),
+                               profiler.records[0].cumulative_ns / 1000,
+                               delta=1)
+
+    def test_export_gecko(self):
+        profiler = self.profile()
+        filename = os.path.join(self.directory, 'profile.json')
+        with support.captured_stdout(), support.captured_stderr():
+            self.assertTrue(profiler.export(filename, 'gecko'))
+        with open(filename) as f:
+            self.assertIn('"spam_pkg.ham"', f.read())
+
+    def test_cli(self):
+        script = make_script(self.directory, 'script', 'import spam\n')
+        rc, out, err = assert_python_ok('-m', 'profiling.imports', script,
+                                        PYTHONDONTWRITEBYTECODE='')
+        self.assertIn(b'| pyc     | imported package', err)
+        self.assertIn(b'|   eggs', err)
+
+        filename = os.path.join(self.directory, 'stacks.txt')
+        # Not isolated: the current directory is in sys.path.
+        assert_python_ok('-m', 'profiling.imports', '--collapsed',
+                         '-o', filename, '-m', 'spam', __cwd=self.directory,
+                         PYTHONDONTWRITEBYTECODE='')
+        with open(filename) as f:
+            self.assertIn(';eggs ', f.read())
+
+        make_script(self.directory, 'lazy_script', 'lazy import eggs\n')
+        rc, out, err = assert_python_ok('-m', 'profiling.imports', '--lazy',
+                                        '-m', 'lazy_script',
+                                        __cwd=self.directory,
+                                        PYTHONDONTWRITEBYTECODE='')
+        self.assertIn(b'never reified (safe to keep lazy):\n  eggs\n', err)
+
+
+if __name__ == "__main__":
+    unittest.main()
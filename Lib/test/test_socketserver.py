@@ -183,6 +183,26 @@ def test_ForkingTCPServer(self):
                             socketserver.StreamRequestHandler,
                             self.stream_examine)
 
+    def test_ThreadPoolTCPServer(self):
+        class ThreadPoolTCPServer(socketserver.ThreadPoolMixIn,
+                                  socketserver.TCPServer):
+            pool_size = 2
+
+        self.run_server(ThreadPoolTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    @requires_forking
+    def test_PreforkTCPServer(self):
+        class PreforkTCPServer(socketserver.PreforkMixIn,
+                               socketserver.TCPServer):
+            workers = 2
+
+        self.run_server(PreforkTCPServer,
+                        socketserver.StreamRequestHandler,
+                        self.stream_examine)
+
     @requires_unix_sockets
     def test_UnixStreamServer(self):
         self.run_server(socketserver.UnixStreamServer,
@@ -222,6 +242,26 @@ def test_ForkingUDPServer(self):
                             socketserver.DatagramRequestHandler,
                             self.dgram_examine)
 
+    def test_ThreadPoolUDPServer(self):
+        class ThreadPoolUDPServer(socketserver.ThreadPoolMixIn,
+                                  socketserver.UDPServer):
+            pool_size = 2
+
+        self.run_server(ThreadPoolUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    @requires_forking
+    def test_PreforkUDPServer(self):
+        class PreforkUDPServer(socketserver.PreforkMixIn,
+                               socketserver.UDPServer):
+            workers = 2
+
+        self.run_server(PreforkUDPServer,
+                        socketserver.DatagramRequestHandler,
+                        self.dgram_examine)
+
     @requires_unix_sockets
     @unittest.skipIf(test.support.is_apple_mobile and test.support.on_github_actions,
                      "gh-140702: Test fails regularly on iOS simulator on GitHub Actions")
@@ -272,6 +312,47 @@ class MyHandler(socketserver.StreamRequestHandler):
             t.join()
             s.server_close()
 
+    @threading_helper.reap_threads
+    def test_thread_pool_shutdown_while_busy(self):
+        # shutdown() returns while every pool thread is busy and more
+        # connections are waiting.
+        release = threading.Event()
+        handling = threading.Event()
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                handling.set()
+                release.wait(test.support.LONG_TIMEOUT)
+
+        class Server(socketserver.ThreadPoolMixIn, socketserver.TCPServer):
+            pool_size = 1
+
+        server = Server((HOST, 0), Handler)
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.start()
+        clients = []
+        shutdown = threading.Thread(target=server.shutdown)
+        try:
+            for _ in range(2):
+                clients.append(socket.create_connection(server.server_address))
+            self.assertTrue(handling.wait(test.support.SHORT_TIMEOUT))
+            shutdown.start()
+            shutdown.join(test.support.SHORT_TIMEOUT)
+            self.assertFalse(shutdown.is_alive())
+            t.join(test.support.SHORT_TIMEOUT)
+            self.assertFalse(t.is_alive())
+        finally:
+            release.set()
+            for client in clients:
+                client.close()
+            if shutdown.is_alive():
+                shutdown.join()
+            else:
+                server.shutdown()
+            t.join()
+            server.server_close()
+
     def test_close_immediately(self):
         class MyServer(socketserver.ThreadingMixIn, socketserver.TCPServer):
             pass
@@ -296,6 +377,127 @@ def test_context_manager(self):
         self.assertEqual(-1, server.socket.fileno())
 
 
+@requires_forking
+class PreforkTest(unittest.TestCase):
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            self.rfile.readline()
+            self.wfile.write(b'%d\n' % os.getpid())
+
+    def tearDown(self):
+        reap_children()
+
+    def is_running(self, pid):
+        # The server reaps its workers, so exited ones are not zombies.
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def ask(self, server):
+        with socket.create_connection(server.server_address) as s:
+            s.sendall(TEST_STR)
+            with s.makefile('rb') as f:
+                return int(f.readline())
+
+    @contextlib.contextmanager
+    def serving(self, server):
+        t = threading.Thread(target=server.serve_forever,
+                             kwargs={'poll_interval': 0.01})
+        t.start()
+        try:
+            # With allow_reuse_port, connections are refused until the
+            # workers listen.
+            for _ in test.support.sleeping_retry(test.support.SHORT_TIMEOUT):
+                if len(server.active_workers) == server.workers:
+                    break
+            yield
+        finally:
+            server.shutdown()
+            t.join()
+            server.server_close()
+        self.assertFalse(server.active_workers)
+
+    def check_reload(self, reuse_port):
+        class Server(socketserver.PreforkMixIn, socketserver.TCPServer):
+            workers = 2
+            allow_reuse_port = reuse_port
+
+        server = Server((HOST, 0), self.Handler)
+        with self.serving(server):
+            self.assertIn(self.ask(server), server.active_workers)
+            old = set(server.active_workers)
+            server.reload()
+            for _ in test.support.sleeping_retry(test.support.SHORT_TIMEOUT):
+                workers = server.active_workers
+                if (len(workers) == 2 and not workers & old
+                        and not any(map(self.is_running, old))):
+                    break
+            self.assertIn(self.ask(server), server.active_workers)
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    @threading_helper.reap_threads
+    def test_reload(self):
+        self.check_reload(reuse_port=False)
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    @threading_helper.reap_threads
+    @unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'),
+                         'requires SO_REUSEPORT')
+    def test_reload_reuse_port(self):
+        self.check_reload(reuse_port=True)
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    @threading_helper.reap_threads
+    @unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'),
+                         'requires SO_REUSEPORT')
+    def test_reuse_port_thread_pool(self):
+        class Server(socketserver.PreforkMixIn, socketserver.ThreadPoolMixIn,
+                     socketserver.TCPServer):
+            workers = 2
+            allow_reuse_port = True
+
+        server = Server((HOST, 0), self.Handler)
+        with self.serving(server):
+            for _ in range(10):
+                self.assertIn(self.ask(server), server.active_workers)
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    @threading_helper.reap_threads
+    def test_blocking_request(self):
+        # The workers share a non-blocking listening socket, but the
+        # handlers get blocking sockets.
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                self.rfile.readline()
+                blocking = os.get_blocking(self.connection.fileno())
+                self.wfile.write(b'%d\n' % blocking)
+
+        class Server(socketserver.PreforkMixIn, socketserver.TCPServer):
+            workers = 1
+
+        server = Server((HOST, 0), Handler)
+        with self.serving(server):
+            self.assertEqual(self.ask(server), 1)
+
+    @warnings_helper.ignore_fork_in_thread_deprecation_warnings()
+    @threading_helper.reap_threads
+    def test_replace_dead_worker(self):
+        class Server(socketserver.PreforkMixIn, socketserver.TCPServer):
+            workers = 1
+
+        server = Server((HOST, 0), self.Handler)
+        with self.serving(server):
+            pid = self.ask(server)
+            os.kill(pid, signal.SIGKILL)
+            for _ in test.support.sleeping_retry(test.support.SHORT_TIMEOUT):
+                if server.active_workers and pid not in server.active_workers:
+                    break
+            self.assertNotEqual(self.ask(server), pid)
+
+
 class ErrorHandlerTest(unittest.TestCase):
     """Test that the servers pass normal exceptions from the handler to
     handle_error(), and that exiting exceptions like SystemExit and
@@ -2020,6 +2020,33 @@ def test_pathlike_name(self):
                     self.assertEqual(tar.name, expected_name)
                 os_helper.unlink(tmpname)
 
+    def test_block_size(self):
+        # Data is written in blocks of exactly bufsize bytes, even when
+        # large chunks are added at once.
+        class Writer(io.BytesIO):
+            def write(self, data):
+                sizes.append(len(data))
+                return super().write(data)
+        sizes = []
+        fobj = Writer()
+        bufsize = 4 * tarfile.BLOCKSIZE
+        data = os.urandom(100 * bufsize + 100)
+        with tarfile.open(mode=self.mode, fileobj=fobj, bufsize=bufsize,
+                          copybufsize=len(data)) as tar:
+            for name, size in (("foo", len(data)), ("bar", 100)):
+                tarinfo = tarfile.TarInfo(name)
+                tarinfo.size = size
+                tar.addfile(tarinfo, io.BytesIO(data[:size]))
+            # The remaining data is written when the archive is closed.
+            # bzip2 may not have produced any output yet.
+            self.assertLessEqual(set(sizes), {bufsize})
+        fobj.seek(0)
+        with tarfile.open(mode="r|*", fileobj=fobj) as tar:
+            member = tar.next()
+            self.assertEqual(tar.extractfile(member).read(), data)
+            member = tar.next()
+            self.assertEqual(tar.extractfile(member).read(), data[:100])
+
 
 class GzipStreamWriteTest(GzipTest, StreamWriteTest):
     def test_source_directory_not_leaked(self):
@@ -2054,6 +2081,33 @@ class LzmaStreamWriteTest(LzmaTest, StreamWriteTest):
 class ZstdStreamWriteTest(ZstdTest, StreamWriteTest):
     decompressor = zstd.ZstdDecompressor if zstd else None
 
+    def test_create_with_level(self):
+        fobj = io.BytesIO()
+        with tarfile.open(mode=self.mode, fileobj=fobj, level=1) as tar:
+            tarinfo = tarfile.TarInfo("foo")
+            tarinfo.size = 400
+            tar.addfile(tarinfo, io.BytesIO(b"spam" * 100))
+        fobj.seek(0)
+        with tarfile.open(mode="r|zst", fileobj=fobj) as tar:
+            member = tar.next()
+            self.assertEqual(tar.extractfile(member).read(), b"spam" * 100)
+
+    def test_create_with_options_and_zstd_dict(self):
+        zstd_dict = zstd.ZstdDict(b"spam and eggs " * 100, is_raw=True)
+        options = {zstd.CompressionParameter.checksum_flag: 1}
+        fobj = io.BytesIO()
+        with tarfile.open(mode=self.mode, fileobj=fobj, options=options,
+                          zstd_dict=zstd_dict) as tar:
+            tarinfo = tarfile.TarInfo("foo")
+            tarinfo.size = 1300
+            tar.addfile(tarinfo, io.BytesIO(b"spam and eggs" * 100))
+        fobj.seek(0)
+        with tarfile.open(mode="r|zst", fileobj=fobj,
+                          zstd_dict=zstd_dict) as tar:
+            member = tar.next()
+            self.assertEqual(tar.extractfile(member).read(),
+                             b"spam and eggs" * 100)
+
 class _CompressedWriteTest(TarTest):
     # This is not actually a standalone test.
     # It does not inherit WriteTest because it only makes sense with gz,bz2
@@ -2113,6 +2167,13 @@ def test_compresslevel_wrong_modes(self):
         with self.assertRaises(TypeError):
             tarfile.open(tmpname, "w:", fobj, compresslevel=compresslevel)
 
+    def test_zstd_arguments_wrong_stream_modes(self):
+        for mode in ("w|", "w|gz", "r|"):
+            for kwargs in ({"level": 1}, {"options": {}}, {"zstd_dict": None}):
+                with self.subTest(mode=mode, kwargs=kwargs):
+                    with self.assertRaises(ValueError):
+                        tarfile.open(tmpname, mode, io.BytesIO(), **kwargs)
+
     @support.requires_bz2()
     def test_wrong_compresslevels(self):
         # BZ2 checks that the compresslevel is in [1,9]. gz does not
@@ -848,6 +848,42 @@ def func():
                          "current is main True\n"
                          )
 
+    @skip_unless_reliable_fork
+    @unittest.skipUnless(hasattr(os, 'waitpid'), "test needs os.waitpid()")
+    @unittest.skipUnless(hasattr(signal, 'setitimer'), "test needs setitimer()")
+    def test_signal_handler_after_fork_from_nonmain_thread(self):
+        # The signal handler must run in the thread which called fork():
+        # it is the main thread of the child process.
+        code = """if 1:
+            import os, signal, threading, time, warnings
+            from test import support
+
+            def func():
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore", DeprecationWarning)
+                    pid = os.fork()
+                if pid == 0:
+                    handled = False
+                    def handler(signum, frame):
+                        nonlocal handled
+                        handled = True
+                    signal.signal(signal.SIGALRM, handler)
+                    signal.setitimer(signal.ITIMER_REAL, 0.01)
+                    deadline = time.monotonic() + support.SHORT_TIMEOUT
+                    # Don't call any function which checks for signals.
+                    while not handled and time.monotonic() < deadline:
+                        pass
+                    os._exit(0 if handled else 1)
+                pids.append(pid)
+
+            pids = []
+            th = threading.Thread(target=func)
+            th.start()
+            th.join()
+            support.wait_process(pids[0], exitcode=0)
+        """
+        assert_python_ok("-c", code)
+
     @skip_unless_reliable_fork
     @unittest.skipUnless(hasattr(os, 'waitpid'), "test needs os.waitpid()")
     def test_main_thread_after_fork_from_foreign_thread(self, create_dummy=False):
@@ -3860,6 +3860,60 @@ def test_extract_all_with_target_pathlike(self):
         with temp_dir() as extdir:
             self._test_extract_all_with_target(FakePath(extdir))
 
+    @requires_zlib()
+    def test_extract_all_workers(self):
+        with temp_dir() as extdir:
+            with zipfile.ZipFile(TESTFN2, "w", zipfile.ZIP_DEFLATED) as zipfp:
+                zipfp.writestr("dir/", "")
+                for i in range(50):
+                    zipfp.writestr(f"dir/sub{i % 5}/file{i}", f"data{i}" * 1000)
+            self.addCleanup(unlink, TESTFN2)
+            for workers in (0, 4):
+                with self.subTest(workers=workers):
+                    target = os.path.join(extdir, str(workers))
+                    with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                        zipfp.extractall(target, workers=workers)
+                    for i in range(50):
+                        self.check_file(
+                            os.path.join(target, "dir", f"sub{i % 5}", f"file{i}"),
+                            f"data{i}".encode() * 1000)
+
+    def test_extract_all_workers_duplicate_names(self):
+        # The last member with a given name wins, as with sequential
+        # extraction.
+        with temp_dir() as extdir:
+            with zipfile.ZipFile(TESTFN2, "w") as zipfp, \
+                 warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                for i in range(10):
+                    zipfp.writestr("file", f"data{i}")
+                    zipfp.writestr(f"other{i}", f"other{i}")
+            self.addCleanup(unlink, TESTFN2)
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                zipfp.extractall(extdir, members=zipfp.infolist(), workers=4)
+            self.check_file(os.path.join(extdir, "file"), b"data9")
+            for i in range(10):
+                self.check_file(os.path.join(extdir, f"other{i}"),
+                                f"other{i}".encode())
+
+    def test_extract_all_workers_error(self):
+        with temp_dir() as extdir:
+            self.make_test_file()
+            self.addCleanup(unlink, TESTFN2)
+            with zipfile.ZipFile(TESTFN2, "r") as zipfp:
+                with self.assertRaises(ValueError):
+                    zipfp.extractall(extdir, workers=-1)
+                with self.assertRaises(KeyError):
+                    zipfp.extractall(extdir, members=["missing"], workers=2)
+                # An open file handle is not leaked when a member fails.
+                with mock.patch.object(zipfile.ZipFile, '_write_member',
+                                       side_effect=OSError):
+                    with self.assertRaises(OSError):
+                        zipfp.extractall(extdir, workers=2)
+                zipfp.extractall(extdir, workers=2)
+            for fpath, fdata in SMALL_TEST_DATA:
+                self.check_file(os.path.join(extdir, fpath), fdata.encode())
+
     def check_file(self, filename, content):
         self.assertTrue(os.path.isfile(filename))
         with open(filename, 'rb') as f:
@@ -19,7 +19,9 @@
 from compression.zstd import (
     open,
     compress,
+    compress_many,
     decompress,
+    decompress_many,
     ZstdCompressor,
     ZstdDecompressor,
     ZstdDict,
@@ -188,6 +190,49 @@ def test_decompress_2x130_1K(self):
         dat = decompress(DAT_130K_C + DAT_130K_C)
         self.assertEqual(len(dat), 2 * _130_1K)
 
+    def test_compress_many(self):
+        messages = [b'', b'a', SAMPLES[0], THIS_FILE_BYTES[:_1K]]
+        frames = compress_many(messages)
+        self.assertEqual(len(frames), len(messages))
+        for frame, message in zip(frames, messages):
+            self.assertEqual(frame, compress(message))
+            self.assertEqual(decompress(frame), message)
+        self.assertEqual(decompress_many(frames), messages)
+        self.assertEqual(compress_many([]), [])
+        self.assertEqual(decompress_many([]), [])
+
+        # Iterables and other bytes-like objects are accepted
+        frames = compress_many(iter([bytearray(b'abc'), memoryview(b'def')]))
+        self.assertEqual(decompress_many(iter(frames)), [b'abc', b'def'])
+
+        # Items made of several frames, like for decompress()
+        frames = compress_many([b'abc', b'def', b'ghi'])
+        self.assertEqual(decompress_many([frames[0] + frames[1], frames[2]]),
+                         [b'abcdef', b'ghi'])
+        dat = decompress_many([DAT_130K_C + DAT_130K_C, DAT_130K_C])
+        self.assertEqual([len(d) for d in dat], [2 * _130_1K, _130_1K])
+
+    def test_compress_many_arguments(self):
+        frames = compress_many(SAMPLES, 5, zstd_dict=TRAINED_DICT)
+        self.assertEqual(frames,
+                         [compress(s, 5, zstd_dict=TRAINED_DICT)
+                          for s in SAMPLES])
+        self.assertEqual(decompress_many(frames, TRAINED_DICT), SAMPLES)
+
+        options = {CompressionParameter.checksum_flag: 1}
+        frames = compress_many(SAMPLES[:3], options=options)
+        self.assertEqual(frames, [compress(s, options=options)
+                                  for s in SAMPLES[:3]])
+
+        with self.assertRaises(TypeError):
+            compress_many([b'abc', 'def'])
+        with self.assertRaises(ZstdError):
+            decompress_many(frames + [COMPRESSED_BOGUS])
+        with self.assertRaises(ZstdError):
+            decompress_many([frames[0][:-1]])
+        with self.assertRaises(ZstdError):
+            decompress_many([frames[0] + frames[1][:-1]])
+
 
 class CompressorTestCase(unittest.TestCase):
 
@@ -741,6 +786,23 @@ def test_decompressor_1(self):
         self.assertFalse(d.needs_input)
         self.assertEqual(d.unused_data, TRAIL)
 
+    def test_decompressor_reset_session(self):
+        d = ZstdDecompressor(TRAINED_DICT)
+        frame = compress(SAMPLES[0], zstd_dict=TRAINED_DICT)
+        self.assertEqual(d.decompress(frame + b'trail'), SAMPLES[0])
+        self.assertTrue(d.eof)
+        with self.assertRaises(EOFError):
+            d.decompress(frame)
+        # A new frame can be decompressed with the same dictionary.
+        d._reset_session()
+        self.assertFalse(d.eof)
+        self.assertTrue(d.needs_input)
+        self.assertEqual(d.unused_data, b'')
+        self.assertEqual(d.decompress(frame[:5]), b'')
+        d._reset_session()
+        self.assertEqual(d.decompress(frame), SAMPLES[0])
+        self.assertTrue(d.eof)
+
     def test_decompressor_chunks_read_300(self):
         TRAIL = b'89234893abcd'
         DAT = DAT_130K_C + TRAIL
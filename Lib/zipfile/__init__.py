@@ -13,6 +13,7 @@
 import threading
 import time
 lazy import warnings
+lazy from concurrent.futures import ThreadPoolExecutor
 
 try:
     import zlib # We may need its compression method
@@ -2209,7 +2210,8 @@ def open(self, name, mode="r", pwd=None, *, force_zip64=False):
                     "Close the writing handle before trying to read.")
 
         # Open for reading:
-        self._fileRefCnt += 1
+        with self._lock:
+            self._fileRefCnt += 1
         zef_file = _SharedFile(self.fp, zinfo.header_offset,
                                self._fpclose, self._lock, lambda: self._writing)
         try:
@@ -2325,13 +2327,18 @@ def extract(self, member, path=None, pwd=None):
 
         return self._extract_member(member, path, pwd)
 
-    def extractall(self, path=None, members=None, pwd=None):
+    def extractall(self, path=None, members=None, pwd=None, *, workers=1):
         """Extract all members from the archive to the current working
            directory. 'path' specifies a different directory to extract to.
            'members' is optional and must be a subset of the list returned
            by namelist(). You can specify the password to decrypt all files
-           using 'pwd'.
+           using 'pwd'. 'workers' is the number of threads used to extract
+           members concurrently; 0 selects a default based on the number of
+           CPUs.
         """
+        if workers < 0:
+            raise ValueError('workers must be greater or equal to 0')
+
         if members is None:
             members = self.namelist()
 
@@ -2340,8 +2347,36 @@ def extractall(self, path=None, members=None, pwd=None):
         else:
             path = os.fspath(path)
 
+        if workers == 1:
+            for zipinfo in members:
+                self._extract_member(zipinfo, path, pwd)
+            return
+
+        # Members which are extracted to the same path are extracted by the
+        # same task, in archive order, so that the last one wins as it does
+        # when extracting sequentially.
+        groups = {}
         for zipinfo in members:
-            self._extract_member(zipinfo, path, pwd)
+            if not isinstance(zipinfo, ZipInfo):
+                zipinfo = self.getinfo(zipinfo)
+            targetpath = self._get_targetpath(zipinfo, path)
+            if targetpath is not None:
+                key = os.path.normcase(targetpath)
+                groups.setdefault(key, (targetpath, []))[1].append(zipinfo)
+
+        with ThreadPoolExecutor(workers or None) as executor:
+            futures = [executor.submit(self._extract_to, group, targetpath, pwd)
+                       for targetpath, group in groups.values()]
+            try:
+                for future in futures:
+                    future.result()
+            except BaseException:
+                executor.shutdown(cancel_futures=True)
+                raise
+
+    def _extract_to(self, members, targetpath, pwd):
+        for member in members:
+            self._write_member(member, targetpath, pwd)
 
     def remove(self, zinfo_or_arcname):
         """Remove a member from the archive."""
@@ -2437,6 +2472,15 @@ def _extract_member(self, member, targetpath, pwd):
         if not isinstance(member, ZipInfo):
             member = self.getinfo(member)
 
+        targetpath = self._get_targetpath(member, targetpath)
+        if targetpath is None:
+            return None
+        return self._write_member(member, targetpath, pwd)
+
+    def _get_targetpath(self, member, targetpath):
+        """Return the path under targetpath where the ZipInfo object 'member'
+           is extracted, or None if it should be skipped.
+        """
         # build the destination pathname, replacing
         # forward slashes to platform specific separators.
         arcname = member.filename
@@ -2467,8 +2511,10 @@ def _extract_member(self, member, targetpath, pwd):
             raise ValueError("Empty filename.")
 
         targetpath = os.path.join(targetpath, arcname)
-        targetpath = os.path.normpath(targetpath)
+        return os.path.normpath(targetpath)
 
+    def _write_member(self, member, targetpath, pwd):
+        """Write the ZipInfo object 'member' to the path targetpath."""
         # Create all upper directories if necessary.
         upperdirs = os.path.dirname(targetpath)
         if upperdirs and not os.path.exists(upperdirs):
@@ -2740,10 +2786,11 @@ def _write_end_record(self):
         self.fp.flush()
 
     def _fpclose(self, fp):
-        assert self._fileRefCnt > 0
-        self._fileRefCnt -= 1
-        if not self._fileRefCnt and not self._filePassed:
-            fp.close()
+        with self._lock:
+            assert self._fileRefCnt > 0
+            self._fileRefCnt -= 1
+            if not self._fileRefCnt and not self._filePassed:
+                fp.close()
 
 
 class PyZipFile(ZipFile):
@@ -11,10 +11,27 @@ annotated by François Pinard, and converted to C by Raymond Hettinger.
 #endif
 
 #include "Python.h"
+#include "pycore_critical_section.h" // Py_BEGIN_CRITICAL_SECTION()
 #include "pycore_list.h"          // _PyList_ITEMS(), _PyList_AppendTakeRef()
+#include "pycore_moduleobject.h"  // _PyModule_GetState()
 #include "pycore_pyatomic_ft_wrappers.h"
 
-#include "clinic/_heapqmodule.c.h"
+typedef struct {
+    PyTypeObject *HeapType;
+    PyTypeObject *HeapEntryType;
+} heapq_state;
+
+static inline heapq_state *
+get_heapq_state(PyObject *module)
+{
+    heapq_state *state = _PyModule_GetState(module);
+    assert(state != NULL);
+    return state;
+}
+
+static struct PyModuleDef _heapqmodule;
+#define get_heapq_state_by_type(type) \
+    (get_heapq_state(PyType_GetModuleByDef(type, &_heapqmodule)))
 
 
 /*[clinic input]
@@ -635,6 +652,694 @@ _heapq_heappushpop_max_impl(PyObject *module, PyObject *heap, PyObject *item)
     return returnitem;
 }
 
+/* Heap objects **************************************************************/
+
+/* A Heap keeps its entries in an array arranged as a heap, ordered by
+   their keys.  Every entry records its own position in the array, so that
+   handles returned by push() can be removed or updated in O(log n) time
+   without searching the heap. */
+
+typedef struct {
+    PyObject_HEAD
+    PyObject *item;
+    PyObject *key;          /* key(item), or item itself if there is no key */
+    Py_ssize_t index;       /* position in the heap, -1 if not in a heap */
+} heapentryobject;
+
+typedef struct {
+    PyObject_HEAD
+    heapentryobject **entries;
+    Py_ssize_t size;
+    Py_ssize_t allocated;
+    PyObject *keyfunc;      /* NULL if there is no key function */
+    PyTypeObject *entry_type;
+    int mutating;           /* set while entries are being moved */
+} heapobject;
+
+#define heapentryobject_CAST(op)    ((heapentryobject *)(op))
+#define heapobject_CAST(op)         ((heapobject *)(op))
+
+/*[clinic input]
+class _heapq.Heap "heapobject *" "get_heapq_state_by_type(type)->HeapType"
+[clinic start generated code]*/
+/*[clinic end generated code: output=da39a3ee5e6b4b0d input=9746ca1598d5fac6]*/
+
+static int
+heapentry_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    heapentryobject *self = heapentryobject_CAST(op);
+    Py_VISIT(Py_TYPE(self));
+    Py_VISIT(self->item);
+    Py_VISIT(self->key);
+    return 0;
+}
+
+static int
+heapentry_clear(PyObject *op)
+{
+    heapentryobject *self = heapentryobject_CAST(op);
+    Py_CLEAR(self->item);
+    Py_CLEAR(self->key);
+    return 0;
+}
+
+static void
+heapentry_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)heapentry_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+static PyObject *
+heapentry_get_item(PyObject *op, void *Py_UNUSED(closure))
+{
+    PyObject *item = heapentryobject_CAST(op)->item;
+    if (item == NULL) {
+        Py_RETURN_NONE;
+    }
+    return Py_NewRef(item);
+}
+
+static PyGetSetDef heapentry_getset[] = {
+    {"item", heapentry_get_item, NULL,
+     PyDoc_STR("The item referred to by the handle.")},
+    {NULL}
+};
+
+static PyType_Slot heapentry_slots[] = {
+    {Py_tp_dealloc, heapentry_dealloc},
+    {Py_tp_doc, (void *)PyDoc_STR("Handle to an item of a Heap, "
+                                  "as returned by Heap.push().")},
+    {Py_tp_traverse, heapentry_traverse},
+    {Py_tp_clear, heapentry_clear},
+    {Py_tp_getset, heapentry_getset},
+    {0, NULL},
+};
+
+static PyType_Spec heapentry_spec = {
+    .name = "_heapq._HeapEntry",
+    .basicsize = sizeof(heapentryobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION),
+    .slots = heapentry_slots,
+};
+
+static heapentryobject *
+heap_new_entry(heapobject *self, PyObject *item)
+{
+    PyObject *key;
+    if (self->keyfunc == NULL) {
+        key = Py_NewRef(item);
+    }
+    else {
+        key = PyObject_CallOneArg(self->keyfunc, item);
+        if (key == NULL) {
+            return NULL;
+        }
+    }
+    heapentryobject *entry = PyObject_GC_New(heapentryobject,
+                                             self->entry_type);
+    if (entry == NULL) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    entry->item = Py_NewRef(item);
+    entry->key = key;
+    entry->index = -1;
+    PyObject_GC_Track(entry);
+    return entry;
+}
+
+static int
+heap_check_mutating(heapobject *self)
+{
+    if (self->mutating) {
+        PyErr_SetString(PyExc_RuntimeError,
+                        "Heap modified during a comparison");
+        return -1;
+    }
+    return 0;
+}
+
+static int
+heap_resize(heapobject *self, Py_ssize_t newsize)
+{
+    Py_ssize_t allocated = self->allocated;
+    if (newsize <= allocated && newsize >= (allocated >> 1)) {
+        return 0;
+    }
+    if (newsize == 0) {
+        PyMem_Free(self->entries);
+        self->entries = NULL;
+        self->allocated = 0;
+        return 0;
+    }
+    /* Same over-allocation as list_resize() */
+    size_t new_allocated = ((size_t)newsize + (newsize >> 3) + 6) & ~(size_t)3;
+    heapentryobject **entries = NULL;
+    if (new_allocated <= (size_t)PY_SSIZE_T_MAX / sizeof(heapentryobject *)) {
+        entries = PyMem_Realloc(self->entries,
+                                new_allocated * sizeof(heapentryobject *));
+    }
+    if (entries == NULL) {
+        if (newsize <= allocated) {
+            /* Failing to shrink is harmless */
+            return 0;
+        }
+        PyErr_NoMemory();
+        return -1;
+    }
+    self->entries = entries;
+    self->allocated = (Py_ssize_t)new_allocated;
+    return 0;
+}
+
+/* Return 1 if the key of a is less than the key of b, 0 if not and -1 on
+   error.  Float keys, such as times, are compared without calling
+   __lt__(). */
+static inline int
+heapentry_lt(heapentryobject *a, heapentryobject *b)
+{
+    PyObject *x = a->key, *y = b->key;
+    if (PyFloat_CheckExact(x) && PyFloat_CheckExact(y)) {
+        return PyFloat_AS_DOUBLE(x) < PyFloat_AS_DOUBLE(y);
+    }
+    Py_INCREF(x);
+    Py_INCREF(y);
+    int cmp = PyObject_RichCompareBool(x, y, Py_LT);
+    Py_DECREF(x);
+    Py_DECREF(y);
+    return cmp;
+}
+
+static inline void
+heap_set(heapobject *self, Py_ssize_t pos, heapentryobject *entry)
+{
+    self->entries[pos] = entry;
+    entry->index = pos;
+}
+
+/* The same algorithms as siftdown() and siftup(), but entries are swapped
+   rather than moved through a hole, so that every entry stays in the heap
+   and knows its position if a comparison fails.  The caller sets
+   self->mutating, so the array can not be changed by a comparison. */
+
+static int
+heap_siftdown(heapobject *self, Py_ssize_t startpos, Py_ssize_t pos)
+{
+    heapentryobject **arr = self->entries;
+    heapentryobject *newentry = arr[pos];
+    while (pos > startpos) {
+        Py_ssize_t parentpos = (pos - 1) >> 1;
+        heapentryobject *parent = arr[parentpos];
+        int cmp = heapentry_lt(newentry, parent);
+        if (cmp < 0) {
+            return -1;
+        }
+        if (cmp == 0) {
+            break;
+        }
+        heap_set(self, pos, parent);
+        heap_set(self, parentpos, newentry);
+        pos = parentpos;
+    }
+    return 0;
+}
+
+static int
+heap_siftup(heapobject *self, Py_ssize_t pos)
+{
+    heapentryobject **arr = self->entries;
+    Py_ssize_t endpos = self->size;
+    Py_ssize_t startpos = pos;
+    Py_ssize_t limit = endpos >> 1;      /* smallest pos that has no child */
+    heapentryobject *newentry = arr[pos];
+    while (pos < limit) {
+        Py_ssize_t childpos = 2*pos + 1;
+        if (childpos + 1 < endpos) {
+            int cmp = heapentry_lt(arr[childpos], arr[childpos + 1]);
+            if (cmp < 0) {
+                return -1;
+            }
+            childpos += ((unsigned)cmp ^ 1);
+        }
+        heap_set(self, pos, arr[childpos]);
+        heap_set(self, childpos, newentry);
+        pos = childpos;
+    }
+    return heap_siftdown(self, startpos, pos);
+}
+
+/* Restore the invariant after the key at pos has changed. */
+static int
+heap_repair(heapobject *self, Py_ssize_t pos)
+{
+    if (pos > 0) {
+        int cmp = heapentry_lt(self->entries[pos],
+                               self->entries[(pos - 1) >> 1]);
+        if (cmp < 0) {
+            return -1;
+        }
+        if (cmp) {
+            return heap_siftdown(self, 0, pos);
+        }
+    }
+    return heap_siftup(self, pos);
+}
+
+/* Return the position of handle in the heap, or -1 with an exception set
+   if it is not in the heap. */
+static Py_ssize_t
+heap_find(heapobject *self, PyObject *handle)
+{
+    if (!Py_IS_TYPE(handle, self->entry_type)) {
+        PyErr_Format(PyExc_TypeError,
+                     "expected a heap handle, not %T", handle);
+        return -1;
+    }
+    Py_ssize_t pos = heapentryobject_CAST(handle)->index;
+    if (pos < 0 || pos >= self->size ||
+        self->entries[pos] != heapentryobject_CAST(handle))
+    {
+        PyErr_SetString(PyExc_ValueError, "handle is not in the heap");
+        return -1;
+    }
+    return pos;
+}
+
+/* Remove the entry at pos from the array and return it.  The heap is not
+   reordered. */
+static heapentryobject *
+heap_take(heapobject *self, Py_ssize_t pos)
+{
+    heapentryobject *entry = self->entries[pos];
+    Py_ssize_t lastpos = self->size - 1;
+    heapentryobject *lastentry = self->entries[lastpos];
+    FT_ATOMIC_STORE_SSIZE_RELAXED(self->size, lastpos);
+    if (lastentry != entry) {
+        heap_set(self, pos, lastentry);
+    }
+    entry->index = -1;
+    return entry;
+}
+
+static int
+heap_traverse(PyObject *op, visitproc visit, void *arg)
+{
+    heapobject *self = heapobject_CAST(op);
+    Py_VISIT(Py_TYPE(self));
+    for (Py_ssize_t i = 0; i < self->size; i++) {
+        Py_VISIT(self->entries[i]);
+    }
+    Py_VISIT(self->keyfunc);
+    Py_VISIT(self->entry_type);
+    return 0;
+}
+
+static void
+heap_clear_entries(heapobject *self)
+{
+    heapentryobject **entries = self->entries;
+    Py_ssize_t size = self->size;
+    self->entries = NULL;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(self->size, 0);
+    self->allocated = 0;
+    for (Py_ssize_t i = 0; i < size; i++) {
+        entries[i]->index = -1;
+        Py_DECREF(entries[i]);
+    }
+    PyMem_Free(entries);
+}
+
+static int
+heap_clear(PyObject *op)
+{
+    heapobject *self = heapobject_CAST(op);
+    heap_clear_entries(self);
+    Py_CLEAR(self->keyfunc);
+    Py_CLEAR(self->entry_type);
+    return 0;
+}
+
+static void
+heap_dealloc(PyObject *op)
+{
+    PyTypeObject *tp = Py_TYPE(op);
+    PyObject_GC_UnTrack(op);
+    (void)heap_clear(op);
+    tp->tp_free(op);
+    Py_DECREF(tp);
+}
+
+/*[clinic input]
+@classmethod
+_heapq.Heap.__new__ as heap_new
+
+    iterable: object = NULL
+    /
+    *
+    key: object = None
+
+Priority queue with removal and update of arbitrary items.
+
+Items are popped smallest first, or ordered by key(item) if a key
+function is given.  push() returns a handle which can be passed to
+remove() and update() to drop the item or change its priority in
+O(log n) time.  Items with equal priorities are popped in arbitrary
+order.
+[clinic start generated code]*/
+
+static PyObject *
+heap_new_impl(PyTypeObject *type, PyObject *iterable, PyObject *key)
+/*[clinic end generated code: output=533bf1a0230a064c input=3a86e63dce73e849]*/
+{
+    PyObject *module = PyType_GetModuleByDef(type, &_heapqmodule);
+    if (module == NULL) {
+        return NULL;
+    }
+    heapq_state *state = get_heapq_state(module);
+
+    heapobject *self = (heapobject *)type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->entries = NULL;
+    FT_ATOMIC_STORE_SSIZE_RELAXED(self->size, 0);
+    self->allocated = 0;
+    self->keyfunc = key == Py_None ? NULL : Py_NewRef(key);
+    self->entry_type = (PyTypeObject *)Py_NewRef(state->HeapEntryType);
+    self->mutating = 0;
+    if (iterable == NULL) {
+        return (PyObject *)self;
+    }
+
+    PyObject *it = PyObject_GetIter(iterable);
+    if (it == NULL) {
+        goto error;
+    }
+    PyObject *item;
+    while ((item = PyIter_Next(it)) != NULL) {
+        heapentryobject *entry = heap_new_entry(self, item);
+        Py_DECREF(item);
+        if (entry == NULL || heap_resize(self, self->size + 1) < 0) {
+            Py_XDECREF(entry);
+            Py_DECREF(it);
+            goto error;
+        }
+        heap_set(self, self->size, entry);
+        FT_ATOMIC_STORE_SSIZE_RELAXED(self->size, self->size + 1);
+    }
+    Py_DECREF(it);
+    if (PyErr_Occurred()) {
+        goto error;
+    }
+
+    /* Heapify */
+    self->mutating = 1;
+    for (Py_ssize_t i = (self->size >> 1) - 1; i >= 0; i--) {
+        if (heap_siftup(self, i) < 0) {
+            self->mutating = 0;
+            goto error;
+        }
+    }
+    self->mutating = 0;
+    return (PyObject *)self;
+
+error:
+    Py_DECREF(self);
+    return NULL;
+}
+
+/*[clinic input]
+@critical_section
+_heapq.Heap.push
+
+    item: object
+    /
+
+Push item onto the heap and return a handle to it.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_Heap_push_impl(heapobject *self, PyObject *item)
+/*[clinic end generated code: output=806155b96b9a82ea input=49545e51c7933b15]*/
+{
+    if (heap_check_mutating(self) < 0) {
+        return NULL;
+    }
+    heapentryobject *entry = heap_new_entry(self, item);
+    if (entry == NULL) {
+        return NULL;
+    }
+    /* The key function may have modified the heap. */
+    if (heap_check_mutating(self) < 0 ||
+        heap_resize(self, self->size + 1) < 0)
+    {
+        Py_DECREF(entry);
+        return NULL;
+    }
+    Py_ssize_t pos = self->size;
+    heap_set(self, pos, (heapentryobject *)Py_NewRef(entry));
+    FT_ATOMIC_STORE_SSIZE_RELAXED(self->size, pos + 1);
+
+    self->mutating = 1;
+    int res = heap_siftdown(self, 0, pos);
+    self->mutating = 0;
+    if (res < 0) {
+        Py_DECREF(entry);
+        return NULL;
+    }
+    return (PyObject *)entry;
+}
+
+/*[clinic input]
+@critical_section
+_heapq.Heap.peek
+
+Return the smallest item without removing it.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_Heap_peek_impl(heapobject *self)
+/*[clinic end generated code: output=fb7d3e7e182f4862 input=92c38501b89326c0]*/
+{
+    if (self->size == 0) {
+        PyErr_SetString(PyExc_IndexError, "peek at an empty heap");
+        return NULL;
+    }
+    return Py_NewRef(self->entries[0]->item);
+}
+
+/* Remove the entry at pos, restore the invariant and return its item. */
+static PyObject *
+heap_remove_at(heapobject *self, Py_ssize_t pos)
+{
+    heapentryobject *entry = heap_take(self, pos);
+    PyObject *item = Py_NewRef(entry->item);
+    Py_DECREF(entry);
+    if (pos < self->size) {
+        self->mutating = 1;
+        int res = heap_repair(self, pos);
+        self->mutating = 0;
+        if (res < 0) {
+            Py_DECREF(item);
+            item = NULL;
+        }
+    }
+    (void)heap_resize(self, self->size);
+    return item;
+}
+
+/*[clinic input]
+@critical_section
+_heapq.Heap.pop
+
+Remove and return the smallest item.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_Heap_pop_impl(heapobject *self)
+/*[clinic end generated code: output=b78e49db62f9c375 input=69b608252ef26e1a]*/
+{
+    if (heap_check_mutating(self) < 0) {
+        return NULL;
+    }
+    if (self->size == 0) {
+        PyErr_SetString(PyExc_IndexError, "pop from an empty heap");
+        return NULL;
+    }
+    return heap_remove_at(self, 0);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.Heap.remove
+
+    handle: object
+    /
+
+Remove the item referred to by handle and return it.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_Heap_remove_impl(heapobject *self, PyObject *handle)
+/*[clinic end generated code: output=d4bc4a83634ce98f input=7e1cce9b819d9c68]*/
+{
+    if (heap_check_mutating(self) < 0) {
+        return NULL;
+    }
+    Py_ssize_t pos = heap_find(self, handle);
+    if (pos < 0) {
+        return NULL;
+    }
+    return heap_remove_at(self, pos);
+}
+
+/*[clinic input]
+@critical_section
+_heapq.Heap.update
+
+    handle: object
+    item: object
+    /
+
+Replace the item referred to by handle, moving it as needed.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_Heap_update_impl(heapobject *self, PyObject *handle, PyObject *item)
+/*[clinic end generated code: output=984eb726909c869f input=c7446597814b8920]*/
+{
+    PyObject *key;
+    if (self->keyfunc == NULL) {
+        key = Py_NewRef(item);
+    }
+    else {
+        key = PyObject_CallOneArg(self->keyfunc, item);
+        if (key == NULL) {
+            return NULL;
+        }
+    }
+    if (heap_check_mutating(self) < 0) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    Py_ssize_t pos = heap_find(self, handle);
+    if (pos < 0) {
+        Py_DECREF(key);
+        return NULL;
+    }
+    heapentryobject *entry = heapentryobject_CAST(handle);
+    Py_SETREF(entry->item, Py_NewRef(item));
+    Py_SETREF(entry->key, key);
+
+    self->mutating = 1;
+    int res = heap_repair(self, pos);
+    self->mutating = 0;
+    if (res < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+/*[clinic input]
+@critical_section
+_heapq.Heap.clear
+
+Remove all items from the heap.
+[clinic start generated code]*/
+
+static PyObject *
+_heapq_Heap_clear_impl(heapobject *self)
+/*[clinic end generated code: output=d2ec25b61a784a74 input=4a3abf97567ac741]*/
+{
+    if (heap_check_mutating(self) < 0) {
+        return NULL;
+    }
+    heap_clear_entries(self);
+    Py_RETURN_NONE;
+}
+
+static Py_ssize_t
+heap_length(PyObject *op)
+{
+    heapobject *self = heapobject_CAST(op);
+    return FT_ATOMIC_LOAD_SSIZE_RELAXED(self->size);
+}
+
+static PyObject *
+heap_iter(PyObject *op)
+{
+    heapobject *self = heapobject_CAST(op);
+    PyObject *items;
+    Py_BEGIN_CRITICAL_SECTION(self);
+    items = PyList_New(self->size);
+    if (items != NULL) {
+        for (Py_ssize_t i = 0; i < self->size; i++) {
+            PyList_SET_ITEM(items, i, Py_NewRef(self->entries[i]->item));
+        }
+    }
+    Py_END_CRITICAL_SECTION();
+    if (items == NULL) {
+        return NULL;
+    }
+    PyObject *it = PyObject_GetIter(items);
+    Py_DECREF(items);
+    return it;
+}
+
+static PyObject *
+heap_get_key(PyObject *op, void *Py_UNUSED(closure))
+{
+    PyObject *keyfunc = heapobject_CAST(op)->keyfunc;
+    if (keyfunc == NULL) {
+        Py_RETURN_NONE;
+    }
+    return Py_NewRef(keyfunc);
+}
+
+#include "clinic/_heapqmodule.c.h"
+
+static PyMethodDef heap_methods[] = {
+    _HEAPQ_HEAP_PUSH_METHODDEF
+    _HEAPQ_HEAP_POP_METHODDEF
+    _HEAPQ_HEAP_PEEK_METHODDEF
+    _HEAPQ_HEAP_REMOVE_METHODDEF
+    _HEAPQ_HEAP_UPDATE_METHODDEF
+    _HEAPQ_HEAP_CLEAR_METHODDEF
+    {NULL, NULL}           /* sentinel */
+};
+
+static PyGetSetDef heap_getset[] = {
+    {"key", heap_get_key, NULL,
+     PyDoc_STR("The key function of the heap, or None.")},
+    {NULL}
+};
+
+static PyType_Slot heap_slots[] = {
+    {Py_tp_dealloc, heap_dealloc},
+    {Py_tp_doc, (void *)heap_new__doc__},
+    {Py_tp_traverse, heap_traverse},
+    {Py_tp_clear, heap_clear},
+    {Py_tp_iter, heap_iter},
+    {Py_tp_methods, heap_methods},
+    {Py_tp_getset, heap_getset},
+    {Py_tp_new, heap_new},
+    {Py_sq_length, heap_length},
+    {0, NULL},
+};
+
+static PyType_Spec heap_spec = {
+    .name = "_heapq.Heap",
+    .basicsize = sizeof(heapobject),
+    .flags = (Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_HAVE_GC |
+              Py_TPFLAGS_IMMUTABLETYPE),
+    .slots = heap_slots,
+};
+
 static PyMethodDef heapq_methods[] = {
     _HEAPQ_HEAPPUSH_METHODDEF
     _HEAPQ_HEAPPUSHPOP_METHODDEF
@@ -780,12 +1485,52 @@ From all times, sorting has always been a Great Art! :-)\n");
 static int
 heapq_exec(PyObject *m)
 {
+    heapq_state *state = get_heapq_state(m);
+
     if (PyModule_Add(m, "__about__", PyUnicode_FromString(__about__)) < 0) {
         return -1;
     }
+
+    state->HeapEntryType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        m, &heapentry_spec, NULL);
+    if (state->HeapEntryType == NULL) {
+        return -1;
+    }
+    state->HeapType = (PyTypeObject *)PyType_FromModuleAndSpec(
+        m, &heap_spec, NULL);
+    if (state->HeapType == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(m, state->HeapType) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+static int
+heapq_traverse(PyObject *m, visitproc visit, void *arg)
+{
+    heapq_state *state = get_heapq_state(m);
+    Py_VISIT(state->HeapType);
+    Py_VISIT(state->HeapEntryType);
     return 0;
 }
 
+static int
+heapq_clear(PyObject *m)
+{
+    heapq_state *state = get_heapq_state(m);
+    Py_CLEAR(state->HeapType);
+    Py_CLEAR(state->HeapEntryType);
+    return 0;
+}
+
+static void
+heapq_free(void *m)
+{
+    (void)heapq_clear((PyObject *)m);
+}
+
 static struct PyModuleDef_Slot heapq_slots[] = {
     _Py_ABI_SLOT,
     {Py_mod_exec, heapq_exec},
@@ -798,12 +1543,12 @@ static struct PyModuleDef _heapqmodule = {
     PyModuleDef_HEAD_INIT,
     "_heapq",
     module_doc,
-    0,
+    sizeof(heapq_state),
     heapq_methods,
     heapq_slots,
-    NULL,
-    NULL,
-    NULL
+    heapq_traverse,
+    heapq_clear,
+    heapq_free
 };
 
 PyMODINIT_FUNC
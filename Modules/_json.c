@@ -192,19 +192,14 @@ ascii_escape_size(const void *input, int kind, Py_ssize_t input_chars)
     return output_size;
 }
 
-static PyObject *
-ascii_escape_unicode_and_size(const void *input, int kind, Py_ssize_t input_chars, Py_ssize_t output_size)
+static void
+ascii_escape_fill(const void *input, int kind, Py_ssize_t input_chars, Py_UCS1 *output)
 {
+    /* Write the escaped and quoted form of input to output, which must have
+       room for the number of characters computed by ascii_escape_size() */
     Py_ssize_t i;
     Py_ssize_t chars;
-    PyObject *rval;
-    Py_UCS1 *output;
 
-    rval = PyUnicode_New(output_size, 127);
-    if (rval == NULL) {
-        return NULL;
-    }
-    output = PyUnicode_1BYTE_DATA(rval);
     chars = 0;
     output[chars++] = '"';
     for (i = 0; i < input_chars; i++) {
@@ -217,6 +212,18 @@ ascii_escape_unicode_and_size(const void *input, int kind, Py_ssize_t input_char
         }
     }
     output[chars++] = '"';
+}
+
+static PyObject *
+ascii_escape_unicode_and_size(const void *input, int kind, Py_ssize_t input_chars, Py_ssize_t output_size)
+{
+    PyObject *rval;
+
+    rval = PyUnicode_New(output_size, 127);
+    if (rval == NULL) {
+        return NULL;
+    }
+    ascii_escape_fill(input, kind, input_chars, PyUnicode_1BYTE_DATA(rval));
 #ifdef Py_DEBUG
     assert(_PyUnicode_CheckConsistency(rval, 1));
 #endif
@@ -269,6 +276,20 @@ write_escaped_ascii(PyUnicodeWriter *writer, PyObject *pystr)
         return PyUnicodeWriter_WriteChar(writer, '"');
     }
 
+    /* Escape directly into the writer buffer rather than building an
+       intermediate string.  The output of the encoder is usually pure ASCII,
+       so the writer buffer is almost always a UCS1 one. */
+    _PyUnicodeWriter *w = (_PyUnicodeWriter *)writer;
+    if (_PyUnicodeWriter_Prepare(w, output_size, 127) < 0) {
+        return -1;
+    }
+    if (w->kind == PyUnicode_1BYTE_KIND) {
+        ascii_escape_fill(input, kind, input_chars,
+                          (Py_UCS1 *)w->data + w->pos);
+        w->pos += output_size;
+        return 0;
+    }
+
     PyObject *rval = ascii_escape_unicode_and_size(input, kind, input_chars, output_size);
     if (rval == NULL) {
         return -1;
@@ -308,18 +329,16 @@ escape_size(const void *input, int kind, Py_ssize_t input_chars)
     return output_size;
 }
 
-static PyObject *
-escape_unicode_and_size(const void *input, int kind, Py_UCS4 maxchar, Py_ssize_t input_chars, Py_ssize_t output_size)
+static void
+escape_unicode_fill(const void *input, int kind, Py_ssize_t input_chars,
+                    int output_kind, void *output_data, Py_ssize_t start)
 {
+    /* Write the escaped and quoted form of input to output_data starting at
+       index start.  output_kind must be at least as wide as kind, and the
+       buffer must have room for the number of characters computed by
+       escape_size(). */
     Py_ssize_t i;
     Py_ssize_t chars;
-    PyObject *rval;
-
-    rval = PyUnicode_New(output_size, maxchar);
-    if (rval == NULL)
-        return NULL;
-
-    kind = PyUnicode_KIND(rval);
 
 #define ENCODE_OUTPUT do { \
         chars = 0; \
@@ -350,18 +369,31 @@ escape_unicode_and_size(const void *input, int kind, Py_UCS4 maxchar, Py_ssize_t
         output[chars++] = '"'; \
     } while (0)
 
-    if (kind == PyUnicode_1BYTE_KIND) {
-        Py_UCS1 *output = PyUnicode_1BYTE_DATA(rval);
+    if (output_kind == PyUnicode_1BYTE_KIND) {
+        Py_UCS1 *output = (Py_UCS1 *)output_data + start;
         ENCODE_OUTPUT;
-    } else if (kind == PyUnicode_2BYTE_KIND) {
-        Py_UCS2 *output = PyUnicode_2BYTE_DATA(rval);
+    } else if (output_kind == PyUnicode_2BYTE_KIND) {
+        Py_UCS2 *output = (Py_UCS2 *)output_data + start;
         ENCODE_OUTPUT;
     } else {
-        Py_UCS4 *output = PyUnicode_4BYTE_DATA(rval);
-        assert(kind == PyUnicode_4BYTE_KIND);
+        Py_UCS4 *output = (Py_UCS4 *)output_data + start;
+        assert(output_kind == PyUnicode_4BYTE_KIND);
         ENCODE_OUTPUT;
     }
 #undef ENCODE_OUTPUT
+}
+
+static PyObject *
+escape_unicode_and_size(const void *input, int kind, Py_UCS4 maxchar, Py_ssize_t input_chars, Py_ssize_t output_size)
+{
+    PyObject *rval;
+
+    rval = PyUnicode_New(output_size, maxchar);
+    if (rval == NULL)
+        return NULL;
+
+    escape_unicode_fill(input, kind, input_chars,
+                        PyUnicode_KIND(rval), PyUnicode_DATA(rval), 0);
 
 #ifdef Py_DEBUG
     assert(_PyUnicode_CheckConsistency(rval, 1));
@@ -412,12 +444,15 @@ write_escaped_unicode(PyUnicodeWriter *writer, PyObject *pystr)
         return PyUnicodeWriter_WriteChar(writer, '"');
     }
 
-    PyObject *rval = escape_unicode_and_size(input, kind, maxchar, input_chars, output_size);
-    if (rval == NULL) {
+    /* Escape directly into the writer buffer; _PyUnicodeWriter_Prepare()
+       widens it if needed so that it can hold maxchar. */
+    _PyUnicodeWriter *w = (_PyUnicodeWriter *)writer;
+    if (_PyUnicodeWriter_Prepare(w, output_size, maxchar) < 0) {
         return -1;
     }
-
-    return _steal_accumulate(writer, rval);
+    escape_unicode_fill(input, kind, input_chars, w->kind, w->data, w->pos);
+    w->pos += output_size;
+    return 0;
 }
 
 static void
@@ -222,4 +222,25 @@ exit:
 
     return return_value;
 }
-/*[clinic end generated code: output=70bc308e86463751 input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(_zstd_ZstdDecompressor__reset_session__doc__,
+"_reset_session($self, /)\n"
+"--\n"
+"\n"
+"Reset the decompressor to decompress a new frame.\n"
+"\n"
+"Unconsumed input data is discarded.  The dictionary and the options\n"
+"are kept.");
+
+#define _ZSTD_ZSTDDECOMPRESSOR__RESET_SESSION_METHODDEF    \
+    {"_reset_session", (PyCFunction)_zstd_ZstdDecompressor__reset_session, METH_NOARGS, _zstd_ZstdDecompressor__reset_session__doc__},
+
+static PyObject *
+_zstd_ZstdDecompressor__reset_session_impl(ZstdDecompressor *self);
+
+static PyObject *
+_zstd_ZstdDecompressor__reset_session(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    return _zstd_ZstdDecompressor__reset_session_impl((ZstdDecompressor *)self);
+}
+/*[clinic end generated code: output=f5824ecc14af0b1b input=a9049054013a1b77]*/
@@ -657,8 +657,28 @@ _zstd_ZstdDecompressor_decompress_impl(ZstdDecompressor *self,
     return ret;
 }
 
+/*[clinic input]
+_zstd.ZstdDecompressor._reset_session
+
+Reset the decompressor to decompress a new frame.
+
+Unconsumed input data is discarded.  The dictionary and the options
+are kept.
+[clinic start generated code]*/
+
+static PyObject *
+_zstd_ZstdDecompressor__reset_session_impl(ZstdDecompressor *self)
+/*[clinic end generated code: output=f05c0b4ccbaec21a input=b14e66d26c502597]*/
+{
+    PyMutex_Lock(&self->lock);
+    decompressor_reset_session_lock_held(self);
+    PyMutex_Unlock(&self->lock);
+    Py_RETURN_NONE;
+}
+
 static PyMethodDef ZstdDecompressor_methods[] = {
     _ZSTD_ZSTDDECOMPRESSOR_DECOMPRESS_METHODDEF
+    _ZSTD_ZSTDDECOMPRESSOR__RESET_SESSION_METHODDEF
     {NULL, NULL}
 };
 
@@ -2,6 +2,10 @@
 preserve
 [clinic start generated code]*/
 
+#if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+#  include "pycore_gc.h"          // PyGC_Head
+#  include "pycore_runtime.h"     // _Py_ID()
+#endif
 #include "pycore_critical_section.h"// Py_BEGIN_CRITICAL_SECTION()
 #include "pycore_modsupport.h"    // _PyArg_CheckPositional()
 
@@ -358,4 +362,231 @@ _heapq_heappushpop_max(PyObject *module, PyObject *const *args, Py_ssize_t nargs
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=21e4f248ef6e83d6 input=a9049054013a1b77]*/
+
+PyDoc_STRVAR(heap_new__doc__,
+"Heap(iterable=<unrepresentable>, /, *, key=None)\n"
+"--\n"
+"\n"
+"Priority queue with removal and update of arbitrary items.\n"
+"\n"
+"Items are popped smallest first, or ordered by key(item) if a key\n"
+"function is given.  push() returns a handle which can be passed to\n"
+"remove() and update() to drop the item or change its priority in\n"
+"O(log n) time.  Items with equal priorities are popped in arbitrary\n"
+"order.");
+
+static PyObject *
+heap_new_impl(PyTypeObject *type, PyObject *iterable, PyObject *key);
+
+static PyObject *
+heap_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        Py_hash_t ob_hash;
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_hash = -1,
+        .ob_item = { &_Py_ID(key), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"", "key", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "Heap",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[2];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    PyObject *iterable = NULL;
+    PyObject *key = Py_None;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser,
+            /*minpos*/ 0, /*maxpos*/ 1, /*minkw*/ 0, /*varpos*/ 0, argsbuf);
+    if (!fastargs) {
+        goto exit;
+    }
+    if (nargs < 1) {
+        goto skip_optional_posonly;
+    }
+    noptargs--;
+    iterable = fastargs[0];
+skip_optional_posonly:
+    if (!noptargs) {
+        goto skip_optional_kwonly;
+    }
+    key = fastargs[1];
+skip_optional_kwonly:
+    return_value = heap_new_impl(type, iterable, key);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_Heap_push__doc__,
+"push($self, item, /)\n"
+"--\n"
+"\n"
+"Push item onto the heap and return a handle to it.");
+
+#define _HEAPQ_HEAP_PUSH_METHODDEF    \
+    {"push", (PyCFunction)_heapq_Heap_push, METH_O, _heapq_Heap_push__doc__},
+
+static PyObject *
+_heapq_Heap_push_impl(heapobject *self, PyObject *item);
+
+static PyObject *
+_heapq_Heap_push(PyObject *self, PyObject *item)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_Heap_push_impl((heapobject *)self, item);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_Heap_peek__doc__,
+"peek($self, /)\n"
+"--\n"
+"\n"
+"Return the smallest item without removing it.");
+
+#define _HEAPQ_HEAP_PEEK_METHODDEF    \
+    {"peek", (PyCFunction)_heapq_Heap_peek, METH_NOARGS, _heapq_Heap_peek__doc__},
+
+static PyObject *
+_heapq_Heap_peek_impl(heapobject *self);
+
+static PyObject *
+_heapq_Heap_peek(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_Heap_peek_impl((heapobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_Heap_pop__doc__,
+"pop($self, /)\n"
+"--\n"
+"\n"
+"Remove and return the smallest item.");
+
+#define _HEAPQ_HEAP_POP_METHODDEF    \
+    {"pop", (PyCFunction)_heapq_Heap_pop, METH_NOARGS, _heapq_Heap_pop__doc__},
+
+static PyObject *
+_heapq_Heap_pop_impl(heapobject *self);
+
+static PyObject *
+_heapq_Heap_pop(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_Heap_pop_impl((heapobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_Heap_remove__doc__,
+"remove($self, handle, /)\n"
+"--\n"
+"\n"
+"Remove the item referred to by handle and return it.");
+
+#define _HEAPQ_HEAP_REMOVE_METHODDEF    \
+    {"remove", (PyCFunction)_heapq_Heap_remove, METH_O, _heapq_Heap_remove__doc__},
+
+static PyObject *
+_heapq_Heap_remove_impl(heapobject *self, PyObject *handle);
+
+static PyObject *
+_heapq_Heap_remove(PyObject *self, PyObject *handle)
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_Heap_remove_impl((heapobject *)self, handle);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_Heap_update__doc__,
+"update($self, handle, item, /)\n"
+"--\n"
+"\n"
+"Replace the item referred to by handle, moving it as needed.");
+
+#define _HEAPQ_HEAP_UPDATE_METHODDEF    \
+    {"update", _PyCFunction_CAST(_heapq_Heap_update), METH_FASTCALL, _heapq_Heap_update__doc__},
+
+static PyObject *
+_heapq_Heap_update_impl(heapobject *self, PyObject *handle, PyObject *item);
+
+static PyObject *
+_heapq_Heap_update(PyObject *self, PyObject *const *args, Py_ssize_t nargs)
+{
+    PyObject *return_value = NULL;
+    PyObject *handle;
+    PyObject *item;
+
+    if (!_PyArg_CheckPositional("update", nargs, 2, 2)) {
+        goto exit;
+    }
+    handle = args[0];
+    item = args[1];
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_Heap_update_impl((heapobject *)self, handle, item);
+    Py_END_CRITICAL_SECTION();
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_heapq_Heap_clear__doc__,
+"clear($self, /)\n"
+"--\n"
+"\n"
+"Remove all items from the heap.");
+
+#define _HEAPQ_HEAP_CLEAR_METHODDEF    \
+    {"clear", (PyCFunction)_heapq_Heap_clear, METH_NOARGS, _heapq_Heap_clear__doc__},
+
+static PyObject *
+_heapq_Heap_clear_impl(heapobject *self);
+
+static PyObject *
+_heapq_Heap_clear(PyObject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+
+    Py_BEGIN_CRITICAL_SECTION(self);
+    return_value = _heapq_Heap_clear_impl((heapobject *)self);
+    Py_END_CRITICAL_SECTION();
+
+    return return_value;
+}
+/*[clinic end generated code: output=30bf59832c6d239a input=a9049054013a1b77]*/
@@ -792,6 +792,12 @@ PyOS_AfterFork_Child(void)
     // That needs to happen before `_PyThreadState_DeleteList`, because that
     // may call destructors.
     PyThreadState *list = _PyThreadState_RemoveExcept(tstate);
+    if (_Py_IsMainInterpreter(tstate->interp)) {
+        // The thread that called fork() is the main thread of the child
+        // (see _PyRuntimeState_ReInitThreads()): signals must now wake it
+        // up instead of the thread state which is about to be deleted.
+        runtime->main_tstate = tstate;
+    }
     _PyEval_StartTheWorldAll(&_PyRuntime);
     _PyThreadState_DeleteList(list, /*is_after_fork=*/1);
 
@@ -3940,6 +3940,23 @@ _PyImport_LoadLazyImportTstate(PyThreadState *tstate, PyObject *lazy_import)
         goto error;
     }
 
+    // Report the reification with the location of the lazy import: the
+    // frame which triggered it is the current frame of the hook.
+    PyObject *declared_filename = Py_None;
+    int declared_lineno = -1;
+    if (lz->lz_code != NULL) {
+        declared_filename = lz->lz_code->co_filename;
+        if (lz->lz_instr_offset >= 0) {
+            declared_lineno = PyCode_Addr2Line(lz->lz_code,
+                                               lz->lz_instr_offset*2);
+        }
+    }
+    if (_PySys_Audit(tstate, "import.lazy", "OOOi", lz->lz_from,
+                     lz->lz_attr != NULL ? lz->lz_attr : Py_None,
+                     declared_filename, declared_lineno) < 0) {
+        goto error;
+    }
+
     if (lz->lz_attr != NULL) {
         if (PyUnicode_Check(lz->lz_attr)) {
             fromlist = PyTuple_New(1);
@@ -523,6 +523,8 @@ static const char usage_envvars[] =
 "                  debugger.  It can be set to the callable of your debugger of\n"
 "                  choice.\n"
 "#E{PYTHONCASEOK}    : ignore case in 'import' statements (Windows)\n"
+"#E{PYTHONCODEPACK}  : code pack whose modules are found before sys.path\n"
+"                  (see compileall --code-pack)\n"
 "#E{PYTHONCOERCECLOCALE}: if this variable is set to #B{0}, it disables the locale\n"
 "                  coercion behavior.  Use #e{PYTHONCOERCECLOCALE}#B{=warn} to request\n"
 "                  display of locale coercion and locale compatibility warnings\n"
@@ -544,6 +546,8 @@ static const char usage_envvars[] =
 "#E{PYTHON_HISTORY}  : the location of a .python_history file.\n"
 "#E{PYTHONHOME}      : alternate <prefix> directory (or <prefix>#D<exec_prefix>).\n"
 "                  The default module search path uses #H.\n"
+"#E{PYTHONIMPORTINDEX}: index of directory listings used by the import system\n"
+"                  (see compileall --path-index)\n"
 "#E{PYTHONIOENCODING}: encoding[:errors] used for stdin/stdout/stderr\n"
 #ifdef MS_WINDOWS
 "#E{PYTHONLEGACYWINDOWSFSENCODING}: use legacy \"mbcs\" encoding for file system\n"
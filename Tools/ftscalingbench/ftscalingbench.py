@@ -339,6 +339,33 @@ def type_lookup():
             getattr(inst, name)
 
 
+_SHARED_EXECUTOR = None
+
+def _shared_executor():
+    global _SHARED_EXECUTOR
+    if _SHARED_EXECUTOR is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _SHARED_EXECUTOR = ThreadPoolExecutor(os.cpu_count())
+    return _SHARED_EXECUTOR
+
+@register_benchmark
+def thread_pool_submit():
+    # Many threads submitting small tasks to one shared executor.
+    executor = _shared_executor()
+    for i in range(WORK_SCALE):
+        futures = [executor.submit(abs, j) for j in range(10)]
+        for f in futures:
+            f.result()
+
+@register_benchmark
+def thread_pool_map():
+    # Same as thread_pool_submit(), but each batch is submitted at once.
+    executor = _shared_executor()
+    for i in range(WORK_SCALE):
+        for _ in executor.map(abs, range(10)):
+            pass
+
+
 def bench_one_thread(func):
     t0 = time.perf_counter_ns()
     func()
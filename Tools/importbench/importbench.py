@@ -5,6 +5,7 @@
 
 """
 from test.test_importlib import util
+import compileall
 import decimal
 from importlib.util import cache_from_source
 import importlib
@@ -12,8 +13,11 @@
 import json
 import os
 import py_compile
+import subprocess
 import sys
 import tabnanny
+import tempfile
+import time
 import timeit
 import types
 
@@ -163,6 +167,63 @@ def using_bytecode_benchmark(seconds, repeat):
 decimal_using_bytecode = _using_bytecode(decimal)
 
 
+def _cold_start(variant=None, dirs=50, packages=4, modules=10):
+    def cold_start_benchmark(seconds, repeat):
+        """Cold start: {:,d} modules in {} sys.path entries{}"""
+        with tempfile.TemporaryDirectory() as root:
+            path = []
+            names = []
+            for i in range(dirs):
+                path.append(os.path.join(root, f'dir{i}'))
+                for j in range(packages):
+                    package = f'pkg{i}_{j}'
+                    os.makedirs(os.path.join(path[-1], package))
+                    for name in ['__init__'] + [f'mod{k}' for k in range(modules)]:
+                        filename = os.path.join(path[-1], package, name + '.py')
+                        with open(filename, 'w', encoding='utf-8') as file:
+                            file.write('x = 1\n')
+                        if name != '__init__':
+                            names.append(f'{package}.{name}')
+            compileall.compile_dir(root, quiet=True)
+            env = dict(os.environ, PYTHONPATH=os.pathsep.join(path))
+            env.pop('PYTHONIMPORTINDEX', None)
+            env.pop('PYTHONCODEPACK', None)
+            if variant == 'path index':
+                # Directories modified in the last seconds are not indexed.
+                mtime = time.time() - 60
+                for dirpath, dirnames, filenames in os.walk(root):
+                    os.utime(dirpath, (mtime, mtime))
+                env['PYTHONIMPORTINDEX'] = os.path.join(root, 'index')
+                compileall.write_path_index(env['PYTHONIMPORTINDEX'], path)
+            elif variant == 'code pack':
+                # A single sys.path entry replaces all the directories.
+                env['PYTHONPATH'] = os.path.join(root, 'app.pycpack')
+                compileall.write_code_pack(env['PYTHONPATH'], path, quiet=2)
+            elif variant == 'startup code pack':
+                # The modules are found before the sys.path entries.
+                env['PYTHONCODEPACK'] = os.path.join(root, 'app.pycpack')
+                compileall.write_code_pack(env['PYTHONCODEPACK'], path,
+                                           quiet=2)
+            # Each import searches the sys.path entries in order, as in a
+            # fresh process.
+            code = ('import time; t0 = time.perf_counter(); '
+                    f'import {", ".join(names)}; '
+                    'print(time.perf_counter() - t0)')
+            for x in range(repeat):
+                out = subprocess.check_output([sys.executable, '-S', '-c', code],
+                                              env=env)
+                yield int(len(names) / float(out))
+
+    cold_start_benchmark.__doc__ = cold_start_benchmark.__doc__.format(
+        dirs * packages * modules, dirs, f', {variant}' if variant else '')
+    return cold_start_benchmark
+
+cold_start = _cold_start()
+cold_start_path_index = _cold_start('path index')
+cold_start_code_pack = _cold_start('code pack')
+cold_start_startup_code_pack = _cold_start('startup code pack')
+
+
 def main(import_, options):
     if options.source_file:
         with open(options.source_file, 'r', encoding='utf-8') as source_file:
@@ -177,6 +238,8 @@ def main(import_, options):
                   tabnanny_wo_bytecode, tabnanny_using_bytecode,
                   decimal_writing_bytecode,
                   decimal_wo_bytecode, decimal_using_bytecode,
+                  cold_start, cold_start_path_index, cold_start_code_pack,
+                  cold_start_startup_code_pack,
                 )
     if options.benchmark:
         for b in benchmarks:
@@ -0,0 +1,122 @@
+# Measure the throughput of the logging module for a few common setups.
+#
+# Usage: python Tools/logbench/logbench.py [options] [benchmark ...]
+#
+# Options:
+#   --records N    Number of records logged per run (default: 100000).
+#   --repeat N     Number of runs; the best one is reported (default: 5).
+#
+# Every benchmark logs to a handler writing to an in-memory text stream, so
+# the results measure the overhead of the logging machinery itself rather
+# than of the disk.  The reported value is in thousands of records per second.
+
+import argparse
+import io
+import logging
+import logging.handlers
+import queue
+import time
+
+FORMAT = '%(asctime)s %(levelname)s %(name)s: %(message)s'
+
+ALL_BENCHMARKS = {}
+
+
+def register_benchmark(func):
+    ALL_BENCHMARKS[func.__name__] = func
+    return func
+
+
+def make_logger(name, handler):
+    logger = logging.getLogger(f'logbench.{name}')
+    logger.handlers[:] = [handler]
+    logger.propagate = False
+    logger.setLevel(logging.INFO)
+    return logger
+
+
+@register_benchmark
+def disabled(n):
+    # Records below the logger level are rejected before a record is built.
+    logger = make_logger('disabled', logging.StreamHandler(io.StringIO()))
+    for i in range(n):
+        logger.debug('request %d handled', i)
+
+
+@register_benchmark
+def filtered(n):
+    # The record is built but rejected by the handler level.
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setLevel(logging.ERROR)
+    logger = make_logger('filtered', handler)
+    for i in range(n):
+        logger.info('request %d handled', i)
+
+
+@register_benchmark
+def message_only(n):
+    handler = logging.StreamHandler(io.StringIO())
+    logger = make_logger('message_only', handler)
+    for i in range(n):
+        logger.info('request %d handled', i)
+
+
+@register_benchmark
+def with_asctime(n):
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter(FORMAT))
+    logger = make_logger('with_asctime', handler)
+    for i in range(n):
+        logger.info('request %d handled', i)
+
+
+def _queue_listener(n, batch_size):
+    handler = logging.StreamHandler(io.StringIO())
+    handler.setFormatter(logging.Formatter(FORMAT))
+    q = queue.SimpleQueue()
+    logger = make_logger(f'queue_{batch_size}',
+                         logging.handlers.QueueHandler(q))
+    with logging.handlers.QueueListener(q, handler, batch_size=batch_size):
+        for i in range(n):
+            logger.info('request %d handled', i)
+
+
+@register_benchmark
+def queue_listener(n):
+    _queue_listener(n, 1)
+
+
+@register_benchmark
+def queue_listener_batched(n):
+    _queue_listener(n, 64)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark logging")
+    parser.add_argument("--records", type=int, default=100_000,
+                        help="number of records logged per run")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of runs")
+    parser.add_argument("benchmarks", nargs="*",
+                        help="benchmarks to run (default: all)")
+    opts = parser.parse_args()
+
+    names = opts.benchmarks or list(ALL_BENCHMARKS)
+    for name in names:
+        if name not in ALL_BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+
+    for name in names:
+        func = ALL_BENCHMARKS[name]
+        best = min(_timeit(func, opts.records) for _ in range(opts.repeat))
+        print(f"{name:<25} {opts.records / best / 1000:10.1f} krecords/s")
+
+
+def _timeit(func, n):
+    t0 = time.perf_counter()
+    func(n)
+    return time.perf_counter() - t0
+
+
+if __name__ == "__main__":
+    main()
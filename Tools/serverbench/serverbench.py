@@ -0,0 +1,148 @@
+# Measure the throughput of the http.server server classes.
+#
+# Usage: python Tools/serverbench/serverbench.py [options] [server ...]
+#
+# Options:
+#   --clients N    Number of client processes, each with one keep-alive
+#                  connection (default: 8).
+#   --requests N   Number of requests per client (default: 2000).
+#   --workers N    Number of worker processes of the prefork servers
+#                  (default: os.process_cpu_count()).
+#   --repeat N     Number of runs; the best one is reported (default: 3).
+#
+# Each server runs in a process of its own and answers GET requests with a
+# short body.  The reported value is in requests per second.  A keep-alive
+# connection holds a thread of the pool for its whole lifetime: --clients
+# must not be larger than the pool size.
+
+import argparse
+import concurrent.futures
+import http.client
+import http.server
+import os
+import signal
+import socket
+import socketserver
+import threading
+import time
+
+BODY = b'x' * 100
+
+
+class Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # The headers and the body are sent separately.
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PreforkHTTPServer(socketserver.PreforkMixIn, socketserver.ThreadPoolMixIn,
+                        http.server.HTTPServer):
+    daemon_threads = True
+
+
+class ReusePortHTTPServer(PreforkHTTPServer):
+    allow_reuse_port = True
+
+
+ALL_SERVERS = {
+    'threading': http.server.ThreadingHTTPServer,
+    'thread_pool': http.server.ThreadPoolHTTPServer,
+    'prefork': PreforkHTTPServer,
+    'reuse_port': ReusePortHTTPServer,
+}
+
+
+def start_server(cls, workers):
+    cls = type(cls.__name__, (cls,), {'workers': workers})
+    server = cls(('127.0.0.1', 0), Handler)
+    pid = os.fork()
+    if pid:
+        address = server.server_address
+        server.socket.close()
+        return pid, address
+    try:
+        # shutdown() must be called from another thread than serve_forever()
+        stop = threading.Event()
+        signal.signal(signal.SIGTERM, lambda *args: stop.set())
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        stop.wait()
+        server.shutdown()
+        thread.join()
+        server.server_close()
+    finally:
+        os._exit(0)
+
+
+def wait_ready(address):
+    # The workers of the reuse_port server may not listen yet.
+    while True:
+        try:
+            socket.create_connection(address).close()
+            return
+        except ConnectionRefusedError:
+            time.sleep(0.01)
+
+
+def client(address, n):
+    conn = http.client.HTTPConnection(*address)
+    for i in range(n):
+        conn.request('GET', '/')
+        response = conn.getresponse()
+        response.read()
+    conn.close()
+
+
+def run(address, clients, requests):
+    with concurrent.futures.ProcessPoolExecutor(clients) as executor:
+        # Start the client processes before measuring.
+        list(executor.map(client, [address] * clients, [1] * clients))
+        t0 = time.perf_counter()
+        list(executor.map(client, [address] * clients, [requests] * clients))
+        return time.perf_counter() - t0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark http.server")
+    parser.add_argument("--clients", type=int, default=8,
+                        help="number of client processes")
+    parser.add_argument("--requests", type=int, default=2000,
+                        help="number of requests per client")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="number of worker processes")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="number of runs")
+    parser.add_argument("servers", nargs="*",
+                        help="servers to run (default: all)")
+    opts = parser.parse_args()
+
+    names = opts.servers or list(ALL_SERVERS)
+    for name in names:
+        if name not in ALL_SERVERS:
+            parser.error(f"unknown server: {name}")
+
+    for name in names:
+        pid, address = start_server(ALL_SERVERS[name], opts.workers)
+        try:
+            wait_ready(address)
+            best = min(run(address, opts.clients, opts.requests)
+                       for _ in range(opts.repeat))
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            os.waitpid(pid, 0)
+        n = opts.clients * opts.requests
+        print(f"{name:<15} {n / best:10.0f} requests/s")
+
+
+if __name__ == "__main__":
+    main()
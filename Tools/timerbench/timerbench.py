@@ -0,0 +1,131 @@
+# Measure the cost of asyncio timers in timeout-heavy workloads.
+#
+# Usage: python Tools/timerbench/timerbench.py [options] [benchmark ...]
+#
+# Options:
+#   --timers N     Number of timers per run (default: 100000).
+#   --pending N    Number of long-lived timers kept scheduled during the
+#                  run, as in a server with many open connections
+#                  (default: 10000).
+#   --repeat N     Number of runs; the best one is reported (default: 5).
+#
+# Most timers in servers are timeouts which are cancelled long before they
+# expire, so most benchmarks schedule a timer and cancel it.  The reported
+# value is in thousands of timers per second.
+
+import argparse
+import asyncio
+import time
+
+ALL_BENCHMARKS = {}
+
+
+def register_benchmark(func):
+    ALL_BENCHMARKS[func.__name__] = func
+    return func
+
+
+def noop():
+    pass
+
+
+@register_benchmark
+async def call_later_cancel(n):
+    loop = asyncio.get_running_loop()
+    for i in range(n):
+        loop.call_later(30, noop).cancel()
+
+
+@register_benchmark
+async def call_later_cancel_batch(n):
+    # Cancel timers in a different order than they were scheduled.
+    loop = asyncio.get_running_loop()
+    for i in range(0, n, 1000):
+        handles = [loop.call_later(30 + j % 7, noop) for j in range(1000)]
+        for handle in handles[::-1]:
+            handle.cancel()
+        await asyncio.sleep(0)
+
+
+@register_benchmark
+async def call_later_expire(n):
+    loop = asyncio.get_running_loop()
+    for i in range(0, n, 1000):
+        for j in range(1000):
+            loop.call_later(0, noop)
+        await asyncio.sleep(0)
+
+
+@register_benchmark
+async def timeout_cancelled(n):
+    for i in range(n):
+        async with asyncio.timeout(30):
+            pass
+
+
+@register_benchmark
+async def timeout_cancelled_sleep(n):
+    # The timer stays scheduled while the event loop runs.
+    for i in range(n):
+        async with asyncio.timeout(30):
+            await asyncio.sleep(0)
+
+
+@register_benchmark
+async def timeout_expired(n):
+    for i in range(n // 10):
+        try:
+            async with asyncio.timeout(0):
+                await asyncio.sleep(1)
+        except TimeoutError:
+            pass
+
+
+@register_benchmark
+async def wait_for(n):
+    async def coro():
+        pass
+    for i in range(n // 10):
+        await asyncio.wait_for(coro(), 30)
+
+
+async def run(func, n, pending):
+    loop = asyncio.get_running_loop()
+    handles = [loop.call_later(60 + i % 60, noop) for i in range(pending)]
+    t0 = time.perf_counter()
+    await func(n)
+    dt = time.perf_counter() - t0
+    for handle in handles:
+        handle.cancel()
+    return dt
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark asyncio timers")
+    parser.add_argument("--timers", type=int, default=100_000,
+                        help="number of timers per run")
+    parser.add_argument("--pending", type=int, default=10_000,
+                        help="number of timers kept scheduled")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of runs")
+    parser.add_argument("benchmarks", nargs="*",
+                        help="benchmarks to run (default: all)")
+    opts = parser.parse_args()
+
+    names = opts.benchmarks or list(ALL_BENCHMARKS)
+    for name in names:
+        if name not in ALL_BENCHMARKS:
+            parser.error(f"unknown benchmark: {name}")
+
+    for name in names:
+        func = ALL_BENCHMARKS[name]
+        n = opts.timers
+        if name in ('timeout_expired', 'wait_for'):
+            n //= 10
+        best = min(asyncio.run(run(func, opts.timers, opts.pending))
+                   for _ in range(opts.repeat))
+        print(f"{name:<25} {n / best / 1000:10.1f} ktimers/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Measure the throughput of compression.zstd for small messages.
+#
+# Usage: python Tools/zstdbench/zstdbench.py [options]
+#
+# Options:
+#   --messages N   Number of messages compressed per run (default: 2000).
+#   --repeat N     Number of runs; the best one is reported (default: 5).
+#   --dict         Compress with a dictionary trained on similar messages.
+#
+# For every message size from 100 bytes to 64 KiB, the messages are
+# compressed and decompressed one by one with compress() and decompress(),
+# then in bulk with compress_many() and decompress_many().  The reported
+# value is in megabytes of uncompressed data per second.
+
+import argparse
+import random
+import time
+from compression.zstd import (compress, compress_many, decompress,
+                              decompress_many, train_dict)
+
+SIZES = [100, 1000, 4 * 1024, 16 * 1024, 64 * 1024]
+
+WORDS = [b'id', b'name', b'value', b'status', b'timestamp', b'user',
+         b'request', b'response', b'error', b'ok', b'items', b'count']
+
+
+def make_message(rng, size):
+    parts = []
+    length = 0
+    while length < size:
+        part = b'"%s": %d, ' % (rng.choice(WORDS), rng.randrange(10_000))
+        parts.append(part)
+        length += len(part)
+    return b''.join(parts)[:size]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark compression.zstd")
+    parser.add_argument("--messages", type=int, default=2000,
+                        help="number of messages compressed per run")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="number of runs")
+    parser.add_argument("--dict", action="store_true",
+                        help="use a trained dictionary")
+    opts = parser.parse_args()
+
+    rng = random.Random(0)
+    print(f"{'size':>8} {'compress':>10} {'many':>10} "
+          f"{'decompress':>10} {'many':>10}   (MB/s)")
+    for size in SIZES:
+        messages = [make_message(rng, size) for _ in range(opts.messages)]
+        zstd_dict = None
+        if opts.dict:
+            zstd_dict = train_dict(messages[:1000], 16 * 1024)
+        frames = compress_many(messages, zstd_dict=zstd_dict)
+        total = size * opts.messages / 1e6
+
+        results = [
+            _timeit(lambda: [compress(m, zstd_dict=zstd_dict)
+                             for m in messages], opts.repeat),
+            _timeit(lambda: compress_many(messages, zstd_dict=zstd_dict),
+                    opts.repeat),
+            _timeit(lambda: [decompress(f, zstd_dict) for f in frames],
+                    opts.repeat),
+            _timeit(lambda: decompress_many(frames, zstd_dict),
+                    opts.repeat),
+        ]
+        print(f"{size:>8}", *(f"{total / best:10.1f}" for best in results))
+
+
+def _timeit(func, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+if __name__ == "__main__":
+    main()